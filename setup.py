@@ -22,6 +22,10 @@ setup(
         "matplotlib",
         "scikit-learn",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "zstd": ["zstandard"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
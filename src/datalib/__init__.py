@@ -1,10 +1,22 @@
-from .preprocessing import load_csv, save_csv, filter_data, normalize_data, handle_missing_values
+from .preprocessing import load_csv, save_csv, filter_data, iter_csv, load_many, normalize_data, handle_missing_values
+from .preprocessing import optimize_dtypes, MinMaxScaler, StandardScaler, RobustScaler
+from .preprocessing import normalize_csv, impute_csv, Pipeline
+from .preprocessing import load_parquet, save_parquet, ParseCache
+from .preprocessing import FileSummary, build_summary, load_summary
+from .preprocessing import HashIndex, SortedIndex, FrameIndex
+from .preprocessing import Dataset, scan_csv
+from .preprocessing import async_load_csv, async_save_csv, async_iter_csv
 from .statslib import calculate_mean, calculate_median, calculate_mode, calculate_std, calculate_correlation
-from .statslib import t_test, chi_square_test
+from .statslib import describe_columns, correlation_matrix_values, grouped_stats, grouped_correlation
+from .statslib import t_test, chi_square_test, t_test_from_summary, batch_t_test, fdr_correction
+from .statslib import batch_chi_square_test, permutation_test, bootstrap_ci
+from .statslib import StreamingStats, stream_stats, QuantileSketch, TopKSketch
+from .statslib import StatsCache, enable_stats_cache, disable_stats_cache, get_stats_cache
+from .statslib import RollingStats, RollingCorrelation, rolling_stats, rolling_correlation
 from .visualization import correlation_matrix, bar_chart, histogram, scatter_plot
 from .analysis import linear_regression, polynomial_regression, k_means_clustering, pca_analysis
 
-from .statslib import basic_stats, statistical_tests
+from .statslib import basic_stats, statistical_tests, streaming, sketches, correlation, stats_cache, rolling, resampling
 from .visualization import charts, advanced_viz
-from .preprocessing import csv_handler, transformations
+from .preprocessing import csv_handler, parquet_handler, transformations, scalers, pipeline
 from .analysis import regression,clustering
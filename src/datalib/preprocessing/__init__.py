@@ -1,3 +1,12 @@
 # Importing all relevant functions to make them available at the package level
-from .csv_handler import load_csv, save_csv, filter_data
-from .transformations import normalize_data, handle_missing_values
+from .csv_handler import load_csv, save_csv, filter_data, iter_csv, load_many
+from .parquet_handler import load_parquet, save_parquet
+from .cache import ParseCache
+from .summary import FileSummary, build_summary, load_summary
+from .indexing import HashIndex, SortedIndex, FrameIndex
+from .transformations import normalize_data, handle_missing_values, optimize_dtypes
+from .scalers import MinMaxScaler, StandardScaler, RobustScaler
+from .out_of_core import normalize_csv, impute_csv
+from .pipeline import Pipeline
+from .dataset import Dataset, scan_csv
+from .async_io import async_load_csv, async_save_csv, async_iter_csv, set_max_concurrency
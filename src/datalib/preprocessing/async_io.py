@@ -0,0 +1,132 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from . import csv_handler
+
+# Nombre maximal de lectures/écritures exécutées simultanément dans le processus.
+_max_concurrency = 4
+_executor = None
+_lock = threading.Lock()
+# Un sémaphore par boucle d'événements : les tâches en attente ne saturent pas l'exécuteur.
+_semaphores = weakref.WeakKeyDictionary()
+_END = object()
+
+
+def set_max_concurrency(limit):
+    """
+    Fixe le nombre maximal d'opérations de fichier exécutées simultanément.
+
+    La limite est partagée par toutes les fonctions asynchrones de ce module, dans tout le
+    processus. Les opérations en cours se terminent normalement.
+
+    Args:
+        limit (int): Le nombre maximal d'opérations simultanées.
+
+    Raises:
+        ValueError: Si `limit` n'est pas un entier positif.
+    """
+    global _max_concurrency, _executor
+    if limit <= 0:
+        raise ValueError("La limite de concurrence doit être un entier positif.")
+    with _lock:
+        _max_concurrency = limit
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+        _semaphores.clear()
+
+
+def get_max_concurrency():
+    """Retourne le nombre maximal d'opérations de fichier simultanées."""
+    return _max_concurrency
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_concurrency, thread_name_prefix="datalib-io")
+        return _executor
+
+
+def _get_semaphore():
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _semaphores[loop] = asyncio.Semaphore(_max_concurrency)
+        return semaphore
+
+
+async def _run(function, *args, **kwargs):
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(function, *args, **kwargs))
+
+
+async def async_load_csv(file_path, **kwargs):
+    """
+    Version asynchrone de `load_csv` : le parsing s'exécute hors de la boucle d'événements.
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        **kwargs: Les autres arguments de `load_csv` (encoding, cache, optimize_dtypes...).
+
+    Returns:
+        pd.DataFrame: Le DataFrame contenant les données du fichier CSV.
+    """
+    if kwargs.get("chunksize") is not None or kwargs.get("max_memory") is not None:
+        raise ValueError("Utilisez 'async_iter_csv' pour une lecture asynchrone par blocs.")
+    return await _run(csv_handler.load_csv, file_path, **kwargs)
+
+
+async def async_save_csv(dataframe, file_path, **kwargs):
+    """
+    Version asynchrone de `save_csv` : l'écriture s'exécute hors de la boucle d'événements.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame à enregistrer.
+        file_path (str): Le chemin où enregistrer le fichier CSV.
+        **kwargs: Les autres arguments de `save_csv` (encoding, compression, n_jobs...).
+
+    Returns:
+        None, ou la liste des fichiers écrits si `parts` est fourni.
+    """
+    return await _run(csv_handler.save_csv, dataframe, file_path, **kwargs)
+
+
+async def async_iter_csv(file_path, chunksize=None, max_memory=None, **kwargs):
+    """
+    Itérateur asynchrone sur les blocs d'un fichier CSV (voir `iter_csv`).
+
+    Chaque bloc est parsé dans l'exécuteur partagé. Un seul bloc est préparé à l'avance :
+    si le consommateur est plus lent que la lecture, la lecture attend (contre-pression)
+    et la mémoire reste bornée à deux blocs.
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        chunksize (int, optional): Le nombre de lignes par bloc.
+        max_memory (int, optional): Le budget mémoire en octets pour un bloc.
+        **kwargs: Les autres arguments de `iter_csv` (encoding, usecols).
+
+    Yields:
+        pd.DataFrame: Les blocs successifs du fichier.
+    """
+    chunks = await _run(csv_handler.iter_csv, file_path, chunksize=chunksize, max_memory=max_memory, **kwargs)
+    pending = asyncio.ensure_future(_run(next, chunks, _END))
+    try:
+        while True:
+            chunk = await pending
+            if chunk is _END:
+                break
+            pending = asyncio.ensure_future(_run(next, chunks, _END))
+            yield chunk
+    finally:
+        # Un bloc en cours de lecture ne peut pas être interrompu : on attend sa fin.
+        await asyncio.wait([pending])
+        if not pending.cancelled():
+            pending.exception()
+        chunks.close()
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+_META_FILE = "meta.json"
+_OBJECTS_FILE = "objects.pkl"
+
+
+class ParseCache:
+    """
+    Cache disque des DataFrames issus de `load_csv`.
+
+    Chaque entrée est identifiée par le chemin absolu du fichier source, sa taille, sa date
+    de modification et l'encodage (et, sur option, une empreinte SHA-1 du contenu). Les
+    colonnes numériques sont stockées en fichiers `.npy` relus par projection mémoire
+    (`mmap_mode='c'`) : un succès de cache ne reparse pas le CSV et ne copie pas les données.
+    Les autres colonnes (texte, objets) sont sérialisées avec pickle.
+
+    Lorsque la taille totale dépasse `max_bytes`, les entrées les moins récemment utilisées
+    sont supprimées.
+
+    Args:
+        cache_dir (str): Le répertoire du cache (créé si nécessaire).
+        max_bytes (int, optional): La taille maximale du cache en octets (par défaut 1 Gio).
+        content_hash (bool, optional): Si True, la clé inclut une empreinte du contenu du fichier.
+    """
+
+    def __init__(self, cache_dir, max_bytes=1 << 30, content_hash=False):
+        if max_bytes <= 0:
+            raise ValueError("La taille maximale du cache doit être un entier positif.")
+        self.cache_dir = os.fspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, file_path, encoding="utf-8"):
+        """Calcule la clé de cache d'un fichier à partir de son identité."""
+        file_path = os.path.abspath(os.fspath(file_path))
+        stat = os.stat(file_path)
+        parts = [file_path, str(stat.st_size), str(stat.st_mtime_ns), encoding]
+        if self.content_hash:
+            digest = hashlib.sha1()
+            with open(file_path, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+            parts.append(digest.hexdigest())
+        return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, file_path, encoding="utf-8"):
+        """
+        Retourne le DataFrame en cache pour ce fichier, ou None s'il est absent ou périmé.
+        """
+        entry = os.path.join(self.cache_dir, self.key(file_path, encoding))
+        meta_path = os.path.join(entry, _META_FILE)
+        try:
+            with open(meta_path, encoding="utf-8") as handle:
+                meta = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        objects = None
+        if meta["has_objects"]:
+            objects = pd.read_pickle(os.path.join(entry, _OBJECTS_FILE))
+        data = {}
+        for position, column in enumerate(meta["columns"]):
+            if meta["arrays"][position]:
+                mapped = np.load(os.path.join(entry, meta["arrays"][position]), mmap_mode="c")
+                data[column] = np.asarray(mapped)
+            else:
+                data[column] = objects[column]
+        # Marque l'entrée comme récemment utilisée pour l'éviction LRU.
+        os.utime(meta_path)
+        return pd.DataFrame(data, columns=meta["columns"], copy=False)
+
+    def put(self, file_path, dataframe, encoding="utf-8"):
+        """Enregistre le DataFrame parsé depuis `file_path` puis applique l'éviction."""
+        key = self.key(file_path, encoding)
+        staging = tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            arrays, object_columns = [], []
+            for position, column in enumerate(dataframe.columns):
+                series = dataframe.iloc[:, position]
+                if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufc":
+                    name = f"col_{position}.npy"
+                    np.save(os.path.join(staging, name), series.to_numpy())
+                    arrays.append(name)
+                else:
+                    object_columns.append(position)
+                    arrays.append(None)
+            if object_columns:
+                dataframe.iloc[:, object_columns].to_pickle(os.path.join(staging, _OBJECTS_FILE))
+            meta = {
+                "source": os.path.abspath(os.fspath(file_path)),
+                "columns": list(dataframe.columns),
+                "arrays": arrays,
+                "has_objects": bool(object_columns),
+            }
+            with open(os.path.join(staging, _META_FILE), "w", encoding="utf-8") as handle:
+                json.dump(meta, handle)
+
+            entry = os.path.join(self.cache_dir, key)
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self._evict()
+
+    def clear(self):
+        """Supprime toutes les entrées du cache."""
+        for name in os.listdir(self.cache_dir):
+            shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+
+    def size(self):
+        """Retourne la taille totale du cache en octets."""
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            meta_path = os.path.join(entry, _META_FILE)
+            if name.startswith(".") or not os.path.exists(meta_path):
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+            entries.append((os.path.getmtime(meta_path), entry, size))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -1,21 +1,72 @@
+import bz2
+import contextlib
+import glob
+import gzip
+import lzma
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
-def load_csv(file_path, encoding='utf-8'):
+from . import transformations
+from .cache import ParseCache
+from .indexing import _is_list_like
+from .summary import FileSummary, build_summary
+
+# Nombre de lignes lues pour estimer l'empreinte mémoire d'une ligne.
+_SAMPLE_ROWS = 1000
+
+# Extensions reconnues pour la détection automatique de la compression.
+_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd", ".bz2": "bz2", ".xz": "xz", ".zip": "zip"}
+
+
+def load_csv(file_path, encoding='utf-8', chunksize=None, max_memory=None, cache=None,
+             optimize_dtypes=False):
     """
     Charge un fichier CSV et retourne un DataFrame.
 
     Args:
         file_path (str): Le chemin vers le fichier CSV.
         encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+        chunksize (int, optional): Si fourni, le fichier est lu par blocs de `chunksize` lignes
+            et un itérateur de DataFrames est retourné (voir `iter_csv`).
+        max_memory (int, optional): Budget mémoire en octets par bloc. Active aussi la lecture par blocs.
+        cache (ParseCache or str, optional): Un cache de parsing, ou le répertoire d'un cache.
+            Si le fichier n'a pas changé depuis sa mise en cache, il est relu depuis le cache
+            au lieu d'être reparsé. Ignoré pour la lecture par blocs.
+        optimize_dtypes (bool, optional): Si True, les types sont réduits avec
+            `transformations.optimize_dtypes` et le nombre d'octets économisés est disponible
+            dans `dataframe.attrs['bytes_saved']`. Ignoré pour la lecture par blocs.
 
     Returns:
-        pd.DataFrame: Le DataFrame contenant les données du fichier CSV.
+        pd.DataFrame: Le DataFrame contenant les données du fichier CSV, ou un itérateur de
+        DataFrames si `chunksize` ou `max_memory` est fourni.
 
     Raises:
         FileNotFoundError: Si le fichier n'existe pas.
         pd.errors.EmptyDataError: Si le fichier est vide.
         pd.errors.ParserError: Si le fichier contient des erreurs de format.
     """
+    if chunksize is not None or max_memory is not None:
+        return iter_csv(file_path, encoding=encoding, chunksize=chunksize, max_memory=max_memory)
+    if optimize_dtypes:
+        dataframe = load_csv(file_path, encoding=encoding, cache=cache)
+        dataframe, saved = transformations.optimize_dtypes(dataframe)
+        dataframe.attrs["bytes_saved"] = saved
+        return dataframe
+    if cache is not None:
+        if not isinstance(cache, ParseCache):
+            cache = ParseCache(cache)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        dataframe = cache.get(file_path, encoding)
+        if dataframe is None:
+            dataframe = load_csv(file_path, encoding=encoding)
+            cache.put(file_path, dataframe, encoding)
+        return dataframe
     try:
         return pd.read_csv(file_path, encoding=encoding)
     except FileNotFoundError:
@@ -26,39 +77,332 @@ def load_csv(file_path, encoding='utf-8'):
         raise ValueError(f"Le fichier {file_path} contient des erreurs de format.")
 
 
-def save_csv(dataframe, file_path, encoding='utf-8'):
+def iter_csv(file_path, encoding='utf-8', chunksize=None, max_memory=None, usecols=None):
+    """
+    Lit un fichier CSV bloc par bloc, sans jamais le charger entièrement en mémoire.
+
+    Lorsque `max_memory` est fourni, la taille des blocs est déduite de l'empreinte mémoire
+    moyenne d'une ligne, mesurée sur un échantillon du début du fichier. Si `chunksize` et
+    `max_memory` sont tous deux fournis, la plus petite des deux tailles est retenue.
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+        chunksize (int, optional): Le nombre de lignes par bloc.
+        max_memory (int, optional): Le budget mémoire en octets pour un bloc.
+        usecols (list, optional): Les colonnes à lire (par défaut toutes).
+
+    Returns:
+        Iterator[pd.DataFrame]: Un itérateur sur les blocs du fichier.
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas.
+        ValueError: Si le fichier est vide, contient des erreurs de format ou si aucune taille de bloc valide n'est fournie.
+    """
+    if chunksize is None and max_memory is None:
+        raise ValueError("Il faut fournir 'chunksize' et/ou 'max_memory' pour une lecture par blocs.")
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError("La taille des blocs doit être un entier positif.")
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError("Le budget mémoire doit être un entier positif.")
+
+    try:
+        if max_memory is not None:
+            sample = pd.read_csv(file_path, encoding=encoding, nrows=_SAMPLE_ROWS, usecols=usecols)
+            row_bytes = sample.memory_usage(index=False, deep=True).sum() / max(len(sample), 1)
+            budget_rows = max(1, int(max_memory // max(row_bytes, 1)))
+            chunksize = budget_rows if chunksize is None else min(chunksize, budget_rows)
+        reader = pd.read_csv(file_path, encoding=encoding, chunksize=chunksize, usecols=usecols)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+    except pd.errors.EmptyDataError:
+        raise ValueError(f"Le fichier {file_path} est vide.")
+    except pd.errors.ParserError:
+        raise ValueError(f"Le fichier {file_path} contient des erreurs de format.")
+    return _iter_chunks(reader, file_path)
+
+
+def _iter_chunks(reader, file_path):
+    with reader:
+        try:
+            for chunk in reader:
+                yield chunk
+        except pd.errors.ParserError:
+            raise ValueError(f"Le fichier {file_path} contient des erreurs de format.")
+
+
+def load_many(pattern, encoding='utf-8', n_jobs=None, source_column=None, partitions=False):
+    """
+    Charge plusieurs fichiers CSV (motif glob ou répertoire) et les concatène en un seul DataFrame.
+
+    Les fichiers sont triés par chemin avant d'être chargés : l'ordre des lignes du résultat
+    est donc déterministe, que le chargement soit séquentiel ou parallèle.
+
+    Args:
+        pattern (str): Un motif glob (ex. : 'exports/*.csv', '**' est supporté) ou un répertoire,
+            auquel cas tous les fichiers '*.csv' qu'il contient sont chargés récursivement.
+        encoding (str, optional): L'encodage des fichiers CSV (par défaut 'utf-8').
+        n_jobs (int, optional): Le nombre de processus à utiliser. None ou 1 pour un chargement
+            séquentiel, -1 pour utiliser tous les cœurs.
+        source_column (str, optional): Si fourni, ajoute une colonne 'category' de ce nom
+            contenant le chemin du fichier d'origine de chaque ligne.
+        partitions (bool, optional): Si True, les répertoires du chemin de la forme 'clé=valeur'
+            (partitionnement de type Hive) sont ajoutés comme colonnes 'category', qu'ils
+            figurent dans le motif ou qu'ils soient trouvés par lui.
+
+    Returns:
+        pd.DataFrame: Le DataFrame contenant les lignes de tous les fichiers.
+
+    Raises:
+        FileNotFoundError: Si aucun fichier ne correspond au motif.
+        ValueError: Si `n_jobs` est invalide ou si un fichier est vide ou mal formé.
+    """
+    pattern = os.fspath(pattern)
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "**", "*.csv")
+    files = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    if not files:
+        raise FileNotFoundError(f"Aucun fichier ne correspond au motif {pattern}.")
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs is not None and n_jobs <= 0:
+        raise ValueError("Le nombre de processus doit être un entier positif ou -1.")
+
+    if n_jobs is None or n_jobs == 1 or len(files) == 1:
+        frames = [load_csv(path, encoding=encoding) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(files))) as executor:
+            frames = list(executor.map(load_csv, files, [encoding] * len(files)))
+
+    dataframe = pd.concat(frames, ignore_index=True)
+    # Les colonnes constantes par fichier sont construites à partir des tailles des blocs,
+    # sans copier chaque fragment.
+    sizes = np.array([len(frame) for frame in frames])
+    codes = np.repeat(np.arange(len(files)), sizes)
+    if partitions:
+        for key, values in _parse_partitions(files).items():
+            labels = pd.Index([value for value in values if value is not None]).unique()
+            dataframe[key] = pd.Categorical.from_codes(labels.get_indexer(values)[codes], categories=labels)
+    if source_column is not None:
+        dataframe[source_column] = pd.Categorical.from_codes(codes, categories=files)
+    return dataframe
+
+
+def _parse_partitions(files):
+    # Tous les répertoires du chemin sont examinés, y compris ceux écrits en toutes lettres
+    # dans le motif (ex. : 'data/year=2024/*.csv').
+    partitions = {}
+    for position, path in enumerate(files):
+        for segment in os.path.dirname(path).split(os.sep):
+            if "=" in segment:
+                key, value = segment.split("=", 1)
+                partitions.setdefault(key, [None] * len(files))[position] = value
+    return partitions
+
+
+def save_csv(dataframe, file_path, encoding='utf-8', compression='infer', n_jobs=None,
+             chunksize=100_000, parts=None, summary=False):
     """
     Enregistre un DataFrame dans un fichier CSV.
 
+    Un itérable de DataFrames (par exemple le résultat de `iter_csv` ou de `filter_data`
+    sur des blocs) est écrit bloc par bloc dans le même fichier : l'en-tête n'est écrit
+    qu'une fois et la mémoire utilisée reste bornée par la taille d'un bloc.
+
+    Avec `n_jobs` ou `parts`, le DataFrame est découpé en blocs de `chunksize` lignes qui sont
+    mis en forme et compressés en parallèle, puis écrits dans l'ordre. Chaque bloc compressé
+    forme un membre gzip (ou un flux zstd, bz2 ou xz) indépendant : le fichier obtenu reste
+    lisible par `load_csv` et par les outils standards. Une archive zip contient un seul
+    fichier CSV, compressé au fil de l'écriture (seule la mise en forme est parallèle).
+
     Args:
-        dataframe (pd.DataFrame): Le DataFrame à enregistrer.
+        dataframe (pd.DataFrame or Iterable[pd.DataFrame]): Le DataFrame ou les blocs à enregistrer.
         file_path (str): Le chemin où enregistrer le fichier CSV.
         encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+        compression (str, optional): 'gzip', 'zstd', 'bz2', 'xz', 'zip', None, ou 'infer' pour la
+            déduire de l'extension du fichier ('.gz', '.zst', '.bz2', '.xz', '.zip') (par défaut 'infer').
+        n_jobs (int, optional): Le nombre de threads de mise en forme et de compression.
+            None ou 1 pour une écriture séquentielle, -1 pour utiliser tous les cœurs.
+        chunksize (int, optional): Le nombre de lignes par bloc pour l'écriture parallèle (par défaut 100 000).
+        parts (int, optional): Si fourni, les lignes sont réparties en `parts` fichiers
+            consécutifs nommés '<nom>-00000.<extension>', '<nom>-00001.<extension>', etc.
+        summary (bool, optional): Si True, écrit aussi le résumé par blocs de `chunksize` lignes
+            de chaque fichier (voir `build_summary`), pour un fichier non compressé (par défaut False).
 
     Returns:
-        None
+        None, ou la liste des chemins des fichiers écrits si `parts` est fourni.
+
+    Raises:
+        ValueError: Si un paramètre est invalide ou si l'enregistrement échoue.
+        ImportError: Si la compression 'zstd' est demandée sans le module 'zstandard'.
     """
+    if compression == 'infer':
+        compression = _COMPRESSION_EXTENSIONS.get(os.path.splitext(os.fspath(file_path))[1])
+    if compression is not None and compression not in _COMPRESSION_EXTENSIONS.values():
+        raise ValueError("Compression non supportée : choisissez parmi 'gzip', 'zstd', 'bz2', 'xz', 'zip' ou None.")
+    if compression == 'zstd':
+        _import_zstandard()
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs is not None and n_jobs <= 0:
+        raise ValueError("Le nombre de threads doit être un entier positif ou -1.")
+    if chunksize <= 0:
+        raise ValueError("La taille des blocs doit être un entier positif.")
+    if summary and compression is not None:
+        raise ValueError("Les résumés par bloc nécessitent un fichier CSV non compressé.")
+    if parts is not None:
+        if parts <= 0:
+            raise ValueError("Le nombre de fichiers doit être un entier positif.")
+        if not isinstance(dataframe, pd.DataFrame):
+            raise ValueError("L'écriture en plusieurs fichiers nécessite un DataFrame.")
+
     try:
-        dataframe.to_csv(file_path, index=False, encoding=encoding)
+        if parts is not None:
+            bounds = np.linspace(0, len(dataframe), parts + 1).astype(int)
+            paths = [_part_path(file_path, i) for i in range(parts)]
+            for path, start, stop in zip(paths, bounds[:-1], bounds[1:]):
+                _write_chunks(_split_rows(dataframe.iloc[start:stop], chunksize), path,
+                              encoding, compression, n_jobs)
+                if summary:
+                    build_summary(path, chunksize=chunksize, encoding=encoding)
+            return paths
+        if isinstance(dataframe, pd.DataFrame) and (n_jobs is None or n_jobs == 1):
+            dataframe.to_csv(file_path, index=False, encoding=encoding, compression=compression)
+        else:
+            if isinstance(dataframe, pd.DataFrame):
+                dataframe = _split_rows(dataframe, chunksize)
+            _write_chunks(dataframe, file_path, encoding, compression, n_jobs)
+        if summary:
+            build_summary(file_path, chunksize=chunksize, encoding=encoding)
+    except KeyError:
+        raise
     except Exception as e:
         raise ValueError(f"Erreur lors de l'enregistrement du fichier {file_path}: {e}")
 
 
-def filter_data(dataframe, column, value):
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("La compression 'zstd' nécessite 'zstandard' (pip install zstandard).")
+    return zstandard
+
+
+def _part_path(file_path, number):
+    directory, name = os.path.split(os.fspath(file_path))
+    stem, dot, extension = name.partition('.')
+    return os.path.join(directory, f"{stem}-{number:05d}{dot}{extension}")
+
+
+def _split_rows(dataframe, chunksize):
+    if len(dataframe) == 0:
+        yield dataframe
+    for start in range(0, len(dataframe), chunksize):
+        yield dataframe.iloc[start:start + chunksize]
+
+
+def _encode_chunk(chunk, header, encoding, compression):
+    data = chunk.to_csv(index=False, header=header).encode(encoding)
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    if compression == 'zstd':
+        return _import_zstandard().ZstdCompressor().compress(data)
+    if compression == 'bz2':
+        return bz2.compress(data)
+    if compression == 'xz':
+        return lzma.compress(data)
+    return data
+
+
+@contextlib.contextmanager
+def _open_output(file_path, compression):
+    # Archive zip : un seul membre, nommé comme le fichier sans '.zip' (comme pandas).
+    if compression == 'zip':
+        name = os.path.basename(os.fspath(file_path))
+        member = name[:-len('.zip')] if name.endswith('.zip') else name
+        with zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(member, 'w', force_zip64=True) as handle:
+                yield handle
+    else:
+        with open(file_path, 'wb') as handle:
+            yield handle
+
+
+def _write_chunks(chunks, file_path, encoding, compression, n_jobs):
+    """Met en forme les blocs (en parallèle si `n_jobs` > 1) et les écrit dans l'ordre."""
+    output = _open_output(file_path, compression)
+    if compression == 'zip':
+        # La compression est faite par l'archive : les blocs sont écrits en clair.
+        compression = None
+    with output as handle:
+        if n_jobs is None or n_jobs == 1:
+            for position, chunk in enumerate(chunks):
+                handle.write(_encode_chunk(chunk, position == 0, encoding, compression))
+            return
+        # Fenêtre glissante : au plus 2 * n_jobs blocs mis en forme sont gardés en mémoire.
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            pending = deque()
+            for position, chunk in enumerate(chunks):
+                pending.append(executor.submit(_encode_chunk, chunk, position == 0, encoding, compression))
+                if len(pending) >= 2 * n_jobs:
+                    handle.write(pending.popleft().result())
+            while pending:
+                handle.write(pending.popleft().result())
+
+
+def filter_data(dataframe, column, value, index=None):
     """
     Filtre les lignes du DataFrame selon une valeur dans une colonne donnée.
 
+    Si `dataframe` est un itérable de blocs, le filtre est appliqué paresseusement à
+    chaque bloc et un itérateur de DataFrames filtrés est retourné. Si c'est le résumé d'un
+    fichier (`FileSummary`, voir `build_summary`), seuls les blocs du fichier dont le
+    [min, max] peut contenir la valeur sont lus.
+
     Args:
-        dataframe (pd.DataFrame): Le DataFrame à filtrer.
+        dataframe (pd.DataFrame, Iterable[pd.DataFrame] or FileSummary): Le DataFrame, les blocs
+            ou le résumé du fichier à filtrer.
         column (str): Le nom de la colonne sur laquelle appliquer le filtre.
-        value: La valeur à rechercher dans la colonne.
+        value: La valeur à rechercher dans la colonne. Une liste de valeurs sélectionne les
+            lignes dont la valeur y figure, et un `slice(low, high)` celles comprises dans
+            l'intervalle fermé [low, high].
+        index (HashIndex, SortedIndex or FrameIndex, optional): Un index construit sur ce
+            DataFrame. La recherche ne parcourt alors que les lignes trouvées au lieu de toute la colonne.
 
     Returns:
-        pd.DataFrame: Un nouveau DataFrame contenant les lignes filtrées.
+        pd.DataFrame: Un nouveau DataFrame contenant les lignes filtrées (ou un itérateur de blocs filtrés).
 
     Raises:
         KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si l'index n'a pas été construit sur ce DataFrame.
     """
+    if isinstance(dataframe, FileSummary):
+        chunks = [chunk[_filter_mask(chunk[column], value)]
+                  for chunk in dataframe.read_chunks(dataframe.matching_chunks(column, value))]
+        if not chunks:
+            return pd.DataFrame(columns=dataframe.columns)
+        return pd.concat(chunks, ignore_index=True)
+    if not isinstance(dataframe, pd.DataFrame):
+        return (filter_data(chunk, column, value) for chunk in dataframe)
     if column not in dataframe.columns:
         raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
-    return dataframe[dataframe[column] == value]
+    if index is not None:
+        if index.dataframe is not dataframe:
+            raise ValueError("L'index n'a pas été construit sur ce DataFrame.")
+        return dataframe.iloc[index.positions(column, value)]
+    return dataframe[_filter_mask(dataframe[column], value)]
+
+
+def _filter_mask(series, value):
+    """Retourne le masque booléen des lignes de `series` correspondant à `value`."""
+    if isinstance(value, slice):
+        mask = series.notna()
+        if value.start is not None:
+            mask &= series >= value.start
+        if value.stop is not None:
+            mask &= series <= value.stop
+        return mask
+    if _is_list_like(value):
+        return series.isin(list(value))
+    return series == value
@@ -0,0 +1,221 @@
+import numpy as np
+import pandas as pd
+
+from .csv_handler import _filter_mask, iter_csv, load_csv
+from .transformations import normalize_data
+
+# Étapes qui ne dépendent que de la ligne courante : un filtre peut être avancé avant elles.
+_ROW_LOCAL_STEPS = ("select", "drop")
+
+
+class Dataset:
+    """
+    Requête paresseuse sur un fichier CSV ou un DataFrame.
+
+    Les méthodes `filter`, `select`, `fillna` et `normalize` n'exécutent rien : elles
+    enregistrent une étape et retournent un nouveau `Dataset`. Lors de `collect`, le plan
+    est optimisé puis exécuté en une seule passe :
+
+    - seules les colonnes réellement utilisées sont lues (projection au chargement) ;
+    - les filtres sont avancés avant les étapes qui ne dépendent que de la ligne
+      courante, et les filtres consécutifs sont combinés en un seul masque ;
+    - `fillna` et `normalize` modifient colonne par colonne le DataFrame intermédiaire,
+      qui appartient à la requête, au lieu d'en produire une copie complète.
+
+    Les étapes qui calculent des statistiques sur la colonne (moyenne, médiane, min/max)
+    ne sont jamais permutées avec un filtre, pour que le résultat soit identique à
+    l'exécution étape par étape.
+
+    Args:
+        source (str or pd.DataFrame): Le chemin d'un fichier CSV ou un DataFrame.
+        encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+
+    Example:
+        >>> dataset = scan_csv("ventes.csv").filter("pays", "FR").select(["prix", "qte"]).fillna("mean")
+        >>> dataframe = dataset.normalize("prix").collect()
+    """
+
+    def __init__(self, source, encoding="utf-8", steps=()):
+        self.source = source
+        self.encoding = encoding
+        self.steps = tuple(steps)
+
+    def _with_step(self, *step):
+        return Dataset(self.source, self.encoding, self.steps + (step,))
+
+    def filter(self, column, value):
+        """Ajoute un filtre équivalent à `filter_data(dataframe, column, value)`."""
+        return self._with_step("filter", column, value)
+
+    def select(self, columns):
+        """Ajoute une projection sur les colonnes données (dans cet ordre)."""
+        if isinstance(columns, str):
+            columns = [columns]
+        return self._with_step("select", tuple(columns))
+
+    def fillna(self, strategy="mean", value=None):
+        """
+        Ajoute le traitement des valeurs manquantes.
+
+        `strategy` suit `handle_missing_values` ('mean', 'median' ou 'drop'). Si `value`
+        est fourni, les valeurs manquantes sont remplacées par cette constante.
+        """
+        if value is not None:
+            return self._with_step("constant", value)
+        if strategy not in ("mean", "median", "drop"):
+            raise ValueError("Stratégie non supportée : choisissez parmi 'mean', 'median', ou 'drop'.")
+        return self._with_step("drop") if strategy == "drop" else self._with_step("fill", strategy)
+
+    def normalize(self, columns):
+        """Ajoute une normalisation Min-Max équivalente à `normalize_data`."""
+        if isinstance(columns, str):
+            columns = [columns]
+        return self._with_step("normalize", tuple(columns))
+
+    def optimized_steps(self):
+        """Retourne les étapes du plan après réordonnancement des filtres."""
+        steps = []
+        for step in self.steps:
+            position = len(steps)
+            if step[0] == "filter":
+                while position > 0 and steps[position - 1][0] in _ROW_LOCAL_STEPS:
+                    position -= 1
+            steps.insert(position, step)
+        return steps
+
+    def required_columns(self):
+        """Retourne la liste des colonnes à lire à la source, ou None pour toutes."""
+        required = None
+        for step in reversed(self.steps):
+            kind = step[0]
+            if kind == "select":
+                required = set(step[1])
+            elif kind == "drop":
+                # La suppression dépend de toutes les colonnes présentes à ce stade.
+                required = None
+            elif kind == "filter" and required is not None:
+                required.add(step[1])
+            elif kind == "normalize" and required is not None:
+                required.update(step[1])
+        return required
+
+    def explain(self):
+        """Retourne une description textuelle du plan optimisé."""
+        required = self.required_columns()
+        source = "DataFrame" if isinstance(self.source, pd.DataFrame) else str(self.source)
+        columns = "*" if required is None else sorted(required)
+        lines = [f"scan({source!r}, columns={columns})"]
+        for step in self.optimized_steps():
+            lines.append(f"{step[0]}({', '.join(repr(arg) for arg in step[1:])})")
+        return "\n".join(lines)
+
+    def collect(self, chunksize=None):
+        """
+        Exécute le plan et retourne le DataFrame résultant.
+
+        Args:
+            chunksize (int, optional): Si fourni, la source CSV est lue par blocs et un itérateur
+                de DataFrames est retourné. Réservé aux plans sans étape statistique
+                ('mean', 'median', 'normalize'), dont le résultat dépendrait du découpage.
+
+        Returns:
+            pd.DataFrame: Le résultat de la requête (ou un itérateur de blocs).
+
+        Raises:
+            KeyError: Si une étape fait référence à une colonne absente.
+            ValueError: Si `chunksize` est demandé pour un plan contenant une étape statistique.
+        """
+        steps = self.optimized_steps()
+        required = self.required_columns()
+        if chunksize is not None:
+            if any(step[0] in ("fill", "normalize") for step in steps):
+                raise ValueError("La lecture par blocs n'est possible que sans étape statistique.")
+            chunks = self._scan(required, chunksize)
+            return (self._run(chunk, steps, owned=True) for chunk in chunks)
+        dataframe = self._scan(required, None)
+        return self._run(dataframe, steps, owned=not isinstance(self.source, pd.DataFrame))
+
+    def _scan(self, required, chunksize):
+        if isinstance(self.source, pd.DataFrame):
+            columns = self.source.columns
+            if required is not None:
+                missing_columns = [col for col in required if col not in columns]
+                if missing_columns:
+                    raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+                columns = [col for col in columns if col in required]
+            if chunksize is None:
+                return self.source[columns]
+            return (self.source.iloc[i:i + chunksize][columns] for i in range(0, len(self.source), chunksize))
+
+        header = pd.read_csv(self.source, encoding=self.encoding, nrows=0).columns
+        if required is not None:
+            missing_columns = [col for col in required if col not in header]
+            if missing_columns:
+                raise KeyError(f"Les colonnes suivantes n'existent pas dans le fichier : {missing_columns}")
+        usecols = None if required is None else [col for col in header if col in required]
+        if chunksize is None:
+            if usecols is None:
+                return load_csv(self.source, encoding=self.encoding)
+            return pd.read_csv(self.source, encoding=self.encoding, usecols=usecols)
+        return iter_csv(self.source, encoding=self.encoding, chunksize=chunksize, usecols=usecols)
+
+    def _run(self, dataframe, steps, owned):
+        position = 0
+        while position < len(steps):
+            kind = steps[position][0]
+            if kind == "filter":
+                # Les filtres consécutifs sont fusionnés en un seul masque.
+                mask = np.ones(len(dataframe), dtype=bool)
+                while position < len(steps) and steps[position][0] == "filter":
+                    _, column, value = steps[position]
+                    if column not in dataframe.columns:
+                        raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+                    mask &= _filter_mask(dataframe[column], value).to_numpy(dtype=bool)
+                    position += 1
+                dataframe = dataframe[mask]
+                owned = True
+                continue
+
+            step = steps[position]
+            position += 1
+            if kind == "select":
+                missing_columns = [col for col in step[1] if col not in dataframe.columns]
+                if missing_columns:
+                    raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+                dataframe = dataframe[list(step[1])]
+                owned = True
+                continue
+            if kind == "drop":
+                dataframe = dataframe.dropna(how="any")
+                owned = True
+                continue
+
+            if not owned:
+                dataframe = dataframe.copy()
+                owned = True
+            if kind == "constant":
+                for column in dataframe.columns[dataframe.isna().any().to_numpy()]:
+                    dataframe[column] = dataframe[column].fillna(step[1])
+            elif kind == "fill":
+                for column in dataframe.columns:
+                    series = dataframe[column]
+                    if pd.api.types.is_numeric_dtype(series) and series.hasnans:
+                        fill_value = series.mean() if step[1] == "mean" else series.median()
+                        dataframe[column] = series.fillna(fill_value)
+            elif kind == "normalize":
+                dataframe = normalize_data(dataframe, list(step[1]))
+        return dataframe
+
+
+def scan_csv(file_path, encoding="utf-8"):
+    """
+    Crée une requête paresseuse sur un fichier CSV (voir `Dataset`).
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+
+    Returns:
+        Dataset: La requête, à compléter puis exécuter avec `collect`.
+    """
+    return Dataset(file_path, encoding=encoding)
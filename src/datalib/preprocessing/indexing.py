@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+
+
+def _is_list_like(value):
+    return isinstance(value, (list, set, frozenset, np.ndarray, pd.Index, pd.Series))
+
+
+class _ColumnIndex:
+    def __init__(self, dataframe, column):
+        if column not in dataframe.columns:
+            raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+        self.dataframe = dataframe
+        self.column = column
+
+    def _check_column(self, column):
+        if column != self.column:
+            raise KeyError(f"L'index porte sur la colonne '{self.column}', pas sur '{column}'.")
+
+
+class HashIndex(_ColumnIndex):
+    """
+    Index par hachage d'une colonne, pour les recherches par égalité et par liste de valeurs.
+
+    La colonne est factorisée une seule fois : les positions des lignes sont regroupées par
+    valeur, si bien qu'une recherche ne coûte que O(nombre de lignes trouvées). Un intervalle
+    (`slice`) est aussi accepté : il est comparé aux valeurs distinctes, ce qui coûte
+    O(nombre de valeurs distinctes) ; préférez `SortedIndex` pour les recherches par intervalle. L'index
+    n'est valable que tant que le DataFrame n'est pas modifié.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame à indexer.
+        column (str): Le nom de la colonne à indexer.
+
+    Raises:
+        KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
+    """
+
+    def __init__(self, dataframe, column):
+        super().__init__(dataframe, column)
+        codes, uniques = pd.factorize(dataframe[column])
+        self._uniques = pd.Index(uniques)
+        # Tri stable : à l'intérieur d'une valeur, les positions restent croissantes.
+        self._order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(self._uniques))
+        self._offsets = np.concatenate(([0], np.cumsum(counts))) + np.count_nonzero(codes < 0)
+
+    def positions(self, column, value):
+        """
+        Retourne les positions (croissantes) des lignes où `column` vaut `value`.
+
+        `value` peut être un scalaire, une liste de valeurs (équivalent de `isin`) ou un
+        `slice(low, high)` désignant l'intervalle fermé [low, high] (une borne None n'est pas limitée).
+        """
+        self._check_column(column)
+        if isinstance(value, slice):
+            # Les valeurs manquantes ne font pas partie des valeurs distinctes factorisées.
+            selected = np.ones(len(self._uniques), dtype=bool)
+            if value.start is not None:
+                selected &= np.asarray(self._uniques >= value.start, dtype=bool)
+            if value.stop is not None:
+                selected &= np.asarray(self._uniques <= value.stop, dtype=bool)
+            codes = np.flatnonzero(selected)
+        else:
+            values = list(value) if _is_list_like(value) else [value]
+            codes = np.unique(self._uniques.get_indexer(pd.Index(values).unique()))
+            codes = codes[codes >= 0]
+        segments = [self._order[self._offsets[code]:self._offsets[code + 1]] for code in codes]
+        if not segments:
+            return np.empty(0, dtype=np.intp)
+        if len(segments) == 1:
+            return segments[0]
+        return np.sort(np.concatenate(segments))
+
+
+class SortedIndex(_ColumnIndex):
+    """
+    Index trié d'une colonne, pour les recherches par égalité et par intervalle.
+
+    Les valeurs non manquantes sont triées une seule fois ; une recherche se fait par
+    dichotomie puis ne parcourt que les lignes trouvées.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame à indexer.
+        column (str): Le nom de la colonne à indexer (valeurs ordonnables).
+
+    Raises:
+        KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
+    """
+
+    def __init__(self, dataframe, column):
+        super().__init__(dataframe, column)
+        series = dataframe[column]
+        valid = np.flatnonzero(series.notna().to_numpy())
+        values = series.to_numpy()[valid]
+        order = np.argsort(values, kind="stable")
+        self._sorted = values[order]
+        self._order = valid[order]
+
+    def positions(self, column, value):
+        """
+        Retourne les positions (croissantes) des lignes correspondant à `value`.
+
+        `value` peut être un scalaire, une liste de valeurs ou un `slice(low, high)` désignant
+        l'intervalle fermé [low, high] (une borne None n'est pas limitée).
+        """
+        self._check_column(column)
+        if isinstance(value, slice):
+            start = 0 if value.start is None else np.searchsorted(self._sorted, value.start, side="left")
+            stop = len(self._sorted) if value.stop is None else np.searchsorted(self._sorted, value.stop, side="right")
+            return np.sort(self._order[start:max(start, stop)])
+        values = list(value) if _is_list_like(value) else [value]
+        segments = []
+        for item in pd.Index(values).unique():
+            start = np.searchsorted(self._sorted, item, side="left")
+            stop = np.searchsorted(self._sorted, item, side="right")
+            segments.append(self._order[start:stop])
+        if not segments:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(segments))
+
+
+class FrameIndex:
+    """
+    Ensemble d'index sur les colonnes d'un DataFrame, construits à la demande et réutilisés.
+
+    Un `HashIndex` est construit pour les recherches par valeur(s) et un `SortedIndex` pour les
+    recherches par intervalle (`slice`). Plusieurs conditions sont combinées par un ET logique.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame à indexer.
+
+    Example:
+        >>> index = FrameIndex(df)
+        >>> index.filter({"city": ["Paris", "Tunis"], "amount": slice(10, 100)})
+    """
+
+    def __init__(self, dataframe):
+        self.dataframe = dataframe
+        self._indexes = {}
+
+    def index_for(self, column, kind="hash"):
+        """Retourne (en le construisant si nécessaire) l'index `kind` ('hash' ou 'sorted') de `column`."""
+        if kind not in ("hash", "sorted"):
+            raise ValueError("Type d'index non supporté : choisissez parmi 'hash' ou 'sorted'.")
+        key = (column, kind)
+        if key not in self._indexes:
+            index_class = HashIndex if kind == "hash" else SortedIndex
+            self._indexes[key] = index_class(self.dataframe, column)
+        return self._indexes[key]
+
+    def positions(self, column, value):
+        """Retourne les positions des lignes où la condition sur `column` est vérifiée."""
+        if isinstance(value, slice):
+            return self.index_for(column, "sorted").positions(column, value)
+        if (column, "sorted") in self._indexes and (column, "hash") not in self._indexes:
+            return self._indexes[(column, "sorted")].positions(column, value)
+        return self.index_for(column, "hash").positions(column, value)
+
+    def lookup(self, conditions):
+        """Retourne les positions des lignes vérifiant toutes les conditions `{colonne: valeur}`."""
+        result = None
+        for column, value in conditions.items():
+            positions = self.positions(column, value)
+            result = positions if result is None else np.intersect1d(result, positions, assume_unique=True)
+            if len(result) == 0:
+                break
+        if result is None:
+            return np.arange(len(self.dataframe))
+        return result
+
+    def filter(self, conditions):
+        """Retourne le sous-DataFrame des lignes vérifiant toutes les conditions."""
+        return self.dataframe.iloc[self.lookup(conditions)]
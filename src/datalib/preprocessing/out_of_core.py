@@ -0,0 +1,113 @@
+import numpy as np
+
+from ..statslib.sketches import QuantileSketch
+from ..statslib.streaming import StreamingStats
+from .csv_handler import iter_csv, save_csv
+from .scalers import SCALERS
+
+
+def normalize_csv(input_path, output_path, columns=None, method="minmax", chunksize=100_000,
+                  encoding='utf-8', n_jobs=None, dtype=np.float64, scaler=None):
+    """
+    Normalise un fichier CSV trop volumineux pour la mémoire, de fichier à fichier.
+
+    Première passe : les blocs sont lus un à un pour ajuster le normaliseur (`partial_fit`).
+    Seconde passe : les blocs sont relus, normalisés et écrits au fur et à mesure. La mémoire
+    utilisée est bornée par la taille d'un bloc (et par `2 * n_jobs` blocs en cours
+    d'écriture si `n_jobs` est fourni, voir `save_csv`).
+
+    Args:
+        input_path (str): Le chemin du fichier CSV à normaliser.
+        output_path (str): Le chemin du fichier écrit (compression déduite de l'extension).
+        columns (str or list, optional): Les colonnes à normaliser (par défaut les colonnes
+            numériques du premier bloc).
+        method (str, optional): 'minmax', 'standard' ou 'robust' (par défaut 'minmax'). Pour
+            'robust', les quartiles sont estimés par sketch (voir `RobustScaler.partial_fit`).
+        chunksize (int, optional): Le nombre de lignes par bloc (par défaut 100 000).
+        encoding (str, optional): L'encodage des fichiers (par défaut 'utf-8').
+        n_jobs (int, optional): Le nombre de threads de mise en forme et de compression des blocs écrits.
+        dtype (optional): Le type des colonnes normalisées (par défaut np.float64).
+        scaler (optional): Un normaliseur déjà ajusté : la première passe est alors évitée.
+
+    Returns:
+        Le normaliseur ajusté, réutilisable pour d'autres données.
+
+    Raises:
+        FileNotFoundError: Si le fichier d'entrée n'existe pas.
+        KeyError: Si une colonne spécifiée n'existe pas dans le fichier.
+        ValueError: Si la méthode est inconnue, si une colonne n'est pas numérique ou si l'écriture échoue.
+    """
+    if scaler is None:
+        if method not in SCALERS:
+            raise ValueError(f"Méthode non supportée : choisissez parmi {list(SCALERS)}.")
+        scaler = SCALERS[method](columns, dtype=dtype)
+        for chunk in iter_csv(input_path, encoding=encoding, chunksize=chunksize):
+            scaler.partial_fit(chunk)
+
+    chunks = (scaler.transform(chunk, inplace=True)
+              for chunk in iter_csv(input_path, encoding=encoding, chunksize=chunksize))
+    save_csv(chunks, output_path, encoding=encoding, n_jobs=n_jobs, chunksize=chunksize)
+    return scaler
+
+
+def impute_csv(input_path, output_path, strategy="mean", columns=None, chunksize=100_000,
+               encoding='utf-8', n_jobs=None, error=0.001):
+    """
+    Remplace les valeurs manquantes d'un fichier CSV trop volumineux pour la mémoire.
+
+    Même principe que `normalize_csv` : une première passe calcule la valeur de remplacement
+    de chaque colonne (moyenne par `StreamingStats`, médiane par `QuantileSketch`), une
+    seconde remplit et écrit les blocs. Avec la stratégie 'drop', une seule passe suffit.
+
+    Args:
+        input_path (str): Le chemin du fichier CSV à traiter.
+        output_path (str): Le chemin du fichier écrit (compression déduite de l'extension).
+        strategy (str, optional): 'mean', 'median' ou 'drop', comme `handle_missing_values`
+            (par défaut 'mean').
+        columns (list, optional): Les colonnes à compléter (par défaut les colonnes numériques
+            du premier bloc). Ignoré pour 'drop'.
+        chunksize (int, optional): Le nombre de lignes par bloc (par défaut 100 000).
+        encoding (str, optional): L'encodage des fichiers (par défaut 'utf-8').
+        n_jobs (int, optional): Le nombre de threads de mise en forme et de compression des blocs écrits.
+        error (float, optional): L'erreur de rang de la médiane approchée (par défaut 0.001).
+
+    Returns:
+        dict: La valeur de remplacement de chaque colonne (vide pour 'drop').
+
+    Raises:
+        FileNotFoundError: Si le fichier d'entrée n'existe pas.
+        KeyError: Si une colonne spécifiée n'existe pas dans le fichier.
+        ValueError: Si la stratégie est inconnue, si une colonne n'est pas numérique ou si l'écriture échoue.
+    """
+    if strategy not in ("mean", "median", "drop"):
+        raise ValueError("Stratégie non supportée : choisissez parmi 'mean', 'median', ou 'drop'.")
+
+    if strategy == "drop":
+        chunks = (chunk.dropna(how="any")
+                  for chunk in iter_csv(input_path, encoding=encoding, chunksize=chunksize))
+        save_csv(chunks, output_path, encoding=encoding, n_jobs=n_jobs, chunksize=chunksize)
+        return {}
+
+    accumulators = None
+    for chunk in iter_csv(input_path, encoding=encoding, chunksize=chunksize):
+        if accumulators is None:
+            if columns is None:
+                columns = list(chunk.select_dtypes(include="number").columns)
+            accumulators = {column: StreamingStats() if strategy == "mean" else QuantileSketch(error=error, seed=0)
+                            for column in columns}
+        missing_columns = [col for col in columns if col not in chunk.columns]
+        if missing_columns:
+            raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+        for column in columns:
+            accumulators[column].update(chunk[column])
+
+    fill_values = {}
+    for column, accumulator in (accumulators or {}).items():
+        value = accumulator.mean if strategy == "mean" else accumulator.median()
+        if not np.isnan(value):
+            fill_values[column] = value
+
+    chunks = (chunk.fillna(fill_values)
+              for chunk in iter_csv(input_path, encoding=encoding, chunksize=chunksize))
+    save_csv(chunks, output_path, encoding=encoding, n_jobs=n_jobs, chunksize=chunksize)
+    return fill_values
@@ -0,0 +1,164 @@
+import operator
+
+import pandas as pd
+
+# Opérateurs acceptés dans les filtres de `load_parquet`.
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Le support Parquet nécessite 'pyarrow' (pip install pyarrow).")
+    return pa, pq
+
+
+def save_parquet(dataframe, file_path, row_group_size=100_000, compression="snappy"):
+    """
+    Enregistre un DataFrame dans un fichier Parquet.
+
+    Les statistiques min/max écrites pour chaque groupe de lignes permettent ensuite à
+    `load_parquet` d'ignorer les groupes qui ne peuvent pas satisfaire un filtre. Un itérable
+    de DataFrames (par exemple le résultat de `iter_csv`) est écrit bloc par bloc.
+
+    Args:
+        dataframe (pd.DataFrame or Iterable[pd.DataFrame]): Le DataFrame ou les blocs à enregistrer.
+        file_path (str): Le chemin où enregistrer le fichier Parquet.
+        row_group_size (int, optional): Le nombre maximal de lignes par groupe (par défaut 100 000).
+        compression (str, optional): L'algorithme de compression (par défaut 'snappy').
+
+    Returns:
+        None
+
+    Raises:
+        ImportError: Si 'pyarrow' n'est pas installé.
+        ValueError: Si l'enregistrement échoue.
+    """
+    pa, pq = _import_pyarrow()
+    if row_group_size <= 0:
+        raise ValueError("La taille des groupes de lignes doit être un entier positif.")
+    try:
+        if isinstance(dataframe, pd.DataFrame):
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            pq.write_table(table, file_path, row_group_size=row_group_size, compression=compression)
+            return
+        writer = None
+        try:
+            for chunk in dataframe:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(file_path, table.schema, compression=compression)
+                writer.write_table(table, row_group_size=row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+    except Exception as e:
+        raise ValueError(f"Erreur lors de l'enregistrement du fichier {file_path}: {e}")
+
+
+def load_parquet(file_path, columns=None, filters=None):
+    """
+    Charge un fichier Parquet en ne lisant que les colonnes et groupes de lignes utiles.
+
+    Les filtres sont des triplets `(colonne, opérateur, valeur)` combinés par un ET logique.
+    Les opérateurs supportés sont '==', '!=', '<', '<=', '>', '>=' et 'in' (valeur itérable).
+    Chaque filtre est d'abord évalué sur les statistiques min/max des groupes de lignes :
+    les groupes qui ne peuvent contenir aucune ligne correspondante ne sont pas lus. Le
+    filtre exact est ensuite appliqué aux lignes des groupes restants.
+
+    Args:
+        file_path (str): Le chemin vers le fichier Parquet.
+        columns (list, optional): Les colonnes à retourner (par défaut toutes).
+        filters (list, optional): La liste des filtres `(colonne, opérateur, valeur)`.
+
+    Returns:
+        pd.DataFrame: Le DataFrame contenant les lignes et colonnes sélectionnées.
+
+    Raises:
+        ImportError: Si 'pyarrow' n'est pas installé.
+        FileNotFoundError: Si le fichier n'existe pas.
+        KeyError: Si une colonne demandée ou filtrée n'existe pas.
+        ValueError: Si le fichier n'est pas un fichier Parquet valide ou si un opérateur est invalide.
+    """
+    pa, pq = _import_pyarrow()
+    filters = list(filters or [])
+    try:
+        parquet_file = pq.ParquetFile(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+    except (OSError, pa.ArrowException):
+        raise ValueError(f"Le fichier {file_path} n'est pas un fichier Parquet valide.")
+
+    schema_names = parquet_file.schema_arrow.names
+    requested = list(schema_names) if columns is None else list(columns)
+    filter_columns = [column for column, _, _ in filters]
+    missing_columns = [col for col in requested + filter_columns if col not in schema_names]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le fichier : {missing_columns}")
+    for _, op, _ in filters:
+        if op not in _OPERATORS and op != "in":
+            raise ValueError(f"Opérateur de filtre non supporté : '{op}'.")
+
+    read_columns = requested + [col for col in dict.fromkeys(filter_columns) if col not in requested]
+    row_groups = _select_row_groups(parquet_file.metadata, filters)
+    if row_groups:
+        dataframe = parquet_file.read_row_groups(row_groups, columns=read_columns).to_pandas()
+    else:
+        dataframe = parquet_file.schema_arrow.empty_table().select(read_columns).to_pandas()
+
+    if filters:
+        mask = pd.Series(True, index=dataframe.index)
+        for column, op, value in filters:
+            if op == "in":
+                mask &= dataframe[column].isin(list(value))
+            else:
+                mask &= _OPERATORS[op](dataframe[column], value)
+        dataframe = dataframe[mask].reset_index(drop=True)
+    return dataframe[requested]
+
+
+def _select_row_groups(metadata, filters):
+    """Retourne les indices des groupes de lignes dont les statistiques n'excluent aucun filtre."""
+    positions = {metadata.schema.column(j).path: j for j in range(metadata.num_columns)}
+    selected = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if all(_may_match(row_group.column(positions[column]).statistics, op, value)
+               for column, op, value in filters):
+            selected.append(i)
+    return selected
+
+
+def _may_match(statistics, op, value):
+    if statistics is None or not statistics.has_min_max:
+        return True
+    low, high = statistics.min, statistics.max
+    try:
+        if op == "==":
+            return low <= value <= high
+        if op == "!=":
+            # Les valeurs manquantes vérifient « != » (comme NaN != v dans pandas) : un groupe
+            # constant égal à `value` n'est exclu que s'il n'en contient aucune.
+            no_nulls = statistics.has_null_count and statistics.null_count == 0
+            return not (no_nulls and low == high == value)
+        if op == "<":
+            return low < value
+        if op == "<=":
+            return low <= value
+        if op == ">":
+            return high > value
+        if op == ">=":
+            return high >= value
+        return any(low <= item <= high for item in value)
+    except TypeError:
+        # Types non comparables : on ne peut rien exclure.
+        return True
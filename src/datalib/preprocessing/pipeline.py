@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+from .scalers import SCALERS
+from .transformations import handle_missing_values
+
+# Stratégies de remplacement applicables à une ligne isolée (une valeur apprise par colonne).
+RECORD_STRATEGIES = ("mean", "median", "constant")
+
+
+class Pipeline:
+    """
+    Prétraitement compilé : remplacement des valeurs manquantes puis normalisation.
+
+    Le pipeline est ajusté hors ligne sur un DataFrame ; ses paramètres sont ensuite réduits à
+    trois vecteurs (valeur de remplacement, facteur et décalage par colonne). `transform_record`
+    applique ces vecteurs à une ligne (dict ou tableau NumPy) ou à un petit lot, sans DataFrame,
+    en quelques microsecondes. Les opérations flottantes sont exactement celles du chemin par lot
+    (`transform`, c'est-à-dire `handle_missing_values` puis le normaliseur) : les résultats sont
+    identiques au bit près.
+
+    Args:
+        columns (list, optional): Les colonnes d'entrée, dans l'ordre des vecteurs produits (par
+            défaut les colonnes numériques du DataFrame d'ajustement).
+        imputation (str or dict, optional): 'mean', 'median', 'constant', None, ou un dictionnaire
+            {colonne: stratégie} (par défaut 'mean'). Les stratégies dépendant des autres lignes
+            ('ffill', 'interpolate', 'knn', 'drop') ne s'appliquent pas à une ligne isolée.
+        scaler (str, optional): 'minmax', 'standard', 'robust' ou None (par défaut 'minmax').
+        fill_value (optional): La valeur de la stratégie 'constant', ou un dictionnaire {colonne: valeur}.
+        dtype (optional): Le type des colonnes normalisées (par défaut np.float64).
+    """
+
+    def __init__(self, columns=None, imputation="mean", scaler="minmax", fill_value=None, dtype=np.float64):
+        if scaler is not None and scaler not in SCALERS:
+            raise ValueError(f"Normaliseur non supporté : choisissez parmi {list(SCALERS)} ou None.")
+        strategies = imputation.values() if isinstance(imputation, dict) else [imputation]
+        if any(strategy is not None and strategy not in RECORD_STRATEGIES for strategy in strategies):
+            raise ValueError(f"Stratégie non supportée pour une ligne isolée : choisissez parmi {list(RECORD_STRATEGIES)}.")
+        self.columns = [columns] if isinstance(columns, str) else columns
+        self.imputation = imputation
+        self.scaler = scaler
+        self.fill_value = fill_value
+        self.dtype = np.dtype(dtype)
+        self.columns_ = None
+        self.fill_values_ = None
+        self.scaler_ = None
+
+    def fit(self, dataframe):
+        """
+        Apprend les valeurs de remplacement, puis ajuste le normaliseur sur les données complétées.
+
+        Returns:
+            Pipeline: Le pipeline lui-même.
+
+        Raises:
+            KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+            ValueError: Si une colonne n'est pas numérique ou si `fill_value` manque pour 'constant'.
+        """
+        columns = list(dataframe.select_dtypes(include="number").columns) if self.columns is None else self.columns
+        missing_columns = [col for col in columns if col not in dataframe.columns]
+        if missing_columns:
+            raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+        non_numeric_columns = [col for col in columns if not pd.api.types.is_numeric_dtype(dataframe[col])]
+        if non_numeric_columns:
+            raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+
+        fill_values = {}
+        for column in columns:
+            strategy = self.imputation.get(column) if isinstance(self.imputation, dict) else self.imputation
+            if strategy == "constant":
+                value = self.fill_value.get(column) if isinstance(self.fill_value, dict) else self.fill_value
+                if value is None:
+                    raise ValueError(f"Une valeur 'fill_value' est requise pour la colonne '{column}' (stratégie 'constant').")
+                fill_values[column] = float(value)
+            elif strategy is not None:
+                # Même calcul que `handle_missing_values`, sur les valeurs connues.
+                values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                known = values[~np.isnan(values)]
+                if len(known):
+                    fill_values[column] = float(known.mean() if strategy == "mean" else np.median(known))
+
+        self.columns_ = list(columns)
+        self.fill_values_ = fill_values
+        self.scaler_ = None
+        if self.scaler is not None:
+            filled = self._fill(dataframe[self.columns_])
+            self.scaler_ = SCALERS[self.scaler](self.columns_, dtype=self.dtype).fit(filled)
+        self._compile()
+        return self
+
+    def transform(self, dataframe, inplace=False):
+        """
+        Applique le pipeline à un DataFrame (chemin par lot).
+
+        Args:
+            dataframe (pd.DataFrame): Le DataFrame à transformer ; les autres colonnes sont conservées.
+            inplace (bool, optional): Si True, `dataframe` est modifié et retourné (par défaut False).
+
+        Returns:
+            pd.DataFrame: Le DataFrame transformé.
+
+        Raises:
+            ValueError: Si le pipeline n'a pas été ajusté.
+            KeyError: Si une colonne apprise n'existe pas dans le DataFrame.
+        """
+        self._check_fitted()
+        result = self._fill(dataframe, inplace=inplace)
+        if self.scaler_ is not None:
+            result = self.scaler_.transform(result, inplace=True)
+        return result
+
+    def fit_transform(self, dataframe, inplace=False):
+        """Ajuste le pipeline puis transforme `dataframe` (voir `transform`)."""
+        return self.fit(dataframe).transform(dataframe, inplace=inplace)
+
+    def transform_record(self, record):
+        """
+        Applique le pipeline à une ligne ou à un petit lot, sans passer par pandas.
+
+        Args:
+            record (dict or np.ndarray): Une ligne sous forme de dictionnaire {colonne: valeur}
+                (None ou NaN pour une valeur manquante), un tableau de forme (n_colonnes,), ou un
+                lot de forme (n_lignes, n_colonnes), les colonnes étant dans l'ordre de `columns_`.
+
+        Returns:
+            np.ndarray: Les valeurs transformées, de même forme que l'entrée (ordre de `columns_`).
+
+        Raises:
+            ValueError: Si le pipeline n'a pas été ajusté ou si la forme de l'entrée est incorrecte.
+            KeyError: Si une colonne apprise manque dans le dictionnaire.
+        """
+        self._check_fitted()
+        if isinstance(record, dict):
+            try:
+                values = np.array([record[column] for column in self.columns_], dtype=np.float64)
+            except KeyError:
+                missing_columns = [col for col in self.columns_ if col not in record]
+                raise KeyError(f"Les colonnes suivantes n'existent pas dans l'enregistrement : {missing_columns}") from None
+        else:
+            values = np.array(record, dtype=np.float64)
+            if values.ndim not in (1, 2) or values.shape[-1] != len(self.columns_):
+                raise ValueError(f"L'entrée doit avoir {len(self.columns_)} colonnes, dans l'ordre de 'columns_'.")
+
+        np.copyto(values, self._fill_vector, where=np.isnan(values))
+        if self.scaler_ is None:
+            return values
+        values *= self._scale
+        values += self._min
+        return values.astype(self.dtype, copy=False)
+
+    def to_dict(self):
+        """Sérialise les paramètres appris (types JSON uniquement)."""
+        self._check_fitted()
+        return {"columns": list(self.columns_), "dtype": self.dtype.name, "fill_values": dict(self.fill_values_),
+                "scaler": None if self.scaler_ is None else self.scaler_.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit un pipeline sérialisé avec `to_dict` (utilisable pour `transform` et `transform_record`)."""
+        scaler = data["scaler"]
+        pipeline = cls(columns=list(data["columns"]), imputation=None,
+                       scaler=None if scaler is None else scaler["kind"], dtype=data["dtype"])
+        pipeline.columns_ = list(data["columns"])
+        pipeline.fill_values_ = {column: float(value) for column, value in data["fill_values"].items()}
+        pipeline.scaler_ = None if scaler is None else SCALERS[scaler["kind"]].from_dict(scaler)
+        pipeline._compile()
+        return pipeline
+
+    def _fill(self, dataframe, inplace=False):
+        return handle_missing_values(dataframe, dict.fromkeys(self.fill_values_, "constant"),
+                                     fill_value=self.fill_values_, inplace=inplace)
+
+    def _compile(self):
+        # Vecteurs dans l'ordre de `columns_` ; NaN signifie « pas de remplacement ».
+        self._fill_vector = np.array([self.fill_values_.get(column, np.nan) for column in self.columns_])
+        if self.scaler_ is not None:
+            self._scale = np.asarray(self.scaler_.scale_, dtype=np.float64)
+            self._min = np.asarray(self.scaler_.min_, dtype=np.float64)
+
+    def _check_fitted(self):
+        if self.columns_ is None:
+            raise ValueError("Le pipeline doit d'abord être ajusté avec 'fit'.")
+
+    def __repr__(self) -> str:
+        return f"Pipeline(columns={self.columns_ or self.columns}, imputation={self.imputation!r}, scaler={self.scaler!r})"
@@ -0,0 +1,321 @@
+import numpy as np
+
+from ..statslib.sketches import QuantileSketch
+from ..statslib.streaming import StreamingStats
+
+
+class _Scaler:
+    """
+    Base des normaliseurs : une transformation affine X * scale_ + min_ par colonne.
+
+    Les paramètres appris (`scale_`, `min_`) sont conservés, ce qui permet d'appliquer
+    exactement la même normalisation à de nouvelles données (par exemple en production).
+    `to_dict` sérialise aussi les accumulateurs de `partial_fit` lorsque c'est possible : un
+    normaliseur restauré par `from_dict` peut alors être complété par de nouveaux blocs.
+    `transform` traite une colonne à la fois : la mémoire supplémentaire est celle d'une
+    colonne, et non une copie du DataFrame entier.
+    """
+
+    kind = None
+
+    def __init__(self, columns=None, dtype=np.float32):
+        self.columns = [columns] if isinstance(columns, str) else columns
+        self.dtype = np.dtype(dtype)
+        self.columns_ = None
+        self.scale_ = None
+        self.min_ = None
+        self._accumulating = False
+
+    def fit(self, dataframe):
+        """
+        Apprend les paramètres de normalisation sur un DataFrame.
+
+        Returns:
+            Le normaliseur lui-même.
+
+        Raises:
+            KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+            ValueError: Si une colonne n'est pas numérique.
+        """
+        self._reset()
+        return self.partial_fit(dataframe)
+
+    def partial_fit(self, dataframe):
+        """
+        Complète les paramètres avec un nouveau bloc de données (par exemple un bloc de `iter_csv`).
+
+        Returns:
+            Le normaliseur lui-même.
+
+        Raises:
+            KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+            ValueError: Si une colonne n'est pas numérique ou diffère des blocs précédents, ou si
+                les accumulateurs du normaliseur n'ont pas été conservés (voir `from_dict`).
+        """
+        if self.columns_ is not None and not self._accumulating:
+            raise ValueError(f"Ce normaliseur '{self.kind}' ne peut pas être complété par 'partial_fit' : ses "
+                             f"accumulateurs n'ont pas été conservés (ajustement exact ou paramètres sans état).")
+        columns = self._check_columns(dataframe, self.columns_ or self.columns)
+        if self.columns_ is None:
+            self.columns_ = columns
+            self._start()
+            self._accumulating = True
+        for position, column in enumerate(self.columns_):
+            values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._update(position, values[~np.isnan(values)])
+        self.scale_, self.min_ = self._parameters()
+        return self
+
+    def transform(self, dataframe, inplace=False):
+        """
+        Normalise les colonnes apprises.
+
+        Args:
+            dataframe (pd.DataFrame): Le DataFrame à normaliser.
+            inplace (bool, optional): Si True, les colonnes de `dataframe` sont remplacées une à
+                une ; sinon un nouveau DataFrame est retourné, les autres colonnes étant partagées
+                sans copie (par défaut False).
+
+        Returns:
+            pd.DataFrame: Le DataFrame normalisé (`dataframe` lui-même si `inplace`).
+
+        Raises:
+            ValueError: Si le normaliseur n'a pas été ajusté ou si une colonne n'est pas numérique.
+            KeyError: Si une colonne apprise n'existe pas dans le DataFrame.
+        """
+        self._check_fitted()
+        self._check_columns(dataframe, self.columns_)
+        result = dataframe if inplace else dataframe.copy(deep=False)
+        for position, column in enumerate(self.columns_):
+            values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            result[column] = self._apply(values, position)
+        return result
+
+    def fit_transform(self, dataframe, inplace=False):
+        """Ajuste le normaliseur puis normalise `dataframe` (voir `transform`)."""
+        return self.fit(dataframe).transform(dataframe, inplace=inplace)
+
+    def inverse_transform(self, dataframe, inplace=False):
+        """Annule la normalisation des colonnes apprises (voir `transform`)."""
+        self._check_fitted()
+        self._check_columns(dataframe, self.columns_)
+        result = dataframe if inplace else dataframe.copy(deep=False)
+        for position, column in enumerate(self.columns_):
+            values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            result[column] = (values - self.min_[position]) / self.scale_[position]
+        return result
+
+    def to_dict(self):
+        """Sérialise les paramètres appris et, s'il y en a, les accumulateurs (types JSON uniquement)."""
+        self._check_fitted()
+        return {"kind": self.kind, "columns": list(self.columns_), "dtype": self.dtype.name,
+                "options": self._options(), "scale": self.scale_.tolist(), "min": self.min_.tolist(),
+                "state": self._state() if self._accumulating else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Reconstruit un normaliseur sérialisé avec `to_dict`.
+
+        Le normaliseur est utilisable pour `transform` ; il peut aussi être complété par
+        `partial_fit` si ses accumulateurs ont été sérialisés (sinon `partial_fit` lève une ValueError).
+        """
+        if data.get("kind") != cls.kind:
+            raise ValueError(f"Paramètres d'un normaliseur '{data.get('kind')}', et non '{cls.kind}'.")
+        scaler = cls(columns=list(data["columns"]), dtype=data["dtype"], **data.get("options", {}))
+        scaler.columns_ = list(data["columns"])
+        scaler.scale_ = np.asarray(data["scale"], dtype=np.float64)
+        scaler.min_ = np.asarray(data["min"], dtype=np.float64)
+        if data.get("state") is not None:
+            scaler._restore(data["state"])
+            scaler._accumulating = True
+        return scaler
+
+    def _apply(self, values, position):
+        # Calcul en float64 sur une seule colonne (jamais sur les données d'origine, que
+        # `to_numpy` peut partager), puis conversion vers le type de sortie.
+        result = values * self.scale_[position]
+        result += self.min_[position]
+        return result.astype(self.dtype, copy=False)
+
+    def _check_fitted(self):
+        if self.scale_ is None:
+            raise ValueError("Le normaliseur doit d'abord être ajusté avec 'fit' ou 'partial_fit'.")
+
+    def _check_columns(self, dataframe, columns):
+        if columns is None:
+            columns = list(dataframe.select_dtypes(include="number").columns)
+        missing_columns = [col for col in columns if col not in dataframe.columns]
+        if missing_columns:
+            raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+        non_numeric_columns = [col for col in columns if dataframe[col].dtype.kind not in 'fiu']
+        if non_numeric_columns:
+            raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+        return list(columns)
+
+    def _reset(self):
+        self.columns_ = None
+        self.scale_ = None
+        self.min_ = None
+        self._accumulating = False
+
+    def _options(self):
+        # Paramètres du constructeur autres que `columns` et `dtype`.
+        return {}
+
+    def _state(self):
+        # Accumulateurs de `partial_fit` (types JSON), ou None s'ils ne sont pas sérialisables.
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(columns={self.columns_ or self.columns})"
+
+
+class MinMaxScaler(_Scaler):
+    """
+    Normalisation Min-Max : chaque colonne est ramenée dans `feature_range` (par défaut [0, 1]).
+
+    Une colonne constante est envoyée sur la borne inférieure de l'intervalle.
+
+    Args:
+        columns (str or list, optional): Les colonnes à normaliser (par défaut les colonnes numériques).
+        feature_range (tuple, optional): L'intervalle cible (par défaut (0, 1)).
+        dtype (optional): Le type des colonnes normalisées (par défaut np.float32).
+    """
+
+    kind = "minmax"
+
+    def __init__(self, columns=None, feature_range=(0, 1), dtype=np.float32):
+        super().__init__(columns, dtype)
+        if feature_range[0] >= feature_range[1]:
+            raise ValueError("La borne inférieure de l'intervalle doit être strictement inférieure à la borne supérieure.")
+        self.feature_range = tuple(feature_range)
+
+    def _start(self):
+        self.data_min_ = np.full(len(self.columns_), np.nan)
+        self.data_max_ = np.full(len(self.columns_), np.nan)
+
+    def _update(self, position, values):
+        if len(values):
+            self.data_min_[position] = np.fmin(self.data_min_[position], values.min())
+            self.data_max_[position] = np.fmax(self.data_max_[position], values.max())
+
+    def _parameters(self):
+        low, high = self.feature_range
+        data_range = self.data_max_ - self.data_min_
+        scale = (high - low) / np.where(data_range > 0, data_range, 1.0)
+        scale = np.where(np.isnan(data_range), 1.0, scale)
+        return scale, low - np.nan_to_num(self.data_min_) * scale
+
+    def _options(self):
+        return {"feature_range": list(self.feature_range)}
+
+    def _state(self):
+        # Colonne encore sans valeur : NaN, qui n'est pas du JSON standard, devient None.
+        return {"data_min": [None if np.isnan(value) else float(value) for value in self.data_min_],
+                "data_max": [None if np.isnan(value) else float(value) for value in self.data_max_]}
+
+    def _restore(self, state):
+        self.data_min_ = np.array(state["data_min"], dtype=np.float64)
+        self.data_max_ = np.array(state["data_max"], dtype=np.float64)
+
+
+class StandardScaler(_Scaler):
+    """
+    Standardisation : chaque colonne est centrée et réduite, (x - moyenne) / écart-type.
+
+    L'écart-type est celui de la population (ddof=0), comme `sklearn.preprocessing.StandardScaler` ;
+    une colonne constante est seulement centrée. Les blocs de `partial_fit` sont combinés par
+    `StreamingStats` (formule de Welford/Chan) : le résultat ne dépend pas du découpage.
+
+    Args:
+        columns (str or list, optional): Les colonnes à normaliser (par défaut les colonnes numériques).
+        dtype (optional): Le type des colonnes normalisées (par défaut np.float32).
+    """
+
+    kind = "standard"
+
+    def _start(self):
+        self.stats_ = [StreamingStats() for _ in self.columns_]
+
+    def _update(self, position, values):
+        self.stats_[position].update(values)
+
+    def _parameters(self):
+        mean = np.array([stats.mean if stats.count else 0.0 for stats in self.stats_])
+        std = np.array([np.sqrt(stats.variance(ddof=0)) if stats.count else 0.0 for stats in self.stats_])
+        scale = 1.0 / np.where(std > 0, std, 1.0)
+        return scale, -mean * scale
+
+    def _state(self):
+        return {"stats": [stats.to_dict() if stats.count else None for stats in self.stats_]}
+
+    def _restore(self, state):
+        self.stats_ = [StreamingStats() if stats is None else StreamingStats.from_dict(stats)
+                       for stats in state["stats"]]
+
+
+class RobustScaler(_Scaler):
+    """
+    Normalisation robuste : (x - médiane) / écart interquartile, peu sensible aux valeurs extrêmes.
+
+    `fit` calcule les quantiles exacts ; `partial_fit` les estime par un `QuantileSketch` par
+    colonne, en mémoire bornée, à `error` près sur le rang. Les sketches ne sont pas
+    sérialisés : un normaliseur restauré par `from_dict` ne peut pas être complété.
+
+    Args:
+        columns (str or list, optional): Les colonnes à normaliser (par défaut les colonnes numériques).
+        quantile_range (tuple, optional): Les centiles définissant l'écart (par défaut (25, 75)).
+        error (float, optional): L'erreur de rang des sketches de `partial_fit` (par défaut 0.001).
+        dtype (optional): Le type des colonnes normalisées (par défaut np.float32).
+    """
+
+    kind = "robust"
+
+    def __init__(self, columns=None, quantile_range=(25.0, 75.0), error=0.001, dtype=np.float32):
+        super().__init__(columns, dtype)
+        if not 0 <= quantile_range[0] < quantile_range[1] <= 100:
+            raise ValueError("Les centiles doivent vérifier 0 <= bas < haut <= 100.")
+        self.quantile_range = tuple(quantile_range)
+        self.error = error
+
+    def fit(self, dataframe):
+        columns = self._check_columns(dataframe, self.columns)
+        self._reset()
+        self.columns_ = columns
+        levels = np.array([self.quantile_range[0], 50.0, self.quantile_range[1]]) / 100
+        quantiles = np.array([_nanquantile(dataframe[column], levels) for column in columns]).reshape(-1, 3)
+        self.sketches_ = None
+        self.scale_, self.min_ = self._from_quantiles(quantiles)
+        return self
+
+    def _start(self):
+        self.sketches_ = [QuantileSketch(error=self.error, seed=0) for _ in self.columns_]
+
+    def _update(self, position, values):
+        self.sketches_[position].update(values)
+
+    def _parameters(self):
+        levels = np.array([self.quantile_range[0], 50.0, self.quantile_range[1]]) / 100
+        return self._from_quantiles(np.array([sketch.quantile(levels) for sketch in self.sketches_]))
+
+    def _options(self):
+        return {"quantile_range": list(self.quantile_range), "error": self.error}
+
+    def _from_quantiles(self, quantiles):
+        quantiles = np.nan_to_num(quantiles)
+        spread = quantiles[:, 2] - quantiles[:, 0]
+        scale = 1.0 / np.where(spread > 0, spread, 1.0)
+        return scale, -quantiles[:, 1] * scale
+
+
+# Normaliseurs disponibles par nom (la clé est aussi le champ "kind" de `to_dict`).
+SCALERS = {"minmax": MinMaxScaler, "standard": StandardScaler, "robust": RobustScaler}
+
+
+def _nanquantile(series, levels):
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.full(len(levels), np.nan)
+    return np.quantile(values, levels)
@@ -0,0 +1,359 @@
+import hashlib
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from ..statslib.streaming import StreamingStats
+
+SUMMARY_SUFFIX = ".summary.json"
+_SUMMARY_VERSION = 3
+# Nombre de plus petites empreintes conservées par le sketch de valeurs distinctes (KMV).
+_SKETCH_SIZE = 64
+# Taille des blocs lus pour repérer les fins de ligne.
+_READ_BLOCK = 1 << 24
+
+
+class FileSummary:
+    """
+    Résumés par bloc (zone maps) d'un fichier CSV, enregistrés à côté du fichier.
+
+    Pour chaque bloc de lignes, le résumé conserve sa position en octets dans le fichier,
+    son nombre de lignes, le condensé SHA-1 de son contenu et, pour chaque colonne : le nombre de valeurs et de valeurs
+    manquantes, le minimum et le maximum, et un petit sketch des valeurs distinctes (KMV) ;
+    pour les colonnes numériques, la somme, la moyenne et la somme des carrés des écarts (M2,
+    forme stable de la somme des carrés). Les statistiques d'une colonne se calculent alors
+    sans relire le fichier, et un filtre ne lit que les blocs dont l'intervalle [min, max]
+    peut contenir la valeur recherchée.
+
+    Utilisez `build_summary` pour créer ou mettre à jour le résumé et `load_summary` pour le lire.
+    Le résumé mémorise la taille et la date de modification du fichier : s'il a changé depuis,
+    le résumé est périmé et sa lecture lève une ValueError.
+    """
+
+    def __init__(self, file_path, encoding, header, columns, size, mtime, chunksize, chunks):
+        self.file_path = os.fspath(file_path)
+        self.encoding = encoding
+        self.header = header
+        self.columns = columns
+        self.size = size
+        self.mtime = mtime
+        self.chunksize = chunksize
+        self.chunks = chunks
+
+    @property
+    def rows(self) -> int:
+        """Le nombre de lignes résumées."""
+        return sum(chunk["rows"] for chunk in self.chunks)
+
+    def is_current(self) -> bool:
+        """Indique si le fichier a encore la taille et la date de modification résumées."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime
+
+    def column_stats(self, column) -> StreamingStats:
+        """
+        Retourne l'accumulateur (effectif, moyenne, variance, min, max) d'une colonne numérique.
+
+        Raises:
+            KeyError: Si la colonne n'existe pas dans le fichier.
+            ValueError: Si la colonne n'est pas numérique.
+        """
+        stats = StreamingStats()
+        for summary in self._column_summaries(column):
+            if "m2" not in summary:
+                raise ValueError(f"La colonne '{column}' n'est pas numérique.")
+            if summary["count"]:
+                stats.merge(StreamingStats.from_dict(summary))
+        return stats
+
+    def mean(self, column) -> float:
+        """Retourne la moyenne d'une colonne, comme `calculate_mean`, sans lire le fichier."""
+        return self.column_stats(column).mean
+
+    def std(self, column) -> float:
+        """Retourne l'écart-type d'une colonne, comme `calculate_std`, sans lire le fichier."""
+        return self.column_stats(column).std()
+
+    def null_count(self, column) -> int:
+        """Retourne le nombre de valeurs manquantes d'une colonne."""
+        return sum(summary["nulls"] for summary in self._column_summaries(column))
+
+    def distinct_count(self, column) -> float:
+        """Estime le nombre de valeurs distinctes d'une colonne (exact sous 64 valeurs distinctes)."""
+        hashes = np.unique(np.concatenate([np.asarray(summary["sketch"], dtype=np.uint64)
+                                           for summary in self._column_summaries(column)] or [[]]))
+        return _estimate_distinct(hashes[:_SKETCH_SIZE])
+
+    def matching_chunks(self, column, value):
+        """
+        Retourne les numéros des blocs pouvant contenir des lignes où `column` correspond à `value`.
+
+        `value` suit les conventions de `filter_data` : une valeur, une liste de valeurs ou un
+        `slice(low, high)` (intervalle fermé). Un bloc n'est écarté que si son [min, max]
+        exclut certainement la valeur.
+        """
+        return [position for position, summary in enumerate(self._column_summaries(column))
+                if _may_match(summary, value)]
+
+    def read_chunks(self, chunks=None, usecols=None):
+        """
+        Lit des blocs du fichier à partir de leur position en octets, sans parcourir les autres.
+
+        Args:
+            chunks (list, optional): Les numéros des blocs à lire (par défaut tous).
+            usecols (list, optional): Les colonnes à lire.
+
+        Yields:
+            pd.DataFrame: Les blocs demandés, dans l'ordre.
+
+        Raises:
+            ValueError: Si le fichier a été modifié depuis la création du résumé.
+        """
+        self._check_current()
+        if chunks is None:
+            chunks = range(len(self.chunks))
+        with open(self.file_path, "rb") as handle:
+            for position in chunks:
+                chunk = self.chunks[position]
+                handle.seek(chunk["offset"])
+                data = self.header.encode(self.encoding) + handle.read(chunk["length"])
+                yield pd.read_csv(io.BytesIO(data), encoding=self.encoding, usecols=usecols)
+
+    def save(self):
+        """Enregistre le résumé dans le fichier '<fichier>.summary.json'."""
+        content = {
+            "version": _SUMMARY_VERSION, "encoding": self.encoding, "header": self.header,
+            "columns": self.columns, "size": self.size, "mtime": self.mtime, "chunksize": self.chunksize,
+            "chunks": self.chunks,
+        }
+        temporary_path = summary_path(self.file_path) + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as handle:
+            json.dump(content, handle)
+        os.replace(temporary_path, summary_path(self.file_path))
+
+    def _check_current(self):
+        if not self.is_current():
+            raise ValueError(f"Le résumé de {self.file_path} est périmé : le fichier a été modifié depuis "
+                             f"sa création. Reconstruisez-le avec 'build_summary'.")
+
+    def _column_summaries(self, column):
+        if column not in self.columns:
+            raise KeyError(f"La colonne '{column}' n'existe pas dans le fichier.")
+        return [chunk["columns"][column] for chunk in self.chunks]
+
+    def __repr__(self) -> str:
+        return f"FileSummary({self.file_path!r}, rows={self.rows}, chunks={len(self.chunks)})"
+
+
+def summary_path(file_path) -> str:
+    """Retourne le chemin du résumé associé à un fichier CSV."""
+    return os.fspath(file_path) + SUMMARY_SUFFIX
+
+
+def load_summary(file_path, rebuild=False) -> FileSummary:
+    """
+    Charge le résumé d'un fichier CSV, après avoir vérifié qu'il correspond au fichier actuel.
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        rebuild (bool, optional): Si True, un résumé périmé (taille ou date de modification du
+            fichier différentes) est mis à jour avec `build_summary` au lieu de lever une erreur
+            (par défaut False).
+
+    Returns:
+        FileSummary: Le résumé du fichier.
+
+    Raises:
+        FileNotFoundError: Si le fichier n'a pas de résumé.
+        ValueError: Si le résumé est illisible, d'une version non supportée ou périmé.
+    """
+    summary = _read_summary(file_path)
+    if not summary.is_current():
+        if rebuild:
+            return build_summary(file_path, chunksize=summary.chunksize, encoding=summary.encoding)
+        summary._check_current()
+    return summary
+
+
+def _read_summary(file_path) -> FileSummary:
+    """Lit le résumé enregistré, sans le comparer au fichier."""
+    path = summary_path(file_path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Aucun résumé pour le fichier {file_path}.")
+    try:
+        with open(path, encoding="utf-8") as handle:
+            content = json.load(handle)
+    except ValueError as e:
+        raise ValueError(f"Résumé illisible {path}: {e}")
+    if content.get("version") != _SUMMARY_VERSION:
+        raise ValueError(f"Version de résumé non supportée : {content.get('version')}.")
+    return FileSummary(file_path, content["encoding"], content["header"], content["columns"], content["size"],
+                       content["mtime"], content["chunksize"], content["chunks"])
+
+
+def build_summary(file_path, chunksize=100_000, encoding='utf-8') -> FileSummary:
+    """
+    Crée ou met à jour le résumé par blocs d'un fichier CSV non compressé.
+
+    Si un résumé existe et que le fichier a seulement été complété (le condensé de chaque bloc
+    déjà résumé est inchangé), seules les nouvelles lignes sont analysées et résumées en
+    nouveaux blocs ; les anciens blocs sont seulement relus pour vérifier leur condensé. Les
+    champs ne doivent pas contenir de sauts de ligne : les blocs sont délimités par les fins de ligne.
+
+    Args:
+        file_path (str): Le chemin vers le fichier CSV.
+        chunksize (int, optional): Le nombre de lignes par bloc (par défaut 100 000).
+        encoding (str, optional): L'encodage du fichier CSV (par défaut 'utf-8').
+
+    Returns:
+        FileSummary: Le résumé, également enregistré dans '<fichier>.summary.json'.
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas.
+        ValueError: Si le fichier est compressé ou si `chunksize` est invalide.
+    """
+    if chunksize <= 0:
+        raise ValueError("La taille des blocs doit être un entier positif.")
+    if os.path.splitext(os.fspath(file_path))[1] in (".gz", ".zst", ".bz2", ".xz", ".zip"):
+        raise ValueError("Les résumés par bloc nécessitent un fichier CSV non compressé.")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+
+    stat = os.stat(file_path)
+    size = stat.st_size
+    summary = _reusable_summary(file_path, encoding, chunksize, size)
+    if summary is None:
+        with open(file_path, "rb") as handle:
+            header = handle.readline()
+        summary = FileSummary(file_path, encoding, header.decode(encoding), [], len(header), None, chunksize, [])
+        summary.columns = list(pd.read_csv(io.BytesIO(header), encoding=encoding, nrows=0).columns)
+    elif summary.size == size:
+        # Contenu inchangé : seule la date de modification est mise à jour si besoin.
+        if summary.mtime != stat.st_mtime_ns:
+            summary.mtime = stat.st_mtime_ns
+            summary.save()
+        return summary
+
+    with open(file_path, "rb") as handle:
+        for offset, length in _chunk_ranges(handle, summary.size, chunksize):
+            handle.seek(offset)
+            content = handle.read(length)
+            chunk = pd.read_csv(io.BytesIO(summary.header.encode(encoding) + content), encoding=encoding)
+            summary.chunks.append({
+                "offset": offset, "length": length, "rows": len(chunk), "digest": _digest(content),
+                "columns": {column: _summarize_column(chunk[column]) for column in summary.columns},
+            })
+        summary.size = size
+        summary.mtime = stat.st_mtime_ns
+    summary.save()
+    return summary
+
+
+def _reusable_summary(file_path, encoding, chunksize, size):
+    """Retourne le résumé existant si le fichier n'a été modifié que par ajout de lignes."""
+    try:
+        summary = _read_summary(file_path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if summary.encoding != encoding or summary.chunksize != chunksize or size < summary.size:
+        return None
+    with open(file_path, "rb") as handle:
+        if handle.readline().decode(encoding) != summary.header:
+            return None
+        # Chaque bloc est comparé à son condensé : une modification de même longueur est vue partout.
+        for chunk in summary.chunks:
+            handle.seek(chunk["offset"])
+            if _digest(handle.read(chunk["length"])) != chunk["digest"]:
+                return None
+        # Une dernière ligne sans saut de ligne serait prolongée par les ajouts : on recommence.
+        handle.seek(summary.size - 1)
+        if handle.read(1) != b"\n":
+            return None
+    return summary
+
+
+def _digest(content):
+    return hashlib.sha1(content).hexdigest()
+
+
+def _chunk_ranges(handle, start, chunksize):
+    """Découpe le fichier à partir de `start` en plages de `chunksize` lignes : (position, longueur)."""
+    handle.seek(start)
+    chunk_start, position, rows = start, start, 0
+    while True:
+        block = handle.read(_READ_BLOCK)
+        if not block:
+            break
+        newlines = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n"))
+        while len(newlines) and rows + len(newlines) >= chunksize:
+            end = position + int(newlines[chunksize - rows - 1]) + 1
+            yield chunk_start, end - chunk_start
+            newlines = newlines[chunksize - rows:]
+            chunk_start, rows = end, 0
+        rows += len(newlines)
+        position += len(block)
+        handle.seek(position)
+    if position > chunk_start:
+        # Dernier bloc incomplet (sa dernière ligne peut ne pas finir par un saut de ligne).
+        yield chunk_start, position - chunk_start
+
+
+def _summarize_column(series):
+    """Résumé d'une colonne d'un bloc (types JSON uniquement)."""
+    values = series.dropna()
+    summary = {"count": int(len(values)), "nulls": int(len(series) - len(values)), "min": None, "max": None}
+    numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    if numeric:
+        values = values.astype(np.float64)
+        stats = StreamingStats().update(values.to_numpy())
+        summary.update(stats.to_dict())
+        summary["sum"] = stats.sum
+        # Les NaN ne sont pas du JSON standard : un bloc sans valeur a min/max/moyenne à None.
+        if stats.count == 0:
+            summary.update({"mean": None, "min": None, "max": None})
+    elif len(values):
+        values = values.astype(str)
+        summary["min"], summary["max"] = str(values.min()), str(values.max())
+    # Empreintes calculées sur les valeurs normalisées : 1 et 1.0 comptent pour une même valeur.
+    hashes = pd.util.hash_array(values.to_numpy(dtype=np.float64 if numeric else object))
+    summary["sketch"] = [int(h) for h in np.unique(hashes)[:_SKETCH_SIZE]]
+    return summary
+
+
+def _estimate_distinct(hashes):
+    if len(hashes) < _SKETCH_SIZE:
+        return float(len(hashes))
+    # Estimateur KMV : (k - 1) / (k-ième plus petite empreinte normalisée dans [0, 1]).
+    return float((_SKETCH_SIZE - 1) / (float(hashes[_SKETCH_SIZE - 1]) / 2.0 ** 64))
+
+
+def _may_match(summary, value):
+    """Indique si un bloc de [min, max] donné peut contenir `value` (voir `filter_data`)."""
+    low, high = summary["min"], summary["max"]
+    if isinstance(value, slice):
+        return ((value.start is None or _compare(value.start, high, lambda a, b: a <= b))
+                and (value.stop is None or _compare(value.stop, low, lambda a, b: a >= b)))
+    if isinstance(value, (list, tuple, set, np.ndarray, pd.Series, pd.Index)):
+        return any(_may_match(summary, item) for item in value)
+    return _compare(value, low, lambda a, b: a >= b) and _compare(value, high, lambda a, b: a <= b)
+
+
+def _compare(value, bound, operator):
+    # Borne ou valeur inconnue (bloc sans valeur, None, NaN) ou types incomparables (ex. : texte
+    # et nombre) : rien ne permet d'exclure le bloc, il est conservé par prudence.
+    if _is_missing(bound) or _is_missing(value) or isinstance(bound, str) != isinstance(value, str):
+        return True
+    try:
+        return bool(operator(value, bound))
+    except TypeError:
+        return True
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, (float, np.floating)) and np.isnan(value))
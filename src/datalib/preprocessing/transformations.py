@@ -1,14 +1,24 @@
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
 import pandas as pd
 import numpy as np
 
-def normalize_data(dataframe, columns):
+from .scalers import MinMaxScaler
+
+def normalize_data(dataframe, columns, inplace=False, dtype=np.float64, scaler=None):
     """
-    Normalise les colonnes spécifiées du DataFrame en utilisant MinMaxScaler.
+    Normalise les colonnes spécifiées du DataFrame en utilisant `MinMaxScaler`.
+
+    Les colonnes sont normalisées une à une : la mémoire supplémentaire est celle d'une
+    colonne. Pour normaliser de nouvelles données exactement comme les données
+    d'entraînement, passez le normaliseur déjà ajusté dans `scaler`.
 
     Args:
         dataframe (pd.DataFrame): Le DataFrame contenant les données à normaliser.
         columns (str or list): Le nom de la colonne ou la liste des noms de colonnes à normaliser.
+        inplace (bool, optional): Si True, `dataframe` est modifié et retourné ; sinon il reste
+            inchangé et un nouveau DataFrame est retourné (par défaut False).
+        dtype (optional): Le type des colonnes normalisées, par exemple np.float32 pour diviser
+            la mémoire par deux (par défaut np.float64).
+        scaler (MinMaxScaler, optional): Un normaliseur déjà ajusté, appliqué sans réajustement.
 
     Returns:
         pd.DataFrame: Le DataFrame avec les colonnes normalisées (entre 0 et 1).
@@ -32,35 +42,211 @@ def normalize_data(dataframe, columns):
         raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
 
     # Normalisation des données (Min-Max Scaling)
-    scaler = MinMaxScaler()
-    dataframe[columns] = scaler.fit_transform(dataframe[columns])
-    return dataframe
+    if scaler is None:
+        scaler = MinMaxScaler(columns, dtype=dtype).fit(dataframe)
+    return scaler.transform(dataframe, inplace=inplace)
+
 
+# Stratégies de `handle_missing_values` ; celles de NUMERIC_STRATEGIES exigent une colonne numérique.
+IMPUTATION_STRATEGIES = ("mean", "median", "constant", "ffill", "interpolate", "knn", "drop")
+NUMERIC_STRATEGIES = ("mean", "median", "interpolate", "knn")
+# Nombre maximal de distances calculées à la fois par la stratégie 'knn'.
+_KNN_BLOCK_ELEMENTS = 1 << 22
 
-def handle_missing_values(dataframe, strategy="mean"):
+
+def handle_missing_values(dataframe, strategy="mean", columns=None, fill_value=None, n_neighbors=5,
+                          inplace=False, return_counts=False):
     """
     Gère les valeurs manquantes dans le DataFrame.
 
+    Les masques de valeurs manquantes sont calculés une seule fois par colonne ; ils servent
+    à la fois au décompte et au remplissage. Seules les colonnes contenant des valeurs
+    manquantes sont traitées : aucune statistique n'est calculée pour les autres.
+
     Args:
         dataframe (pd.DataFrame): Le DataFrame à traiter.
-        strategy (str): La stratégie à utiliser pour traiter les valeurs manquantes.
-            Options : 
+        strategy (str or dict): La stratégie à utiliser pour traiter les valeurs manquantes,
+            ou un dictionnaire {colonne: stratégie} pour une stratégie par colonne.
+            Options :
             - "mean" : Remplacer les valeurs manquantes par la moyenne.
             - "median" : Remplacer les valeurs manquantes par la médiane.
+            - "constant" : Remplacer les valeurs manquantes par `fill_value`.
+            - "ffill" : Propager la dernière valeur connue (les valeurs manquantes en tête restent).
+            - "interpolate" : Interpolation linéaire selon la position des lignes (les extrémités
+              prennent la valeur connue la plus proche).
+            - "knn" : Moyenne de la colonne sur les `n_neighbors` lignes les plus proches, selon
+              les autres colonnes numériques centrées-réduites.
             - "drop" : Supprimer les lignes contenant des valeurs manquantes.
+        columns (list, optional): Les colonnes auxquelles appliquer une stratégie donnée sous
+            forme de chaîne (par défaut les colonnes numériques pour 'mean', 'median',
+            'interpolate' et 'knn', toutes les colonnes sinon). Ignoré si `strategy` est un dictionnaire.
+        fill_value (optional): La valeur de la stratégie 'constant', ou un dictionnaire
+            {colonne: valeur}.
+        n_neighbors (int, optional): Le nombre de voisins de la stratégie 'knn' (par défaut 5).
+        inplace (bool, optional): Si True, `dataframe` est modifié et retourné ; sinon il reste
+            inchangé, et seules les colonnes complétées sont copiées (par défaut False).
+        return_counts (bool, optional): Si True, retourne aussi le nombre de valeurs manquantes
+            de chaque colonne traitée, avant traitement (par défaut False).
 
     Returns:
-        pd.DataFrame: Le DataFrame après traitement des valeurs manquantes.
+        pd.DataFrame: Le DataFrame après traitement des valeurs manquantes, ou le tuple
+        (DataFrame, dict des décomptes) si `return_counts`.
 
     Raises:
-        ValueError: Si une stratégie invalide est spécifiée.
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une stratégie invalide est spécifiée, si une stratégie numérique vise une
+            colonne non numérique ou si `fill_value` manque pour la stratégie 'constant'.
     """
-    if strategy == "mean":
-        return dataframe.fillna(dataframe.mean(numeric_only=True))
-    elif strategy == "median":
-        return dataframe.fillna(dataframe.median(numeric_only=True))
-    elif strategy == "drop":
-        # Drop rows with any missing values
-        return dataframe.dropna(how="any")
+    if isinstance(strategy, dict):
+        plan = dict(strategy)
     else:
-        raise ValueError("Stratégie non supportée : choisissez parmi 'mean', 'median', ou 'drop'.")
+        if strategy not in IMPUTATION_STRATEGIES:
+            raise ValueError(f"Stratégie non supportée : choisissez parmi {list(IMPUTATION_STRATEGIES)}.")
+        if columns is None:
+            numeric_only = strategy in NUMERIC_STRATEGIES
+            columns = list(dataframe.select_dtypes(include="number").columns if numeric_only else dataframe.columns)
+        elif isinstance(columns, str):
+            columns = [columns]
+        plan = dict.fromkeys(columns, strategy)
+
+    missing_columns = [col for col in plan if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    if any(value not in IMPUTATION_STRATEGIES for value in plan.values()):
+        raise ValueError(f"Stratégie non supportée : choisissez parmi {list(IMPUTATION_STRATEGIES)}.")
+    non_numeric_columns = [col for col, value in plan.items()
+                           if value in NUMERIC_STRATEGIES and not pd.api.types.is_numeric_dtype(dataframe[col])]
+    if non_numeric_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+
+    masks = {column: dataframe[column].isna().to_numpy() for column in plan}
+    counts = {column: int(mask.sum()) for column, mask in masks.items()}
+    masks = {column: mask for column, mask in masks.items() if counts[column]}
+
+    # Suppression des lignes d'abord : les valeurs de remplacement sont calculées sur les lignes conservées.
+    drop_columns = [column for column in masks if plan[column] == "drop"]
+    result = dataframe if inplace else dataframe.copy(deep=False)
+    if drop_columns:
+        keep = ~np.logical_or.reduce([masks[column] for column in drop_columns])
+        if inplace:
+            result.dropna(subset=drop_columns, inplace=True)
+        else:
+            result = result[keep]
+        masks = {column: mask[keep] for column, mask in masks.items()
+                 if column not in drop_columns and mask[keep].any()}
+
+    for column, mask in masks.items():
+        method = plan[column]
+        series = result[column]
+        if method == "constant":
+            value = fill_value.get(column) if isinstance(fill_value, dict) else fill_value
+            if value is None:
+                raise ValueError(f"Une valeur 'fill_value' est requise pour la colonne '{column}' (stratégie 'constant').")
+            result[column] = series.fillna(value)
+        elif method == "ffill":
+            result[column] = series.ffill()
+        elif mask.all():
+            # Aucune valeur connue : rien à partir de quoi compléter la colonne.
+            continue
+        elif method == "knn":
+            features = [col for col in result.select_dtypes(include="number").columns if col != column]
+            result[column] = _fill_at(series, mask, _knn_values(result[features], series, mask, n_neighbors))
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            known = values[~mask]
+            if method == "mean":
+                fill = known.mean()
+            elif method == "median":
+                fill = np.median(known)
+            else:
+                positions = np.arange(len(values))
+                fill = np.interp(positions[mask], positions[~mask], known)
+            result[column] = _fill_at(series, mask, fill)
+
+    return (result, counts) if return_counts else result
+
+
+def _fill_at(series, mask, fill):
+    """Remplace les positions de `mask` par `fill` (scalaire ou tableau) dans une nouvelle Series."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind == "f":
+        values = series.to_numpy(copy=True)
+        values[mask] = fill
+        return pd.Series(values, index=series.index, name=series.name)
+    other = np.full(len(series), np.nan)
+    other[mask] = fill
+    return series.mask(mask, other)
+
+
+def _knn_values(features, target, mask, n_neighbors):
+    """Estime les valeurs manquantes de `target` par la moyenne de ses plus proches voisins."""
+    if n_neighbors < 1:
+        raise ValueError("Le nombre de voisins doit être un entier positif.")
+    known = target.to_numpy(dtype=np.float64, na_value=np.nan)[~mask]
+    if features.shape[1] == 0:
+        # Sans autre colonne, tous les voisins sont équidistants.
+        return np.full(int(mask.sum()), known.mean())
+
+    # Colonnes centrées-réduites ; leurs propres valeurs manquantes sont ramenées à la moyenne (0).
+    matrix = features.to_numpy(dtype=np.float64, na_value=np.nan)
+    mean = np.nanmean(matrix, axis=0)
+    std = np.nanstd(matrix, axis=0)
+    matrix = np.nan_to_num((matrix - mean) / np.where(std > 0, std, 1.0))
+    donors, queries = matrix[~mask], matrix[mask]
+    k = min(n_neighbors, len(donors))
+    donor_norms = np.einsum("ij,ij->i", donors, donors)
+
+    block = max(1, _KNN_BLOCK_ELEMENTS // len(donors))
+    estimates = np.empty(len(queries))
+    for start in range(0, len(queries), block):
+        query = queries[start:start + block]
+        distances = donor_norms - 2 * query @ donors.T
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        estimates[start:start + block] = known[nearest].mean(axis=1)
+    return estimates
+
+
+def optimize_dtypes(dataframe, category_threshold=0.5):
+    """
+    Réduit l'empreinte mémoire d'un DataFrame en choisissant des types plus compacts.
+
+    - Les entiers sont convertis vers le plus petit type entier signé capable de contenir
+      toutes les valeurs (les types non signés sont évités pour ne pas fausser les soustractions).
+    - Les flottants sont convertis en float32 uniquement si la conversion est exacte.
+    - Les colonnes texte dont la proportion de valeurs distinctes est inférieure ou égale à
+      `category_threshold` sont converties en type 'category'.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame à optimiser (il n'est pas modifié).
+        category_threshold (float, optional): Le ratio maximal valeurs distinctes / lignes pour
+            convertir une colonne texte en 'category' (par défaut 0.5).
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Le DataFrame optimisé et le nombre d'octets économisés.
+
+    Raises:
+        ValueError: Si `category_threshold` n'est pas compris entre 0 et 1.
+    """
+    if not 0 <= category_threshold <= 1:
+        raise ValueError("Le seuil de cardinalité doit être compris entre 0 et 1.")
+
+    before = int(dataframe.memory_usage(index=True, deep=True).sum())
+    columns = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == "i":
+            series = pd.to_numeric(series, downcast="integer")
+        elif isinstance(dtype, np.dtype) and dtype.kind == "f" and dtype.itemsize > 4:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(dtype), values, equal_nan=True):
+                series = pd.Series(narrowed, index=series.index, name=column)
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if len(series) and series.nunique(dropna=True) <= category_threshold * len(series):
+                series = series.astype("category")
+        columns[column] = series
+
+    optimized = pd.DataFrame(columns, index=dataframe.index)
+    optimized.attrs = dict(dataframe.attrs)
+    saved = before - int(optimized.memory_usage(index=True, deep=True).sum())
+    return optimized, saved
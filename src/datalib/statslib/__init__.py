@@ -5,10 +5,50 @@ from .basic_stats import (
     calculate_mode,
     calculate_std,
     calculate_correlation,
-    calculate_mean
+    calculate_mean,
+    describe_columns,
+    grouped_stats,
+    grouped_correlation
 )
 
 from .statistical_tests import (
     t_test,
-    chi_square_test
-)
\ No newline at end of file
+    chi_square_test,
+    t_test_from_summary,
+    batch_t_test,
+    batch_chi_square_test,
+    fdr_correction
+)
+
+from .streaming import (
+    StreamingStats,
+    stream_stats
+)
+
+from .sketches import (
+    QuantileSketch,
+    TopKSketch
+)
+
+from .correlation import (
+    correlation_matrix_values
+)
+
+from .stats_cache import (
+    StatsCache,
+    enable_stats_cache,
+    disable_stats_cache,
+    get_stats_cache
+)
+
+from .rolling import (
+    RollingStats,
+    RollingCorrelation,
+    rolling_stats,
+    rolling_correlation
+)
+
+from .resampling import (
+    permutation_test,
+    bootstrap_ci
+)
@@ -1,7 +1,17 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Union
+
+from .sketches import QuantileSketch, TopKSketch
+from .stats_cache import memoize_stat
 
+# Statistiques disponibles dans `describe_columns`.
+DESCRIBE_STATS = ("count", "mean", "median", "mode", "std", "min", "max")
+
+@memoize_stat
 def calculate_mean(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
     """
     Calcule la moyenne d'une colonne dans le DataFrame.
@@ -20,13 +30,21 @@ def calculate_mean(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
         raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
     return dataframe[column].mean()
 
-def calculate_median(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
+@memoize_stat
+def calculate_median(dataframe: pd.DataFrame, column: str, approximate: bool = False,
+                     error: float = 0.01) -> Union[float, None]:
     """
     Calcule la médiane d'une colonne dans le DataFrame.
+
+    En mode approché, la médiane est estimée par un `QuantileSketch` (KLL) en mémoire bornée,
+    sans trier la colonne : le rang de la valeur retournée est à `error` près de celui de la
+    médiane exacte, avec une forte probabilité.
     
     Args:
         dataframe (pd.DataFrame): Le DataFrame contenant les données.
         column (str): Le nom de la colonne dont la médiane doit être calculée.
+        approximate (bool, optional): Si True, utilise un sketch de quantiles (par défaut False).
+        error (float, optional): L'erreur de rang visée en mode approché (par défaut 0.01).
     
     Returns:
         Union[float, None]: La médiane de la colonne, ou None si la colonne est vide.
@@ -36,15 +54,24 @@ def calculate_median(dataframe: pd.DataFrame, column: str) -> Union[float, None]
     """
     if column not in dataframe.columns:
         raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+    if approximate:
+        return QuantileSketch(error=error, seed=0).update(dataframe[column]).median()
     return dataframe[column].median()
 
-def calculate_mode(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
+@memoize_stat
+def calculate_mode(dataframe: pd.DataFrame, column: str, approximate: bool = False,
+                   capacity: int = 1000) -> Union[float, None]:
     """
     Calcule le mode d'une colonne dans le DataFrame.
+
+    En mode approché, le mode est estimé par un `TopKSketch` (Space-Saving) limité à
+    `capacity` compteurs, au lieu d'une table contenant toutes les valeurs distinctes.
     
     Args:
         dataframe (pd.DataFrame): Le DataFrame contenant les données.
         column (str): Le nom de la colonne dont le mode doit être calculé.
+        approximate (bool, optional): Si True, utilise un sketch des valeurs fréquentes (par défaut False).
+        capacity (int, optional): Le nombre de compteurs du sketch en mode approché (par défaut 1000).
     
     Returns:
         Union[float, None]: Le mode de la colonne, ou None si la colonne est vide ou si aucun mode n'est trouvé.
@@ -54,11 +81,14 @@ def calculate_mode(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
     """
     if column not in dataframe.columns:
         raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+    if approximate:
+        return TopKSketch(capacity=capacity).update(dataframe[column]).mode()
     mode = dataframe[column].mode()
     if mode.empty:
         return None
     return mode.iloc[0]
 
+@memoize_stat
 def calculate_std(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
     """
     Calcule l'écart-type d'une colonne dans le DataFrame.
@@ -83,6 +113,7 @@ def calculate_std(dataframe: pd.DataFrame, column: str) -> Union[float, None]:
     return dataframe[column].std()
 
 
+@memoize_stat
 def calculate_correlation(dataframe: pd.DataFrame, col1: str, col2: str) -> Optional[float]:
     """
     Calcule la corrélation entre deux colonnes dans le DataFrame.
@@ -107,3 +138,283 @@ def calculate_correlation(dataframe: pd.DataFrame, col1: str, col2: str) -> Opti
         raise ValueError(f"Les colonnes '{col1}' et '{col2}' doivent être numériques pour calculer la corrélation.")
     
     return dataframe[col1].corr(dataframe[col2])
+
+
+def describe_columns(dataframe: pd.DataFrame, columns: Optional[List[str]] = None,
+                     stats: Sequence[str] = ("mean", "median", "mode", "std")) -> pd.DataFrame:
+    """
+    Calcule plusieurs statistiques pour plusieurs colonnes numériques en une seule passe vectorisée.
+
+    Les colonnes sont copiées une seule fois dans un bloc float64 contigu par colonne ; chaque
+    statistique est ensuite calculée pour toutes les colonnes à la fois, et le bloc n'est trié
+    qu'une fois pour la médiane et le mode. Les résultats sont identiques à ceux de
+    `calculate_mean`, `calculate_median`, `calculate_mode` et `calculate_std` (les valeurs
+    manquantes sont ignorées et l'écart-type vaut 0.0 pour une colonne à une seule valeur distincte).
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        columns (Optional[List[str]]): Les colonnes à décrire (par défaut toutes les colonnes numériques).
+        stats (Sequence[str]): Les statistiques à calculer, parmi 'count', 'mean', 'median',
+            'mode', 'std', 'min' et 'max' (par défaut 'mean', 'median', 'mode' et 'std').
+
+    Returns:
+        pd.DataFrame: Un DataFrame avec une ligne par colonne décrite et une colonne par statistique.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une colonne n'est pas numérique ou si une statistique est inconnue.
+    """
+    if columns is None:
+        columns = list(dataframe.select_dtypes(include="number").columns)
+    missing_columns = [col for col in columns if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    non_numeric_columns = [col for col in columns if not pd.api.types.is_numeric_dtype(dataframe[col])]
+    if non_numeric_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+    unknown_stats = [stat for stat in stats if stat not in DESCRIBE_STATS]
+    if unknown_stats:
+        raise ValueError(f"Statistiques non supportées : {unknown_stats}. Choisissez parmi {list(DESCRIBE_STATS)}.")
+
+    block = np.asfortranarray(dataframe[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+    if block.shape[0] == 0:
+        block = np.full((1, len(columns)), np.nan, order="F")
+    missing = np.isnan(block)
+    count = block.shape[0] - missing.sum(axis=0)
+    results = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "mean" in stats or "std" in stats:
+            # Même calcul que pandas : somme avec les NaN remplacés par 0, divisée par l'effectif.
+            mean = np.where(missing, 0.0, block).sum(axis=0) / count
+        if any(stat in stats for stat in ("median", "mode", "std", "min", "max")):
+            ordered = np.sort(block, axis=0)
+            positions = np.arange(len(columns))
+            has_values = count > 0
+            lowest = np.where(has_values, ordered[0], np.nan)
+            highest = np.where(has_values, ordered[np.maximum(count - 1, 0), positions], np.nan)
+
+        for stat in stats:
+            if stat == "count":
+                results[stat] = count
+            elif stat == "mean":
+                results[stat] = mean
+            elif stat == "std":
+                deviations = np.where(missing, 0.0, block - mean)
+                std = np.sqrt((deviations * deviations).sum(axis=0) / (count - 1))
+                results[stat] = np.where(~has_values | (lowest == highest), 0.0, std)
+            elif stat == "min":
+                results[stat] = lowest
+            elif stat == "max":
+                results[stat] = highest
+            elif stat == "median":
+                low = ordered[np.maximum((count - 1) // 2, 0), positions]
+                high = ordered[np.maximum(count // 2, 0), positions]
+                results[stat] = np.where(has_values, (low + high) / 2, np.nan)
+            elif stat == "mode":
+                results[stat] = [_sorted_mode(ordered[:n, i]) for i, n in enumerate(count)]
+
+    return pd.DataFrame(results, index=pd.Index(columns, name="column"), columns=list(stats))
+
+
+def _sorted_mode(values: np.ndarray) -> Optional[float]:
+    """Retourne la plus petite des valeurs les plus fréquentes d'un tableau trié sans NaN."""
+    if len(values) == 0:
+        return None
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    lengths = np.diff(np.append(starts, len(values)))
+    return values[starts[np.argmax(lengths)]]
+
+
+def grouped_stats(dataframe: pd.DataFrame, by: Union[str, List[str]], columns: Optional[List[str]] = None,
+                  stats: Sequence[str] = ("mean", "median", "mode", "std"),
+                  n_jobs: Optional[int] = None) -> pd.DataFrame:
+    """
+    Calcule plusieurs statistiques de plusieurs colonnes pour chaque groupe, sans boucle sur les groupes.
+
+    Les clés sont factorisées une seule fois en codes de groupe entiers. L'effectif, la moyenne
+    et l'écart-type sont obtenus par `np.bincount` (une passe par statistique) ; la médiane,
+    le mode, le minimum et le maximum par un unique tri (code de groupe, valeur) par colonne.
+    Le coût est en O(n log n) quel que soit le nombre de groupes, au lieu de O(groupes × n)
+    pour une boucle sur `filter_data`. Les résultats concordent avec `calculate_mean`,
+    `calculate_median`, `calculate_mode` et `calculate_std` appliqués à chaque groupe (à
+    l'arrondi près pour la moyenne et l'écart-type). Les lignes dont une clé est manquante
+    sont ignorées, comme dans `DataFrame.groupby`.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        by (Union[str, List[str]]): La ou les colonnes définissant les groupes.
+        columns (Optional[List[str]]): Les colonnes à décrire (par défaut toutes les colonnes
+            numériques autres que les clés).
+        stats (Sequence[str]): Les statistiques à calculer, parmi 'count', 'mean', 'median',
+            'mode', 'std', 'min' et 'max' (par défaut 'mean', 'median', 'mode' et 'std').
+        n_jobs (Optional[int]): Le nombre de threads traitant les colonnes (-1 pour tous les cœurs).
+
+    Returns:
+        pd.DataFrame: Une ligne par groupe (triés par clé) et une colonne (colonne, statistique)
+        par couple demandé.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une colonne n'est pas numérique ou si une statistique est inconnue.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    if columns is None:
+        columns = [col for col in dataframe.select_dtypes(include="number").columns if col not in keys]
+    missing_columns = [col for col in keys + list(columns) if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    non_numeric_columns = [col for col in columns if not pd.api.types.is_numeric_dtype(dataframe[col])]
+    if non_numeric_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+    unknown_stats = [stat for stat in stats if stat not in DESCRIBE_STATS]
+    if unknown_stats:
+        raise ValueError(f"Statistiques non supportées : {unknown_stats}. Choisissez parmi {list(DESCRIBE_STATS)}.")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    codes, index = _group_codes(dataframe, keys)
+    valid = codes >= 0
+    codes = codes[valid]
+    group_count = len(index)
+
+    def describe(column):
+        values = dataframe[column].to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+        return _describe_groups(values, codes, group_count, stats)
+
+    if n_jobs is None or n_jobs == 1 or len(columns) <= 1:
+        described = [describe(column) for column in columns]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            described = list(executor.map(describe, columns))
+
+    results = {(column, stat): values[stat] for column, values in zip(columns, described) for stat in stats}
+    return pd.DataFrame(results, index=index, columns=pd.MultiIndex.from_tuples(list(results)))
+
+
+def grouped_correlation(dataframe: pd.DataFrame, by: Union[str, List[str]], col1: str, col2: str) -> pd.Series:
+    """
+    Calcule la corrélation entre deux colonnes pour chaque groupe, de façon vectorisée.
+
+    Comme `calculate_correlation`, seules les lignes où les deux colonnes sont renseignées
+    sont utilisées ; la corrélation d'un groupe constant ou de moins de deux lignes est NaN.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        by (Union[str, List[str]]): La ou les colonnes définissant les groupes.
+        col1 (str): Le nom de la première colonne.
+        col2 (str): Le nom de la deuxième colonne.
+
+    Returns:
+        pd.Series: La corrélation de chaque groupe, indexée par les clés triées.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si l'une des colonnes n'est pas numérique.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    missing_columns = [col for col in keys + [col1, col2] if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    if not pd.api.types.is_numeric_dtype(dataframe[col1]) or not pd.api.types.is_numeric_dtype(dataframe[col2]):
+        raise ValueError(f"Les colonnes '{col1}' et '{col2}' doivent être numériques pour calculer la corrélation.")
+
+    codes, index = _group_codes(dataframe, keys)
+    x = dataframe[col1].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = dataframe[col2].to_numpy(dtype=np.float64, na_value=np.nan)
+    complete = (codes >= 0) & ~np.isnan(x) & ~np.isnan(y)
+    codes, x, y = codes[complete], x[complete], y[complete]
+    group_count = len(index)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        count = np.bincount(codes, minlength=group_count)
+        dx = x - (np.bincount(codes, weights=x, minlength=group_count) / count)[codes]
+        dy = y - (np.bincount(codes, weights=y, minlength=group_count) / count)[codes]
+        covariance = np.bincount(codes, weights=dx * dy, minlength=group_count)
+        variance_x = np.bincount(codes, weights=dx * dx, minlength=group_count)
+        variance_y = np.bincount(codes, weights=dy * dy, minlength=group_count)
+        correlation = np.clip(covariance / np.sqrt(variance_x * variance_y), -1, 1)
+    correlation[(count < 2) | (variance_x == 0) | (variance_y == 0)] = np.nan
+    return pd.Series(correlation, index=index)
+
+
+def _group_codes(dataframe: pd.DataFrame, keys: List[str]):
+    """Retourne le code de groupe de chaque ligne (-1 si une clé manque) et l'index trié des groupes."""
+    valid = np.ones(len(dataframe), dtype=bool)
+    codes = np.zeros(len(dataframe), dtype=np.int64)
+    for key in keys:
+        key_codes, uniques = pd.factorize(dataframe[key], sort=True)
+        valid &= key_codes >= 0
+        codes = codes * len(uniques) + key_codes
+        if len(keys) > 1:
+            # Renumérotation dense (en conservant l'ordre) pour éviter tout dépassement.
+            codes = np.unique(codes, return_inverse=True)[1].astype(np.int64)
+    if len(keys) == 1:
+        codes[~valid] = -1
+        return codes, pd.Index(uniques, name=keys[0])
+    rows = np.flatnonzero(valid)
+    _, first, dense = np.unique(codes[rows], return_index=True, return_inverse=True)
+    codes = np.full(len(dataframe), -1, dtype=np.int64)
+    codes[rows] = dense
+    return codes, pd.MultiIndex.from_arrays([dataframe[key].iloc[rows[first]] for key in keys], names=keys)
+
+
+def _describe_groups(values: np.ndarray, codes: np.ndarray, group_count: int, stats: Sequence[str]) -> dict:
+    """Calcule les statistiques d'une colonne pour chaque groupe (voir `grouped_stats`)."""
+    present = ~np.isnan(values)
+    count = np.bincount(codes[present], minlength=group_count)
+    has_values = count > 0
+    results = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "mean" in stats or "std" in stats:
+            mean = np.bincount(codes[present], weights=values[present], minlength=group_count) / count
+        if any(stat in stats for stat in ("median", "mode", "std", "min", "max")):
+            # Tri par (groupe, valeur), les NaN en fin de groupe : les valeurs sont triées une fois,
+            # puis la clé entière groupe × n + rang est triée (bien plus rapide que `np.lexsort`).
+            size = len(values)
+            value_order = np.argsort(values)
+            keys = np.sort(codes[value_order] * size + np.arange(size))
+            order = value_order[keys % size]
+            ordered = values[order]
+            starts = np.searchsorted(keys // size, np.arange(group_count))
+            last = starts + np.maximum(count - 1, 0)
+            # Chaque groupe contient au moins une ligne : les positions sont toujours valides.
+            lowest = np.where(has_values, ordered[starts], np.nan)
+            highest = np.where(has_values, ordered[last], np.nan)
+
+        for stat in stats:
+            if stat == "count":
+                results[stat] = count
+            elif stat == "mean":
+                results[stat] = mean
+            elif stat == "std":
+                deviations = values[present] - mean[codes[present]]
+                squares = np.bincount(codes[present], weights=deviations * deviations, minlength=group_count)
+                std = np.sqrt(squares / (count - 1))
+                results[stat] = np.where(~has_values | (lowest == highest), 0.0, std)
+            elif stat == "min":
+                results[stat] = lowest
+            elif stat == "max":
+                results[stat] = highest
+            elif stat == "median":
+                low = ordered[starts + np.maximum((count - 1) // 2, 0)]
+                high = ordered[starts + count // 2]
+                results[stat] = np.where(has_values, (low + high) / 2, np.nan)
+            elif stat == "mode":
+                results[stat] = _grouped_mode(ordered[present[order]], codes[order][present[order]], group_count)
+    return results
+
+
+def _grouped_mode(ordered: np.ndarray, codes: np.ndarray, group_count: int) -> np.ndarray:
+    """Plus petite des valeurs les plus fréquentes de chaque groupe, à partir des valeurs triées par groupe."""
+    mode = np.full(group_count, np.nan)
+    if len(ordered) == 0:
+        return mode
+    boundaries = np.concatenate(([True], (ordered[1:] != ordered[:-1]) | (codes[1:] != codes[:-1])))
+    run_starts = np.flatnonzero(boundaries)
+    run_lengths = np.diff(np.append(run_starts, len(ordered)))
+    run_codes = codes[run_starts]
+    # Par groupe : la série la plus longue, puis la plus petite valeur (la première dans l'ordre trié).
+    best = np.lexsort((run_starts, -run_lengths, run_codes))
+    first = best[np.concatenate(([True], run_codes[best][1:] != run_codes[best][:-1]))]
+    mode[run_codes[first]] = ordered[run_starts[first]]
+    return mode
@@ -0,0 +1,169 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Nombre de lignes converties à la fois en float64 pour les sommes par paires.
+_PAIRWISE_ROWS = 1 << 14
+# Variance relative (rapportée à la somme des carrés) en deçà de laquelle une colonne est
+# considérée constante sur les lignes communes à une paire. Les sommes étant accumulées en
+# float64, ce seuil ne dépend ni du nombre de lignes ni de `dtype`.
+_DEGENERATE_VARIANCE = 1e-10
+
+
+def correlation_matrix_values(dataframe: pd.DataFrame, columns: Optional[List[str]] = None,
+                              method: str = "pearson", dtype=np.float32, n_jobs: Optional[int] = None,
+                              block_size: int = 512, top: Optional[int] = None) -> pd.DataFrame:
+    """
+    Calcule la matrice de corrélation de nombreuses colonnes par produits matriciels par blocs.
+
+    Les colonnes sont centrées et réduites une seule fois, puis chaque bloc de la matrice est
+    obtenu par un produit matriciel (BLAS). En présence de valeurs manquantes, la corrélation
+    de chaque paire est calculée sur les lignes où les deux colonnes sont renseignées, comme
+    `DataFrame.corr`, à l'aide de produits entre les valeurs et les masques de présence.
+    Pour la méthode de Spearman, les colonnes sont d'abord remplacées par leurs rangs
+    (calculés par colonne : en présence de valeurs manquantes, le résultat peut différer
+    légèrement de `DataFrame.corr`, qui recalcule les rangs pour chaque paire).
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        columns (Optional[List[str]]): Les colonnes à corréler (par défaut toutes les colonnes numériques).
+        method (str, optional): 'pearson' ou 'spearman' (par défaut 'pearson').
+        dtype (optional): Le type des calculs et du résultat (par défaut np.float32, pour
+            diviser la mémoire par deux ; np.float64 pour une précision maximale).
+        n_jobs (Optional[int]): Le nombre de threads calculant les blocs (-1 pour tous les cœurs).
+        block_size (int, optional): Le nombre de colonnes par bloc (par défaut 512).
+        top (Optional[int]): Si fourni, seules les `top` paires de plus forte corrélation en
+            valeur absolue sont retournées, sans construire la matrice complète.
+
+    Returns:
+        pd.DataFrame: La matrice de corrélation, ou, si `top` est fourni, un DataFrame des paires
+        avec les colonnes 'col1', 'col2' et 'correlation', triées par |corrélation| décroissante.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une colonne n'est pas numérique ou si un paramètre est invalide.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError("Méthode non supportée : choisissez parmi 'pearson' ou 'spearman'.")
+    if block_size <= 0:
+        raise ValueError("La taille des blocs doit être un entier positif.")
+    if top is not None and top <= 0:
+        raise ValueError("Le nombre de paires doit être un entier positif.")
+    if columns is None:
+        columns = list(dataframe.select_dtypes(include=["number", "bool"]).columns)
+    missing_columns = [col for col in columns if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    non_numeric_columns = [col for col in columns if not pd.api.types.is_numeric_dtype(dataframe[col])]
+    if non_numeric_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    data = dataframe[columns]
+    if method == "spearman":
+        data = data.rank()
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    pairwise = not present.all()
+
+    # Centrage et réduction en float64, une seule fois pour toutes les paires.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centered = values - np.nanmean(values, axis=0) if len(values) else values
+        centered = np.where(present, centered, 0.0)
+        norms = np.sqrt((centered * centered).sum(axis=0))
+        scaled = np.asfortranarray((centered / np.where(norms > 0, norms, 1.0)).astype(dtype))
+    # Colonne constante (ou vide) : comparaison exacte, insensible aux erreurs d'arrondi du centrage.
+    with np.errstate(invalid="ignore"):
+        constant = ~(np.nanmax(values, axis=0, initial=-np.inf, where=present)
+                     > np.nanmin(values, axis=0, initial=np.inf, where=present))
+
+    count = len(columns)
+    blocks = [(start, min(start + block_size, count)) for start in range(0, count, block_size)]
+    tasks = [(row, col) for i, row in enumerate(blocks) for col in blocks[i:]]
+
+    def compute(task):
+        (r0, r1), (c0, c1) = task
+        left, right = scaled[:, r0:r1], scaled[:, c0:c1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if not pairwise:
+                block = left.T @ right
+            else:
+                n, sum_x, sum_y, cross, squares_x, squares_y = _pairwise_sums(scaled, present, r0, r1, c0, c1)
+                cov = cross - sum_x * sum_y / n
+                var_x = np.maximum(squares_x - sum_x * sum_x / n, 0)
+                var_y = np.maximum(squares_y - sum_y * sum_y / n, 0)
+                block = cov / np.sqrt(var_x * var_y)
+                # Colonne constante sur les lignes communes à la paire : corrélation indéfinie.
+                degenerate = ((var_x <= _DEGENERATE_VARIANCE * squares_x)
+                              | (var_y <= _DEGENERATE_VARIANCE * squares_y))
+                block[degenerate | (n < 2)] = np.nan
+            block[constant[r0:r1], :] = np.nan
+            block[:, constant[c0:c1]] = np.nan
+        return task, np.clip(block, -1, 1).astype(dtype, copy=False)
+
+    executor = None
+    if n_jobs is None or n_jobs == 1 or len(tasks) == 1:
+        results = map(compute, tasks)
+    else:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+        results = executor.map(compute, tasks)
+
+    try:
+        if top is None:
+            matrix = np.empty((count, count), dtype=dtype)
+            for ((r0, r1), (c0, c1)), block in results:
+                matrix[r0:r1, c0:c1] = block
+                matrix[c0:c1, r0:r1] = block.T
+            diagonal = np.arange(count)
+            matrix[diagonal, diagonal] = np.where(constant, np.nan, 1.0)
+            return pd.DataFrame(matrix, index=columns, columns=columns)
+        return _top_pairs(results, columns, top, dtype)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _pairwise_sums(scaled, present, r0, r1, c0, c1):
+    """Effectifs, sommes, produits croisés et carrés par paire, accumulés en float64 par tranches de lignes."""
+    sums = [np.zeros((r1 - r0, c1 - c0)) for _ in range(6)]
+    for start in range(0, len(scaled), _PAIRWISE_ROWS):
+        rows = slice(start, start + _PAIRWISE_ROWS)
+        left = scaled[rows, r0:r1].astype(np.float64)
+        right = scaled[rows, c0:c1].astype(np.float64)
+        left_mask = present[rows, r0:r1].astype(np.float64)
+        right_mask = present[rows, c0:c1].astype(np.float64)
+        for total, product in zip(sums, (left_mask.T @ right_mask, left.T @ right_mask, left_mask.T @ right,
+                                         left.T @ right, (left * left).T @ right_mask,
+                                         left_mask.T @ (right * right))):
+            total += product
+    return sums
+
+
+def _top_pairs(results, columns, top, dtype):
+    """Conserve les `top` paires de plus forte |corrélation| bloc par bloc."""
+    best_rows = np.empty(0, dtype=np.intp)
+    best_cols = np.empty(0, dtype=np.intp)
+    best_values = np.empty(0, dtype=dtype)
+    for ((r0, r1), (c0, c1)), block in results:
+        rows, cols = np.nonzero(~np.isnan(block))
+        rows, cols = rows + r0, cols + c0
+        # Paires distinctes uniquement : triangle supérieur strict.
+        upper = rows < cols
+        rows, cols = rows[upper], cols[upper]
+        block_values = block[rows - r0, cols - c0]
+        best_rows = np.concatenate((best_rows, rows))
+        best_cols = np.concatenate((best_cols, cols))
+        best_values = np.concatenate((best_values, block_values))
+        if len(best_values) > top:
+            keep = np.argpartition(-np.abs(best_values), top - 1)[:top]
+            best_rows, best_cols, best_values = best_rows[keep], best_cols[keep], best_values[keep]
+    order = np.lexsort((best_cols, best_rows, -np.abs(best_values)))
+    return pd.DataFrame({
+        "col1": [columns[i] for i in best_rows[order]],
+        "col2": [columns[j] for j in best_cols[order]],
+        "correlation": best_values[order],
+    })
@@ -0,0 +1,212 @@
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Nombre maximal de valeurs tirées par lot (environ 32 Mo en float64).
+_BATCH_ELEMENTS = 1 << 22
+# Tolérance relative pour comparer les statistiques rééchantillonnées à la statistique observée.
+_TOLERANCE = 1e-12
+ALTERNATIVES = ("two-sided", "less", "greater")
+CI_METHODS = ("percentile", "basic")
+
+
+def _mean_difference(x, y, axis=-1):
+    return x.mean(axis=axis) - y.mean(axis=axis)
+
+
+def _median_difference(x, y, axis=-1):
+    return np.median(x, axis=axis) - np.median(y, axis=axis)
+
+
+def _welch_t(x, y, axis=-1):
+    n1, n2 = x.shape[axis], y.shape[axis]
+    return _mean_difference(x, y, axis) / np.sqrt(x.var(axis=axis, ddof=1) / n1 + y.var(axis=axis, ddof=1) / n2)
+
+
+def _std(values, axis=-1):
+    return values.std(axis=axis, ddof=1)
+
+
+# Statistiques vectorisées : elles s'appliquent à un lot entier de rééchantillons à la fois.
+TWO_SAMPLE_STATISTICS = {"mean_difference": _mean_difference, "median_difference": _median_difference,
+                         "t": _welch_t}
+ONE_SAMPLE_STATISTICS = {"mean": np.mean, "median": np.median, "std": _std}
+
+_worker_data = None
+
+
+def permutation_test(group1: Union[pd.Series, np.ndarray], group2: Union[pd.Series, np.ndarray],
+                     statistic: Union[str, Callable] = "mean_difference", n_resamples: int = 10_000,
+                     alternative: str = "two-sided", batch_size: Optional[int] = None,
+                     n_jobs: Optional[int] = None, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Effectue un test de permutation entre deux groupes indépendants.
+
+    Les étiquettes de groupe sont permutées par lots : chaque lot est une matrice
+    (taille du lot × effectif total) de permutations générées d'un seul coup, et la statistique
+    est calculée pour tout le lot par une opération vectorisée. Les lots sont répartis entre
+    processus ; chaque lot reçoit son propre flux aléatoire (`SeedSequence.spawn`), si bien que
+    le résultat pour une graine donnée ne dépend pas du nombre de processus. La p-valeur vaut
+    (nombre de permutations au moins aussi extrêmes + 1) / (n_resamples + 1).
+
+    Args:
+        group1 (Union[pd.Series, np.ndarray]): Les données du premier groupe (les NaN sont ignorés).
+        group2 (Union[pd.Series, np.ndarray]): Les données du second groupe.
+        statistic (Union[str, Callable], optional): 'mean_difference', 'median_difference', 't'
+            (Welch), ou une fonction `f(x, y, axis)` vectorisée, définie au niveau d'un module
+            si `n_jobs` > 1 (par défaut 'mean_difference').
+        n_resamples (int, optional): Le nombre de permutations (par défaut 10 000).
+        alternative (str, optional): 'two-sided', 'less' ou 'greater' (par défaut 'two-sided').
+        batch_size (Optional[int]): Le nombre de permutations par lot (par défaut, de façon à
+            borner un lot à environ 32 Mo).
+        n_jobs (Optional[int]): Le nombre de processus (-1 pour tous les cœurs).
+        seed (Optional[int]): La graine, pour des résultats reproductibles.
+
+    Returns:
+        Dict[str, Any]: La statistique observée ('statistic'), la p-valeur ('p_value') et la
+        distribution des statistiques permutées ('null_distribution').
+
+    Raises:
+        ValueError: Si les données ne sont pas numériques, si un groupe est vide ou si un
+            paramètre est invalide.
+    """
+    function = _resolve_statistic(statistic, TWO_SAMPLE_STATISTICS)
+    if alternative not in ALTERNATIVES:
+        raise ValueError(f"Hypothèse alternative non supportée : choisissez parmi {list(ALTERNATIVES)}.")
+    x, y = _clean(group1), _clean(group2)
+    if len(x) == 0 or len(y) == 0:
+        raise ValueError("Les deux groupes doivent contenir au moins une valeur.")
+
+    observed = float(function(x, y, axis=-1))
+    pooled = np.concatenate((x, y))
+    null_distribution = _resample(_permutation_batch, (pooled, len(x), statistic), len(pooled),
+                                  n_resamples, batch_size, n_jobs, seed)
+
+    tolerance = _TOLERANCE * max(1.0, abs(observed))
+    if alternative == "two-sided":
+        extreme = np.abs(null_distribution) >= abs(observed) - tolerance
+    elif alternative == "greater":
+        extreme = null_distribution >= observed - tolerance
+    else:
+        extreme = null_distribution <= observed + tolerance
+    p_value = (np.count_nonzero(extreme) + 1) / (n_resamples + 1)
+    return {"statistic": observed, "p_value": float(p_value), "null_distribution": null_distribution}
+
+
+def bootstrap_ci(data: Union[pd.Series, np.ndarray], statistic: Union[str, Callable] = "mean",
+                 n_resamples: int = 10_000, confidence_level: float = 0.95, method: str = "percentile",
+                 batch_size: Optional[int] = None, n_jobs: Optional[int] = None,
+                 seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Calcule un intervalle de confiance par bootstrap.
+
+    Les rééchantillons (tirages avec remise) sont générés et évalués par lots vectorisés,
+    répartis entre processus avec des flux aléatoires indépendants, comme dans `permutation_test`.
+
+    Args:
+        data (Union[pd.Series, np.ndarray]): Les données (les NaN sont ignorés).
+        statistic (Union[str, Callable], optional): 'mean', 'median', 'std', ou une fonction
+            `f(values, axis)` vectorisée, définie au niveau d'un module si `n_jobs` > 1 (par défaut 'mean').
+        n_resamples (int, optional): Le nombre de rééchantillons (par défaut 10 000).
+        confidence_level (float, optional): Le niveau de confiance (par défaut 0.95).
+        method (str, optional): 'percentile' ou 'basic' (par défaut 'percentile').
+        batch_size (Optional[int]): Le nombre de rééchantillons par lot (voir `permutation_test`).
+        n_jobs (Optional[int]): Le nombre de processus (-1 pour tous les cœurs).
+        seed (Optional[int]): La graine, pour des résultats reproductibles.
+
+    Returns:
+        Dict[str, Any]: La statistique observée ('statistic'), les bornes de l'intervalle ('low',
+        'high'), l'erreur type bootstrap ('standard_error') et la distribution ('bootstrap_distribution').
+
+    Raises:
+        ValueError: Si les données ne sont pas numériques ou sont vides, ou si un paramètre est invalide.
+    """
+    function = _resolve_statistic(statistic, ONE_SAMPLE_STATISTICS)
+    if method not in CI_METHODS:
+        raise ValueError(f"Méthode non supportée : choisissez parmi {list(CI_METHODS)}.")
+    if not 0 < confidence_level < 1:
+        raise ValueError("Le niveau de confiance doit être compris strictement entre 0 et 1.")
+    values = _clean(data)
+    if len(values) == 0:
+        raise ValueError("Les données doivent contenir au moins une valeur.")
+
+    observed = float(function(values, axis=-1))
+    distribution = _resample(_bootstrap_batch, (values, statistic), len(values),
+                             n_resamples, batch_size, n_jobs, seed)
+    alpha = (1 - confidence_level) / 2
+    low, high = np.quantile(distribution, [alpha, 1 - alpha])
+    if method == "basic":
+        low, high = 2 * observed - high, 2 * observed - low
+    return {"statistic": observed, "low": float(low), "high": float(high),
+            "standard_error": float(distribution.std(ddof=1)) if n_resamples > 1 else float("nan"),
+            "bootstrap_distribution": distribution}
+
+
+def _resolve_statistic(statistic, named):
+    if callable(statistic):
+        return statistic
+    if statistic not in named:
+        raise ValueError(f"Statistique non supportée : choisissez parmi {list(named)} ou une fonction.")
+    return named[statistic]
+
+
+def _clean(values) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind not in "biuf":
+        raise ValueError("Les données doivent être numériques.")
+    values = values.astype(np.float64, copy=False).ravel()
+    return values[~np.isnan(values)]
+
+
+def _resample(batch, data, sample_size, n_resamples, batch_size, n_jobs, seed) -> np.ndarray:
+    """Exécute les lots de rééchantillonnage, éventuellement dans plusieurs processus."""
+    if n_resamples <= 0:
+        raise ValueError("Le nombre de rééchantillons doit être un entier positif.")
+    if batch_size is None:
+        batch_size = max(1, _BATCH_ELEMENTS // max(sample_size, 1))
+    elif batch_size <= 0:
+        raise ValueError("La taille des lots doit être un entier positif.")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    sizes = [batch_size] * (n_resamples // batch_size)
+    if n_resamples % batch_size:
+        sizes.append(n_resamples % batch_size)
+    # Un flux aléatoire indépendant par lot : le résultat ne dépend pas de n_jobs.
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if n_jobs is None or n_jobs == 1 or len(sizes) == 1:
+        parts = [batch(data, size, seed) for size, seed in zip(sizes, seeds)]
+    else:
+        # Les données sont envoyées une seule fois à chaque processus, pas à chaque lot.
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes)), initializer=_set_worker_data,
+                                 initargs=(data,)) as executor:
+            parts = list(executor.map(functools.partial(_run_worker_batch, batch), sizes, seeds))
+    return np.concatenate(parts)
+
+
+def _set_worker_data(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _run_worker_batch(batch, size, seed):
+    return batch(_worker_data, size, seed)
+
+
+def _permutation_batch(data, size, seed) -> np.ndarray:
+    pooled, n1, statistic = data
+    function = _resolve_statistic(statistic, TWO_SAMPLE_STATISTICS)
+    permuted = np.random.default_rng(seed).permuted(np.broadcast_to(pooled, (size, len(pooled))), axis=1)
+    return np.asarray(function(permuted[:, :n1], permuted[:, n1:], axis=-1), dtype=np.float64)
+
+
+def _bootstrap_batch(data, size, seed) -> np.ndarray:
+    values, statistic = data
+    function = _resolve_statistic(statistic, ONE_SAMPLE_STATISTICS)
+    samples = values[np.random.default_rng(seed).integers(0, len(values), (size, len(values)))]
+    return np.asarray(function(samples, axis=-1), dtype=np.float64)
@@ -0,0 +1,479 @@
+import heapq
+import math
+from collections import deque
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ROLLING_STATS = ("mean", "std", "median")
+
+
+class _Moments:
+    """Effectif, moyenne et M2 mis à jour par ajout et retrait (Welford et son inverse)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        return delta
+
+    def remove(self, value):
+        if self.count == 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+
+class _Extremes:
+    """Minimum et maximum d'une fenêtre FIFO par files monotones (O(1) amorti)."""
+
+    def __init__(self):
+        self._min = deque()
+        self._max = deque()
+
+    def add(self, seq, value):
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def remove(self, seq):
+        if self._min and self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] == seq:
+            self._max.popleft()
+
+    def constant(self):
+        return bool(self._min) and self._min[0][1] == self._max[0][1]
+
+
+class _Median:
+    """
+    Médiane glissante par deux tas (moitié basse, moitié haute) avec suppression paresseuse.
+
+    Les valeurs sont ordonnées par (valeur, numéro d'ordre), ce qui rend l'appartenance
+    d'une valeur à l'un des tas non ambiguë en présence d'ex aequo.
+    """
+
+    def __init__(self):
+        self._low = []  # tas max : (-valeur, -numéro)
+        self._high = []  # tas min : (valeur, numéro)
+        self._low_size = 0
+        self._high_size = 0
+        self._deleted = set()
+
+    def add(self, seq, value):
+        self._prune()
+        if self._low_size == 0 or (value, seq) <= self._low_top():
+            heapq.heappush(self._low, (-value, -seq))
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (value, seq))
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, seq, value):
+        self._prune()
+        if self._low_size and (value, seq) <= self._low_top():
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+        self._deleted.add(seq)
+        self._rebalance()
+        self._compact()
+
+    def median(self):
+        self._prune()
+        if self._low_size == 0:
+            return float("nan")
+        if self._low_size > self._high_size:
+            return -self._low[0][0]
+        return (-self._low[0][0] + self._high[0][0]) / 2
+
+    def _low_top(self):
+        return -self._low[0][0], -self._low[0][1]
+
+    def _prune(self):
+        while self._low and -self._low[0][1] in self._deleted:
+            self._deleted.discard(-heapq.heappop(self._low)[1])
+        while self._high and self._high[0][1] in self._deleted:
+            self._deleted.discard(heapq.heappop(self._high)[1])
+
+    def _rebalance(self):
+        self._prune()
+        if self._low_size > self._high_size + 1:
+            value, seq = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, -seq))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+        self._prune()
+
+    def _compact(self):
+        # Les valeurs supprimées loin du sommet d'un tas y restent : on reconstruit le tas
+        # lorsqu'elles deviennent majoritaires, pour une mémoire en O(fenêtre).
+        if len(self._low) > 2 * self._low_size + 16:
+            self._low = self._rebuild(self._low, lambda item: -item[1])
+        if len(self._high) > 2 * self._high_size + 16:
+            self._high = self._rebuild(self._high, lambda item: item[1])
+
+    def _rebuild(self, heap, seq_of):
+        kept = []
+        for item in heap:
+            seq = seq_of(item)
+            if seq in self._deleted:
+                self._deleted.discard(seq)
+            else:
+                kept.append(item)
+        heapq.heapify(kept)
+        return kept
+
+
+class _Window:
+    """
+    Fenêtre glissante commune : par nombre d'observations (entier), par durée (chaîne ou
+    Timedelta, avec un horodatage à chaque ajout) ou cumulative (None).
+    """
+
+    def __init__(self, window, min_periods):
+        if window is None:
+            self._size, self._duration = None, None
+            default_min_periods = 1
+        elif isinstance(window, (int, np.integer)) and not isinstance(window, bool):
+            if window <= 0:
+                raise ValueError("La taille de la fenêtre doit être un entier positif.")
+            self._size, self._duration = int(window), None
+            default_min_periods = int(window)
+        else:
+            try:
+                self._duration = pd.Timedelta(window)
+            except ValueError:
+                raise ValueError(f"Fenêtre invalide : {window!r}.")
+            if self._duration <= pd.Timedelta(0):
+                raise ValueError("La durée de la fenêtre doit être positive.")
+            self._size = None
+            default_min_periods = 1
+        self.window = window
+        self.min_periods = default_min_periods if min_periods is None else min_periods
+        self._entries = deque()
+        self._seq = 0
+        self._last_time = None
+
+    def _push(self, values, timestamp):
+        if self._duration is not None:
+            if timestamp is None:
+                raise ValueError("Un horodatage est requis pour une fenêtre temporelle.")
+            timestamp = pd.Timestamp(timestamp)
+            if self._last_time is not None and timestamp < self._last_time:
+                raise ValueError("Les horodatages doivent être croissants.")
+            self._last_time = timestamp
+            # Fenêtre (t - durée, t], comme `Series.rolling` avec une durée.
+            while self._entries and self._entries[0][1] <= timestamp - self._duration:
+                self._evict()
+        seq = self._seq
+        self._seq += 1
+        if self._size is not None or self._duration is not None:
+            # Une fenêtre cumulative ne retire jamais de valeurs : inutile de les conserver.
+            self._entries.append((seq, timestamp, values))
+        self._add(seq, values)
+        if self._size is not None and len(self._entries) > self._size:
+            self._evict()
+
+    def _evict(self):
+        seq, _, values = self._entries.popleft()
+        self._remove(seq, values)
+
+    def __len__(self) -> int:
+        """Le nombre d'observations de la fenêtre, valeurs manquantes comprises."""
+        if self._size is None and self._duration is None:
+            return self._seq
+        return len(self._entries)
+
+
+class RollingStats(_Window):
+    """
+    Moyenne, écart-type et médiane d'une fenêtre glissante, mis à jour à chaque ajout.
+
+    Chaque ajout coûte O(1) pour la moyenne et l'écart-type (moments de Welford mis à jour
+    par ajout et retrait) et O(log n) pour la médiane (deux tas), au lieu de recalculer la
+    fenêtre entière : adapté à un flux mis à jour à chaque tick. Les valeurs manquantes
+    occupent une place dans la fenêtre mais sont ignorées par les statistiques, comme
+    `Series.rolling` ; `rolling_stats` donne les mêmes résultats sur une colonne entière.
+
+    Args:
+        window (Union[int, str, pd.Timedelta, None], optional): Le nombre d'observations de la
+            fenêtre, une durée ('5min', pd.Timedelta...) ou None pour une fenêtre cumulative.
+        min_periods (int, optional): Le nombre minimal de valeurs renseignées pour produire un
+            résultat (par défaut la taille de la fenêtre, ou 1 pour une durée ou une fenêtre cumulative).
+
+    Raises:
+        ValueError: Si la fenêtre est invalide.
+
+    Example:
+        >>> stats = RollingStats(window="5min")
+        >>> for timestamp, price in feed:
+        ...     stats.append(price, timestamp)
+        ...     print(stats.mean(), stats.median())
+    """
+
+    def __init__(self, window: Union[int, str, pd.Timedelta, None] = None, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods)
+        self._moments = _Moments()
+        self._extremes = _Extremes()
+        self._median = _Median()
+
+    @property
+    def count(self) -> int:
+        """Le nombre de valeurs renseignées dans la fenêtre."""
+        return self._moments.count
+
+    def append(self, value: float, timestamp=None) -> "RollingStats":
+        """
+        Ajoute une valeur à la fenêtre et retire les valeurs qui en sortent.
+
+        Args:
+            value (float): La nouvelle valeur (NaN ou None pour une valeur manquante).
+            timestamp (optional): L'horodatage de la valeur, requis pour une fenêtre temporelle.
+
+        Returns:
+            RollingStats: L'accumulateur lui-même.
+
+        Raises:
+            ValueError: Si l'horodatage est absent ou décroissant pour une fenêtre temporelle.
+        """
+        value = float("nan") if value is None else float(value)
+        self._push(value, timestamp)
+        return self
+
+    def extend(self, values: Iterable[float], timestamps: Optional[Iterable] = None) -> "RollingStats":
+        """Ajoute plusieurs valeurs successives (voir `append`)."""
+        if timestamps is None:
+            for value in values:
+                self.append(value)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                self.append(value, timestamp)
+        return self
+
+    def mean(self) -> float:
+        """Retourne la moyenne de la fenêtre, ou NaN si elle a moins de `min_periods` valeurs."""
+        if not self._ready():
+            return float("nan")
+        return self._moments.mean
+
+    def std(self, ddof: int = 1) -> float:
+        """Retourne l'écart-type de la fenêtre (0.0 si toutes ses valeurs sont égales)."""
+        if not self._ready() or self._moments.count <= ddof:
+            return float("nan")
+        if self._extremes.constant():
+            return 0.0
+        return math.sqrt(self._moments.m2 / (self._moments.count - ddof))
+
+    def median(self) -> float:
+        """Retourne la médiane de la fenêtre, ou NaN si elle a moins de `min_periods` valeurs."""
+        if not self._ready():
+            return float("nan")
+        return float(self._median.median())
+
+    def _ready(self):
+        return self._moments.count > 0 and self._moments.count >= self.min_periods
+
+    def _add(self, seq, value):
+        if value != value:
+            return
+        self._moments.add(value)
+        self._extremes.add(seq, value)
+        self._median.add(seq, value)
+
+    def _remove(self, seq, value):
+        if value != value:
+            return
+        self._moments.remove(value)
+        self._extremes.remove(seq)
+        self._median.remove(seq, value)
+
+
+class RollingCorrelation(_Window):
+    """
+    Corrélation de Pearson glissante entre deux flux, mise à jour en O(1) à chaque ajout.
+
+    Les moyennes, les sommes des carrés des écarts et le co-moment sont mis à jour par
+    ajout et retrait. Seules les paires dont les deux valeurs sont renseignées sont
+    utilisées, comme `Series.rolling(...).corr`.
+
+    Args:
+        window (Union[int, str, pd.Timedelta, None], optional): La fenêtre (voir `RollingStats`).
+        min_periods (int, optional): Le nombre minimal de paires complètes pour produire un résultat.
+
+    Raises:
+        ValueError: Si la fenêtre est invalide.
+    """
+
+    def __init__(self, window: Union[int, str, pd.Timedelta, None] = None, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods)
+        self._x = _Moments()
+        self._y = _Moments()
+        self._x_extremes = _Extremes()
+        self._y_extremes = _Extremes()
+        self._comoment = 0.0
+
+    @property
+    def count(self) -> int:
+        """Le nombre de paires complètes dans la fenêtre."""
+        return self._x.count
+
+    def append(self, x: float, y: float, timestamp=None) -> "RollingCorrelation":
+        """
+        Ajoute une paire de valeurs à la fenêtre et retire celles qui en sortent.
+
+        Returns:
+            RollingCorrelation: L'accumulateur lui-même.
+
+        Raises:
+            ValueError: Si l'horodatage est absent ou décroissant pour une fenêtre temporelle.
+        """
+        x = float("nan") if x is None else float(x)
+        y = float("nan") if y is None else float(y)
+        self._push((x, y), timestamp)
+        return self
+
+    def correlation(self) -> float:
+        """Retourne la corrélation, ou NaN si elle n'est pas définie (valeurs constantes, fenêtre trop courte)."""
+        if self._x.count < max(self.min_periods, 2):
+            return float("nan")
+        if self._x_extremes.constant() or self._y_extremes.constant():
+            return float("nan")
+        denominator = math.sqrt(self._x.m2 * self._y.m2)
+        if denominator == 0:
+            return float("nan")
+        return max(-1.0, min(1.0, self._comoment / denominator))
+
+    def _add(self, seq, values):
+        x, y = values
+        if x != x or y != y:
+            return
+        delta_x = self._x.add(x)
+        self._y.add(y)
+        self._comoment += delta_x * (y - self._y.mean)
+        self._x_extremes.add(seq, x)
+        self._y_extremes.add(seq, y)
+
+    def _remove(self, seq, values):
+        x, y = values
+        if x != x or y != y:
+            return
+        delta_y = y - self._y.mean
+        self._x.remove(x)
+        self._y.remove(y)
+        self._comoment = self._comoment - (x - self._x.mean) * delta_y if self._x.count else 0.0
+        self._x_extremes.remove(seq)
+        self._y_extremes.remove(seq)
+
+
+def rolling_stats(dataframe: pd.DataFrame, column: str, window: Union[int, str, pd.Timedelta, None] = None,
+                  stats: Sequence[str] = ROLLING_STATS, min_periods: Optional[int] = None,
+                  on: Optional[str] = None) -> pd.DataFrame:
+    """
+    Calcule des statistiques glissantes d'une colonne (moyenne, écart-type, médiane).
+
+    Le calcul utilise les noyaux incrémentaux de `pandas` (sommes glissantes compensées,
+    médiane par skiplist) : chaque ligne coûte O(1) ou O(log n), quelle que soit la taille
+    de la fenêtre. Pour un flux mis à jour ligne par ligne, utilisez `RollingStats`.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        column (str): Le nom de la colonne.
+        window (Union[int, str, pd.Timedelta, None], optional): Le nombre de lignes de la fenêtre,
+            une durée ('5min'...) ou None pour des statistiques cumulatives.
+        stats (Sequence[str], optional): Les statistiques parmi 'mean', 'std' et 'median'.
+        min_periods (int, optional): Le nombre minimal de valeurs renseignées par fenêtre.
+        on (str, optional): La colonne d'horodatages d'une fenêtre temporelle (par défaut l'index).
+
+    Returns:
+        pd.DataFrame: Une colonne par statistique, avec l'index du DataFrame.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si la colonne n'est pas numérique, si une statistique ou la fenêtre est invalide.
+    """
+    unknown_stats = [stat for stat in stats if stat not in ROLLING_STATS]
+    if unknown_stats:
+        raise ValueError(f"Statistiques non supportées : {unknown_stats}. Choisissez parmi {list(ROLLING_STATS)}.")
+    series, = _prepare(dataframe, [column], on)
+    roller = _window(series, window, min_periods)
+    return pd.DataFrame({stat: getattr(roller, stat)().to_numpy() for stat in stats}, index=dataframe.index)
+
+
+def rolling_correlation(dataframe: pd.DataFrame, col1: str, col2: str,
+                        window: Union[int, str, pd.Timedelta, None] = None, min_periods: Optional[int] = None,
+                        on: Optional[str] = None) -> pd.Series:
+    """
+    Calcule la corrélation glissante entre deux colonnes.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        col1 (str): Le nom de la première colonne.
+        col2 (str): Le nom de la deuxième colonne.
+        window (Union[int, str, pd.Timedelta, None], optional): La fenêtre (voir `rolling_stats`).
+        min_periods (int, optional): Le nombre minimal de paires complètes par fenêtre.
+        on (str, optional): La colonne d'horodatages d'une fenêtre temporelle (par défaut l'index).
+
+    Returns:
+        pd.Series: La corrélation de chaque fenêtre, avec l'index du DataFrame.
+
+    Raises:
+        KeyError: Si l'une des colonnes spécifiées n'existe pas dans le DataFrame.
+        ValueError: Si l'une des colonnes n'est pas numérique ou si la fenêtre est invalide.
+    """
+    series1, series2 = _prepare(dataframe, [col1, col2], on)
+    correlation = _window(series1, window, min_periods).corr(series2).to_numpy(copy=True)
+
+    # Même garde que `RollingCorrelation` : NaN si l'une des colonnes est constante sur les
+    # paires complètes de la fenêtre (pandas retournerait ±inf par arrondi), bornes [-1, 1].
+    complete = series1.notna() & series2.notna()
+    for series in (series1, series2):
+        roller = _window(series.where(complete), window, min_periods)
+        constant = (roller.max() == roller.min()).to_numpy()
+        correlation[constant] = np.nan
+    correlation[~np.isfinite(correlation)] = np.nan
+    return pd.Series(np.clip(correlation, -1.0, 1.0), index=dataframe.index)
+
+
+def _prepare(dataframe, columns, on):
+    for column in columns + ([on] if on is not None else []):
+        if column not in dataframe.columns:
+            raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+    prepared = []
+    for column in columns:
+        if not pd.api.types.is_numeric_dtype(dataframe[column]):
+            raise ValueError(f"La colonne '{column}' doit être numérique.")
+        series = dataframe[column].astype(np.float64)
+        if on is not None:
+            series.index = pd.DatetimeIndex(dataframe[on])
+        prepared.append(series)
+    return prepared
+
+
+def _window(series, window, min_periods):
+    if window is None:
+        return series.expanding(min_periods=1 if min_periods is None else min_periods)
+    try:
+        return series.rolling(window, min_periods=min_periods)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Fenêtre invalide : {e}")
@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+from typing import Iterable, Optional, Sequence, Union
+
+# Rapport entre les capacités de deux niveaux successifs d'un sketch KLL.
+_KLL_DECAY = 2 / 3
+# Nombre de valeurs traitées à la fois par `update` : la mémoire de travail reste bornée
+# quelle que soit la taille des données fournies.
+_UPDATE_BLOCK = 1 << 16
+
+
+class QuantileSketch:
+    """
+    Sketch de quantiles KLL (Karnin, Lang, Liberty) : quantiles approchés en mémoire bornée.
+
+    Les valeurs sont conservées dans une hiérarchie de compacteurs. Lorsqu'un niveau est plein,
+    il est trié et une valeur sur deux (avec un décalage aléatoire) est promue au niveau
+    supérieur, où elle compte double. La mémoire utilisée est en O(k log(n / k)) avec
+    k ≈ 1.7 / error, et l'erreur sur le rang d'un quantile est de l'ordre de `error` avec
+    une forte probabilité. Deux sketches peuvent être fusionnés, ce qui permet de les
+    calculer par blocs ou dans des processus différents.
+
+    Args:
+        error (float, optional): L'erreur de rang visée, entre 0 et 1 (par défaut 0.01).
+        seed (int, optional): La graine du générateur aléatoire, pour des résultats reproductibles.
+
+    Raises:
+        ValueError: Si `error` n'est pas compris strictement entre 0 et 1.
+    """
+
+    def __init__(self, error: float = 0.01, seed: Optional[int] = None):
+        if not 0 < error < 1:
+            raise ValueError("L'erreur visée doit être comprise strictement entre 0 et 1.")
+        self.error = error
+        self.k = max(8, int(np.ceil(1.7 / error)))
+        self.count = 0
+        self.min = float("nan")
+        self.max = float("nan")
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: Union[pd.Series, np.ndarray, Iterable[float]]) -> "QuantileSketch":
+        """
+        Ajoute des valeurs au sketch (les valeurs manquantes sont ignorées).
+
+        Les valeurs sont converties et compactées par tranches de taille fixe : la mémoire de
+        travail est celle d'une tranche et du sketch, pas celle de toutes les valeurs.
+
+        Returns:
+            QuantileSketch: Le sketch lui-même.
+
+        Raises:
+            ValueError: Si les valeurs ne sont pas numériques.
+        """
+        if isinstance(values, pd.Series):
+            if not pd.api.types.is_numeric_dtype(values):
+                raise ValueError("Les valeurs doivent être numériques.")
+            slices = (values.iloc[start:start + _UPDATE_BLOCK].to_numpy(dtype=np.float64, na_value=np.nan)
+                      for start in range(0, len(values), _UPDATE_BLOCK))
+        else:
+            values = np.asarray(values)
+            if values.dtype.kind not in "biuf":
+                raise ValueError("Les valeurs doivent être numériques.")
+            values = values.ravel()
+            slices = (values[start:start + _UPDATE_BLOCK].astype(np.float64, copy=False)
+                      for start in range(0, len(values), _UPDATE_BLOCK))
+
+        for block in slices:
+            block = block[~np.isnan(block)]
+            if len(block) == 0:
+                continue
+            self._track(len(block), block.min(), block.max())
+            self._levels[0] = np.concatenate((self._levels[0], block))
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Fusionne un autre sketch dans celui-ci (par exemple celui d'un autre processus).
+
+        Returns:
+            QuantileSketch: Le sketch lui-même.
+        """
+        if other.count == 0:
+            return self
+        self._track(other.count, other.min, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for height, level in enumerate(other._levels):
+            self._levels[height] = np.concatenate((self._levels[height], level))
+        self._compress()
+        return self
+
+    def quantile(self, q: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+        """
+        Retourne le ou les quantiles approchés.
+
+        Args:
+            q (Union[float, Sequence[float]]): Un ou plusieurs ordres de quantile entre 0 et 1.
+
+        Returns:
+            Union[float, np.ndarray]: Le quantile (ou un tableau de quantiles), NaN si le sketch est vide.
+
+        Raises:
+            ValueError: Si un ordre de quantile n'est pas compris entre 0 et 1.
+        """
+        levels = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if np.any((levels < 0) | (levels > 1)):
+            raise ValueError("Les ordres de quantile doivent être compris entre 0 et 1.")
+        if self.count == 0:
+            result = np.full(levels.shape, np.nan)
+        else:
+            items = np.concatenate(self._levels)
+            weights = np.concatenate([np.full(len(level), 2.0 ** height)
+                                      for height, level in enumerate(self._levels)])
+            order = np.argsort(items, kind="stable")
+            items, cumulative = items[order], np.cumsum(weights[order])
+            positions = np.searchsorted(cumulative, levels * cumulative[-1], side="left")
+            result = items[np.minimum(positions, len(items) - 1)]
+            result = np.where(levels == 0, self.min, np.where(levels == 1, self.max, result))
+        return float(result[0]) if np.ndim(q) == 0 else result
+
+    def median(self) -> float:
+        """Retourne la médiane approchée."""
+        return self.quantile(0.5)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _track(self, count, low, high):
+        self.count += int(count)
+        self.min = float(low) if np.isnan(self.min) else min(self.min, float(low))
+        self.max = float(high) if np.isnan(self.max) else max(self.max, float(high))
+
+    def _capacity(self, height):
+        depth = len(self._levels) - 1 - height
+        return max(2, int(np.ceil(self.k * _KLL_DECAY ** depth)))
+
+    def _compress(self):
+        height = 0
+        while height < len(self._levels):
+            level = self._levels[height]
+            if len(level) > self._capacity(height):
+                if height + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                level = np.sort(level)
+                # Avec un nombre impair de valeurs, la plus grande reste à ce niveau.
+                kept = level[len(level) - len(level) % 2:]
+                promoted = level[:len(level) - len(kept)][self._rng.integers(2)::2]
+                self._levels[height + 1] = np.concatenate((self._levels[height + 1], promoted))
+                self._levels[height] = kept
+            height += 1
+
+
+class TopKSketch:
+    """
+    Sketch Space-Saving des valeurs les plus fréquentes, en mémoire bornée.
+
+    Au plus `capacity` compteurs sont conservés. Chaque compteur surestime la fréquence réelle
+    de sa valeur d'au plus `errors[valeur]`, erreur elle-même bornée par n / capacity pour un
+    flux de n valeurs : toute valeur plus fréquente que n / capacity est donc garantie d'être
+    présente. Les blocs sont comptés de façon vectorisée puis fusionnés selon la règle des
+    résumés fusionnables, ce qui permet aussi de fusionner des sketches de processus différents.
+
+    Args:
+        capacity (int, optional): Le nombre maximal de compteurs (par défaut 1000).
+
+    Raises:
+        ValueError: Si `capacity` n'est pas un entier positif.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("La capacité du sketch doit être un entier positif.")
+        self.capacity = capacity
+        self.count = 0
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        # Majorant de la fréquence d'une valeur absente des compteurs.
+        self._bound = 0
+
+    def update(self, values: Union[pd.Series, np.ndarray, Iterable]) -> "TopKSketch":
+        """
+        Ajoute des valeurs au sketch (les valeurs manquantes sont ignorées).
+
+        Les valeurs sont comptées par tranches de taille fixe, chaque tranche étant réduite à
+        `capacity` compteurs puis fusionnée : la mémoire de travail est bornée par la taille
+        d'une tranche, et non par le nombre de valeurs distinctes.
+
+        Returns:
+            TopKSketch: Le sketch lui-même.
+        """
+        if not isinstance(values, (pd.Series, np.ndarray)):
+            values = pd.Series(values)
+        for start in range(0, len(values), _UPDATE_BLOCK):
+            block = values[start:start + _UPDATE_BLOCK]
+            chunk_counts = (block if isinstance(block, pd.Series) else pd.Series(block)).value_counts(
+                dropna=True, sort=False)
+            chunk_counts = chunk_counts[chunk_counts > 0]
+            if isinstance(chunk_counts.index, pd.CategoricalIndex):
+                chunk_counts.index = chunk_counts.index.astype(chunk_counts.index.categories.dtype)
+            chunk = TopKSketch(self.capacity)
+            chunk.count = int(chunk_counts.sum())
+            chunk.counts = chunk_counts.astype(np.int64)
+            chunk.errors = pd.Series(0, index=chunk_counts.index, dtype=np.int64)
+            chunk._truncate()
+            self.merge(chunk)
+        return self
+
+    def merge(self, other: "TopKSketch") -> "TopKSketch":
+        """
+        Fusionne un autre sketch dans celui-ci.
+
+        Returns:
+            TopKSketch: Le sketch lui-même.
+        """
+        if other.count == 0:
+            return self
+        index = self.counts.index.union(other.counts.index, sort=False)
+        self.counts = (self.counts.reindex(index, fill_value=self._bound)
+                       + other.counts.reindex(index, fill_value=other._bound))
+        self.errors = (self.errors.reindex(index, fill_value=self._bound)
+                       + other.errors.reindex(index, fill_value=other._bound))
+        self.count += other.count
+        self._bound += other._bound
+        self._truncate()
+        return self
+
+    def top(self, k: Optional[int] = None) -> pd.Series:
+        """
+        Retourne les `k` valeurs les plus fréquentes et leur fréquence estimée (majorant).
+
+        Les ex aequo sont départagés par valeur croissante, comme `calculate_mode`.
+        """
+        counts = self.counts
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            pass
+        counts = counts.sort_values(ascending=False, kind="stable")
+        return counts if k is None else counts.iloc[:k]
+
+    def mode(self):
+        """Retourne la valeur la plus fréquente, ou None si le sketch est vide."""
+        top = self.top(1)
+        return None if top.empty else top.index[0]
+
+    def _truncate(self):
+        if len(self.counts) <= self.capacity:
+            return
+        order = np.argsort(-self.counts.to_numpy(), kind="stable")
+        dropped = self.counts.iloc[order[self.capacity]]
+        kept = order[:self.capacity]
+        self.counts = self.counts.iloc[kept]
+        self.errors = self.errors.iloc[kept]
+        self._bound = max(self._bound, int(dropped))
@@ -1,43 +1,233 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from scipy.stats import ttest_ind, chi2_contingency
-from typing import Union, Dict, Any
+from scipy.stats import t as student_t
+from scipy.stats import chi2 as chi2_distribution
+from typing import Union, Dict, Any, List, Optional, Sequence
+
+from .basic_stats import _group_codes
+from .stats_cache import memoize_stat
+
+# Méthodes de correction du taux de fausses découvertes.
+FDR_METHODS = ("bh", "by")
 
-def t_test(group1: pd.Series, group2: pd.Series) -> Dict[str, Union[float, None]]:
+@memoize_stat
+def t_test(group1: pd.Series, group2: pd.Series, equal_var: bool = True) -> Dict[str, Union[float, None]]:
     """
     Effectue un test t pour deux groupes indépendants afin de comparer leurs moyennes.
+
+    Les groupes étant indépendants, ils peuvent avoir des tailles différentes.
     
     Args:
         group1 (pd.Series): Les données du premier groupe.
         group2 (pd.Series): Les données du deuxième groupe.
+        equal_var (bool, optional): Si True, test de Student à variance commune ; sinon test
+            de Welch (par défaut True).
     
     Returns:
         Dict[str, Union[float, None]]: Un dictionnaire contenant la statistique du test et la p-valeur.
     
     Raises:
-        ValueError: Si les deux groupes n'ont pas le même nombre d'éléments ou contiennent des valeurs non numériques.
+        ValueError: Si les groupes contiennent des valeurs non numériques.
     """
     # Vérification que les groupes contiennent des valeurs numériques
     if not pd.api.types.is_numeric_dtype(group1) or not pd.api.types.is_numeric_dtype(group2):
         raise ValueError("Les groupes doivent contenir des données numériques.")
     
-    # Vérification que les groupes ont la même taille
-    if len(group1) != len(group2):
-        raise ValueError("Les deux groupes doivent avoir le même nombre d'éléments.")
-    
-    stat, p_value = ttest_ind(group1, group2)
+    stat, p_value = ttest_ind(group1, group2, equal_var=equal_var)
     return {"statistic": stat, "p_value": p_value}
 
-def chi_square_test(dataframe: pd.DataFrame, col1: str, col2: str) -> Dict[str, Any]:
+
+def t_test_from_summary(n1, mean1, var1, n2, mean2, var2, equal_var: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Effectue des tests t à partir de résumés (effectif, moyenne, variance) déjà agrégés.
+
+    Tous les arguments peuvent être des tableaux de même forme : les tests sont alors calculés
+    en une seule opération vectorisée. Les variances sont des variances d'échantillon (ddof=1).
+    Un test est NaN si l'un des groupes a moins de deux valeurs ou si l'erreur type est nulle.
+
+    Args:
+        n1, mean1, var1: L'effectif, la moyenne et la variance du premier groupe.
+        n2, mean2, var2: L'effectif, la moyenne et la variance du second groupe.
+        equal_var (bool, optional): Si True, test de Student à variance commune ; sinon test
+            de Welch (par défaut False).
+
+    Returns:
+        Dict[str, np.ndarray]: La statistique ('statistic'), la p-valeur bilatérale ('p_value')
+        et les degrés de liberté ('df') de chaque test.
+    """
+    n1, mean1, var1, n2, mean2, var2 = (np.asarray(value, dtype=np.float64)
+                                        for value in (n1, mean1, var1, n2, mean2, var2))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if equal_var:
+            df = n1 + n2 - 2
+            pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / df
+            standard_error = np.sqrt(pooled * (1 / n1 + 1 / n2))
+        else:
+            share1, share2 = var1 / n1, var2 / n2
+            standard_error = np.sqrt(share1 + share2)
+            df = (share1 + share2) ** 2 / (share1 ** 2 / (n1 - 1) + share2 ** 2 / (n2 - 1))
+        statistic = (mean1 - mean2) / standard_error
+        invalid = (n1 < 2) | (n2 < 2) | ~(standard_error > 0)
+        statistic = np.where(invalid, np.nan, statistic)
+        df = np.where(invalid, np.nan, df)
+        p_value = 2 * student_t.sf(np.abs(statistic), df)
+    return {"statistic": statistic, "p_value": p_value, "df": df}
+
+
+def batch_t_test(dataframe: pd.DataFrame, group: str, metrics: Optional[List[str]] = None,
+                 groups: Optional[Sequence] = None, by: Optional[Union[str, List[str]]] = None,
+                 equal_var: bool = False, fdr: Optional[str] = None) -> pd.DataFrame:
+    """
+    Compare deux groupes sur de nombreuses métriques (et segments) en une seule passe vectorisée.
+
+    Les effectifs, moyennes et variances de chaque (segment, groupe) sont calculés pour toutes
+    les métriques à la fois par des produits creux « cellule × ligne », puis les tests sont
+    obtenus par `t_test_from_summary`. Les valeurs manquantes sont ignorées métrique par métrique.
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les métriques et les étiquettes de groupe.
+        group (str): La colonne contenant l'étiquette de groupe (ex. : 'A' / 'B').
+        metrics (Optional[List[str]]): Les métriques à tester (par défaut toutes les colonnes
+            numériques autres que le groupe et les segments).
+        groups (Optional[Sequence]): Les deux étiquettes à comparer, dans l'ordre (premier moins
+            second). Par défaut les deux étiquettes présentes, triées.
+        by (Optional[Union[str, List[str]]]): Les colonnes de segment : un test par segment et par métrique.
+        equal_var (bool, optional): Si True, test de Student ; sinon test de Welch (par défaut False).
+        fdr (Optional[str]): Correction du taux de fausses découvertes appliquée à l'ensemble des
+            tests : 'bh' (Benjamini-Hochberg) ou 'by' (Benjamini-Yekutieli).
+
+    Returns:
+        pd.DataFrame: Une ligne par métrique (ou par segment et métrique) avec les colonnes
+        'n1', 'n2', 'mean1', 'mean2', 'statistic', 'p_value', 'df' et, si `fdr` est fourni, 'p_adjusted'.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une métrique n'est pas numérique, si les groupes ne sont pas exactement
+            deux ou si la méthode de correction est inconnue.
+    """
+    segments = [] if by is None else ([by] if isinstance(by, str) else list(by))
+    if metrics is None:
+        metrics = [col for col in dataframe.select_dtypes(include="number").columns
+                   if col != group and col not in segments]
+    missing_columns = [col for col in [group] + segments + list(metrics) if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    non_numeric_columns = [col for col in metrics if not pd.api.types.is_numeric_dtype(dataframe[col])]
+    if non_numeric_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas numériques : {non_numeric_columns}")
+    if fdr is not None and fdr not in FDR_METHODS:
+        raise ValueError(f"Correction non supportée : choisissez parmi {list(FDR_METHODS)}.")
+    if groups is None:
+        groups = sorted(dataframe[group].dropna().unique())
+    if len(groups) != 2:
+        raise ValueError(f"Le test compare exactement deux groupes : {list(groups)}.")
+
+    labels = dataframe[group].to_numpy()
+    is_second = labels == groups[1]
+    in_test = (labels == groups[0]) | is_second
+    if segments:
+        segment_codes, segment_index = _group_codes(dataframe, segments)
+        in_test &= segment_codes >= 0
+    else:
+        segment_codes, segment_index = np.zeros(len(dataframe), dtype=np.int64), None
+    segment_count = 1 if segment_index is None else len(segment_index)
+
+    # Cellule (segment, groupe) de chaque ligne, puis matrice creuse d'appartenance cellule × ligne.
+    rows = np.flatnonzero(in_test)
+    cells = segment_codes[rows] * 2 + is_second[rows]
+    membership = sparse.csr_matrix((np.ones(len(rows)), (cells, np.arange(len(rows)))),
+                                   shape=(2 * segment_count, len(rows)))
+    values = dataframe[list(metrics)].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        count = membership @ present.astype(np.float64)
+        mean = (membership @ filled) / count
+        deviations = np.where(present, values - mean[cells], 0.0)
+        variance = (membership @ (deviations * deviations)) / (count - 1)
+
+    first, second = slice(0, None, 2), slice(1, None, 2)
+    result = t_test_from_summary(count[first], mean[first], variance[first],
+                                 count[second], mean[second], variance[second], equal_var=equal_var)
+    columns = {
+        "n1": count[first], "n2": count[second], "mean1": mean[first], "mean2": mean[second],
+        "statistic": result["statistic"], "p_value": result["p_value"], "df": result["df"],
+    }
+    if fdr is not None:
+        columns["p_adjusted"] = fdr_correction(result["p_value"].ravel(), method=fdr).reshape(count[first].shape)
+
+    if segment_index is None:
+        index = pd.Index(list(metrics), name="metric")
+    else:
+        index = pd.MultiIndex.from_arrays(
+            [np.repeat(segment_index.get_level_values(i), len(metrics)) for i in range(segment_index.nlevels)]
+            + [np.tile(list(metrics), segment_count)],
+            names=list(segments) + ["metric"])
+    table = pd.DataFrame({name: np.asarray(value).ravel() for name, value in columns.items()}, index=index)
+    table[["n1", "n2"]] = table[["n1", "n2"]].astype(np.int64)
+    return table
+
+
+def fdr_correction(p_values, method: str = "bh") -> np.ndarray:
+    """
+    Ajuste des p-valeurs pour contrôler le taux de fausses découvertes.
+
+    Args:
+        p_values: Les p-valeurs des tests (les NaN sont conservés et ignorés).
+        method (str, optional): 'bh' (Benjamini-Hochberg, tests indépendants ou positivement
+            corrélés) ou 'by' (Benjamini-Yekutieli, dépendance quelconque). Par défaut 'bh'.
+
+    Returns:
+        np.ndarray: Les p-valeurs ajustées, dans l'ordre des p-valeurs fournies.
+
+    Raises:
+        ValueError: Si la méthode est inconnue.
+    """
+    if method not in FDR_METHODS:
+        raise ValueError(f"Correction non supportée : choisissez parmi {list(FDR_METHODS)}.")
+    p_values = np.asarray(p_values, dtype=np.float64)
+    adjusted = np.full(p_values.shape, np.nan)
+    tested = np.flatnonzero(~np.isnan(p_values))
+    count = len(tested)
+    if count == 0:
+        return adjusted
+    order = tested[np.argsort(p_values[tested])]
+    scale = count / np.arange(1, count + 1)
+    if method == "by":
+        scale = scale * np.sum(1.0 / np.arange(1, count + 1))
+    # Minimum cumulé depuis la plus grande p-valeur : les ajustements restent monotones.
+    ranked = np.minimum.accumulate((p_values[order] * scale)[::-1])[::-1]
+    adjusted[order] = np.minimum(ranked, 1.0)
+    return adjusted
+
+def chi_square_test(dataframe: pd.DataFrame, col1: str, col2: str, sparse_table: bool = True) -> Dict[str, Any]:
     """
     Effectue un test du chi-carré entre deux colonnes catégoriques d'un DataFrame.
+
+    La table de contingence est construite par factorisation des deux colonnes et comptage
+    des couples de codes (`_contingency`) ; elle reste creuse. La statistique est calculée sur
+    les seules cellules non vides par chi2 = N (Σ O² / (r_i c_j) - 1), sans jamais construire
+    la table dense, ce qui permet de tester deux colonnes de dizaines de milliers de modalités.
+    Les tables denses ne sont construites que sur demande (`sparse_table=False`).
     
     Args:
         dataframe (pd.DataFrame): Le DataFrame contenant les données.
         col1 (str): Le nom de la première colonne catégorique.
         col2 (str): Le nom de la deuxième colonne catégorique.
+        sparse_table (bool, optional): Si False, la table attendue complète est retournée sous
+            forme de tableau dense, comme `scipy.stats.chi2_contingency` (par défaut True : tables
+            creuses).
     
     Returns:
         Dict[str, Any]: Un dictionnaire contenant les résultats du test (statistique chi2, p-valeur, degrés de liberté, et valeurs attendues).
+        En mode creux, 'expected' ne contient les effectifs attendus que pour les cellules
+        observées non vides (la table complète vaut outer(r, c) / N), et le dictionnaire contient
+        aussi 'observed', 'row_totals', 'col_totals' ainsi que les modalités ('rows', 'columns').
     
     Raises:
         KeyError: Si l'une ou l'autre des colonnes spécifiées n'existe pas dans le DataFrame.
@@ -47,21 +237,146 @@ def chi_square_test(dataframe: pd.DataFrame, col1: str, col2: str) -> Dict[str,
     if col1 not in dataframe.columns or col2 not in dataframe.columns:
         raise KeyError(f"Les colonnes '{col1}' et/ou '{col2}' n'existent pas dans le DataFrame.")
     
-    # Vérification que les colonnes sont catégorielles (types object ou category)
-    if not pd.api.types.is_categorical_dtype(dataframe[col1]) and not pd.api.types.is_object_dtype(dataframe[col1]):
+    # Vérification que les colonnes sont catégorielles (types object, string ou category)
+    if not _is_categorical_column(dataframe[col1]):
         raise ValueError(f"La colonne '{col1}' doit être catégorielle (type 'object' ou 'category').")
     
-    if not pd.api.types.is_categorical_dtype(dataframe[col2]) and not pd.api.types.is_object_dtype(dataframe[col2]):
+    if not _is_categorical_column(dataframe[col2]):
         raise ValueError(f"La colonne '{col2}' doit être catégorielle (type 'object' ou 'category').")
     
-    # Création de la table de contingence
-    contingency_table = pd.crosstab(dataframe[col1], dataframe[col2])
-    
-    # Test du chi-carré
-    chi2, p, dof, expected = chi2_contingency(contingency_table)
+    # Création de la table de contingence (creuse) et test du chi-carré
+    observed, rows, columns = _contingency(dataframe[col1], dataframe[col2])
+    chi2, p, dof = _chi2_from_table(observed)
+    row_totals = np.asarray(observed.sum(axis=1)).ravel()
+    col_totals = np.asarray(observed.sum(axis=0)).ravel()
+
+    if not sparse_table:
+        # Table attendue dense, sur les modalités observées (comme `chi2_contingency`).
+        used_rows, used_columns = row_totals > 0, col_totals > 0
+        expected = np.outer(row_totals[used_rows], col_totals[used_columns]) / row_totals.sum()
+        return {
+            "chi2": chi2,
+            "p_value": p,
+            "dof": dof,
+            "expected": expected
+        }
+
+    cells = observed.tocoo()
+    expected = sparse.csr_matrix((row_totals[cells.row] * col_totals[cells.col] / cells.data.sum(),
+                                  (cells.row, cells.col)), shape=observed.shape)
     return {
         "chi2": chi2,
         "p_value": p,
         "dof": dof,
-        "expected": expected
+        "expected": expected,
+        "observed": observed,
+        "row_totals": row_totals,
+        "col_totals": col_totals,
+        "rows": rows,
+        "columns": columns
     }
+
+
+def batch_chi_square_test(dataframe: pd.DataFrame, target: str, candidates: Optional[List[str]] = None,
+                          fdr: Optional[str] = None, n_jobs: Optional[int] = None) -> pd.DataFrame:
+    """
+    Teste l'indépendance d'une colonne cible avec de nombreuses colonnes candidates en un seul appel.
+
+    La cible n'est factorisée qu'une fois ; pour chaque candidate, les couples de codes sont
+    comptés en table creuse et la statistique est calculée sans table dense (voir `chi_square_test`).
+
+    Args:
+        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        target (str): La colonne catégorique cible.
+        candidates (Optional[List[str]]): Les colonnes à tester (par défaut toutes les autres
+            colonnes catégorielles).
+        fdr (Optional[str]): Correction du taux de fausses découvertes : 'bh' ou 'by' (voir `fdr_correction`).
+        n_jobs (Optional[int]): Le nombre de threads traitant les candidates (-1 pour tous les cœurs).
+
+    Returns:
+        pd.DataFrame: Une ligne par candidate avec les colonnes 'chi2', 'p_value', 'dof', 'n'
+        (effectif utilisé) et, si `fdr` est fourni, 'p_adjusted'.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans le DataFrame.
+        ValueError: Si une colonne n'est pas catégorielle ou si la méthode de correction est inconnue.
+    """
+    if candidates is None:
+        candidates = [col for col in dataframe.columns if col != target and _is_categorical_column(dataframe[col])]
+    missing_columns = [col for col in [target] + list(candidates) if col not in dataframe.columns]
+    if missing_columns:
+        raise KeyError(f"Les colonnes suivantes n'existent pas dans le DataFrame : {missing_columns}")
+    non_categorical_columns = [col for col in [target] + list(candidates)
+                               if not _is_categorical_column(dataframe[col])]
+    if non_categorical_columns:
+        raise ValueError(f"Les colonnes suivantes ne sont pas catégorielles : {non_categorical_columns}")
+    if fdr is not None and fdr not in FDR_METHODS:
+        raise ValueError(f"Correction non supportée : choisissez parmi {list(FDR_METHODS)}.")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    target_codes, target_levels = pd.factorize(dataframe[target], sort=True)
+
+    def test(candidate):
+        candidate_codes, candidate_levels = pd.factorize(dataframe[candidate], sort=True)
+        observed = _count_pairs(target_codes, len(target_levels), candidate_codes, len(candidate_levels))
+        return _chi2_from_table(observed) + (int(observed.sum()),)
+
+    if n_jobs is None or n_jobs == 1 or len(candidates) <= 1:
+        results = [test(candidate) for candidate in candidates]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(test, candidates))
+
+    table = pd.DataFrame(results, columns=["chi2", "p_value", "dof", "n"],
+                         index=pd.Index(list(candidates), name="candidate"))
+    if fdr is not None:
+        table["p_adjusted"] = fdr_correction(table["p_value"].to_numpy(), method=fdr)
+    return table
+
+
+def _contingency(series1: pd.Series, series2: pd.Series):
+    """Table de contingence creuse de deux colonnes, avec les modalités (triées) de chacune."""
+    codes1, levels1 = pd.factorize(series1, sort=True)
+    codes2, levels2 = pd.factorize(series2, sort=True)
+    return _count_pairs(codes1, len(levels1), codes2, len(levels2)), pd.Index(levels1), pd.Index(levels2)
+
+
+def _count_pairs(codes1: np.ndarray, size1: int, codes2: np.ndarray, size2: int) -> sparse.csr_matrix:
+    """Compte les couples de codes (les valeurs manquantes, codées -1, sont ignorées)."""
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    # Tri de la clé combinée puis longueurs des séries : aucune table dense size1 × size2.
+    keys = np.sort(codes1[valid].astype(np.int64) * size2 + codes2[valid])
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else np.empty(0, np.intp)
+    counts = np.diff(np.append(starts, len(keys)))
+    cells = keys[starts]
+    return sparse.csr_matrix((counts, (cells // size2, cells % size2)), shape=(size1, size2))
+
+
+def _chi2_from_table(observed: sparse.csr_matrix):
+    """Statistique, p-valeur et degrés de liberté d'une table creuse, comme `chi2_contingency`."""
+    row_totals = np.asarray(observed.sum(axis=1), dtype=np.float64).ravel()
+    col_totals = np.asarray(observed.sum(axis=0), dtype=np.float64).ravel()
+    # Les modalités sans observation n'entrent pas dans la table.
+    rows, columns = row_totals > 0, col_totals > 0
+    dof = (int(rows.sum()) - 1) * (int(columns.sum()) - 1)
+    if dof <= 0:
+        return 0.0, 1.0, 0
+    if dof == 1:
+        # Table 2 × 2 : correction de continuité de Yates, appliquée par `chi2_contingency`.
+        chi2, p, dof, _ = chi2_contingency(observed[rows][:, columns].toarray())
+        return float(chi2), float(p), int(dof)
+    cells = observed.tocoo()
+    total = cells.data.sum()
+    ratio = (cells.data.astype(np.float64) ** 2 / (row_totals[cells.row] * col_totals[cells.col])).sum()
+    chi2 = max(float(total * (ratio - 1)), 0.0)
+    return chi2, float(chi2_distribution.sf(chi2, dof)), dof
+
+
+def _is_categorical_column(series: pd.Series) -> bool:
+    dtype = series.dtype
+    return (
+        isinstance(dtype, pd.CategoricalDtype)
+        or pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+    )
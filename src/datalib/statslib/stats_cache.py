@@ -0,0 +1,262 @@
+import functools
+import hashlib
+import inspect
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Marqueur des colonnes dans les clés du cache.
+_COLUMN = "<column>"
+
+
+class StatsCache:
+    """
+    Cache LRU des résultats des fonctions statistiques de `statslib`.
+
+    La clé d'un résultat combine le nom de la fonction, ses arguments scalaires et, pour chaque
+    colonne utilisée, une empreinte :
+
+    - par défaut, l'identité des données : tableau propriétaire de la mémoire, position,
+      forme et type. Un succès coûte O(1). Le cache garde une référence faible vers chaque
+      tableau et oublie ses résultats dès qu'il est libéré : une adresse réutilisée ne peut
+      pas retrouver un ancien résultat. Une modification en place (`df.loc[i, col] = v`) ne
+      change pas l'identité : appelez alors `invalidate(df)`.
+    - avec `hash_content=True`, le contenu complet : condensé SHA-1 de toutes les valeurs,
+      lu directement dans la mémoire des données. Toute modification, même en place, produit
+      une nouvelle clé, mais chaque appel (succès compris) relit toute la colonne.
+
+    Args:
+        maxsize (int, optional): Le nombre maximal de résultats conservés (par défaut 1024).
+        hash_content (bool, optional): Si True, les colonnes sont identifiées par leur contenu
+            (par défaut False).
+
+    Raises:
+        ValueError: Si `maxsize` n'est pas un entier positif.
+    """
+
+    def __init__(self, maxsize: int = 1024, hash_content: bool = False):
+        if maxsize <= 0:
+            raise ValueError("La taille du cache doit être un entier positif.")
+        self.maxsize = maxsize
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._owners = {}
+        # Réentrant : la libération d'un tableau (et donc `_forget`) peut survenir pendant
+        # une opération du cache dans le même thread.
+        self._lock = threading.RLock()
+
+    def fingerprint(self, series: pd.Series):
+        """Retourne l'empreinte d'une colonne dans les clés du cache, ou None si elle n'est pas cacheable."""
+        if self.hash_content:
+            return _fingerprint(series)
+        owner, token = _identity(series)
+        with self._lock:
+            reference = self._owners.get(id(owner))
+            if reference is None or reference() is not owner:
+                try:
+                    self._owners[id(owner)] = weakref.ref(owner, functools.partial(_forget, weakref.ref(self), id(owner)))
+                except TypeError:
+                    # Objet sans référence faible possible : sa durée de vie ne peut être suivie.
+                    return None
+        return token
+
+    def get(self, key):
+        """Retourne `(True, valeur)` si la clé est en cache, `(False, None)` sinon."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """Ajoute un résultat et évince les moins récemment utilisés au-delà de `maxsize`."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, data=None):
+        """
+        Supprime des résultats du cache.
+
+        Args:
+            data (pd.DataFrame or pd.Series, optional): Si fourni, seuls les résultats calculés
+                sur les colonnes de ces données sont supprimés ; sinon tout le cache est vidé.
+        """
+        with self._lock:
+            if data is None:
+                self._entries.clear()
+                return
+            columns = [data[col] for col in data.columns] if isinstance(data, pd.DataFrame) else [data]
+            fingerprints = {_fingerprint(series) if self.hash_content else _identity(series)[1] for series in columns}
+            self._discard(lambda tokens: fingerprints & tokens)
+
+    def _discard(self, predicate):
+        with self._lock:
+            for key in [key for key in self._entries if predicate(_key_fingerprints(key))]:
+                del self._entries[key]
+
+    def info(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache : succès, échecs, taille et taille maximale."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_cache: Optional[StatsCache] = None
+
+
+def enable_stats_cache(maxsize: int = 1024, hash_content: bool = False) -> StatsCache:
+    """
+    Active le cache des fonctions statistiques et le retourne.
+
+    Args:
+        maxsize (int, optional): Le nombre maximal de résultats conservés (par défaut 1024).
+        hash_content (bool, optional): Si True, les colonnes sont identifiées par leur contenu
+            complet plutôt que par leur identité (voir `StatsCache`).
+
+    Returns:
+        StatsCache: Le cache actif (un nouveau cache vide).
+    """
+    global _cache
+    _cache = StatsCache(maxsize, hash_content=hash_content)
+    return _cache
+
+
+def disable_stats_cache() -> None:
+    """Désactive le cache des fonctions statistiques et libère ses résultats."""
+    global _cache
+    _cache = None
+
+
+def get_stats_cache() -> Optional[StatsCache]:
+    """Retourne le cache actif, ou None si le cache est désactivé."""
+    return _cache
+
+
+def _identity(series: pd.Series):
+    """Retourne le tableau propriétaire des données de `series` et l'empreinte d'identité de la colonne."""
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        owner = values
+        while isinstance(owner.base, np.ndarray):
+            owner = owner.base
+        location = (values.__array_interface__["data"][0], values.strides)
+    else:
+        # Tableaux d'extension (texte, catégories...) : l'objet tableau porte les données.
+        owner = series.array
+        location = ()
+    return owner, ("id", id(owner), location, len(series), str(series.dtype))
+
+
+def _forget(cache_reference, owner_id, _):
+    # Appelé à la libération d'un tableau : ses résultats sont oubliés avant que son adresse
+    # ou son identifiant ne puisse être réutilisé.
+    cache = cache_reference()
+    if cache is not None:
+        with cache._lock:
+            cache._owners.pop(owner_id, None)
+            cache._discard(lambda tokens: any(token[0] == "id" and token[1] == owner_id for token in tokens))
+
+
+def _new_digest():
+    # `usedforsecurity` n'existe qu'à partir de Python 3.9.
+    if sys.version_info >= (3, 9):
+        return hashlib.sha1(usedforsecurity=False)
+    return hashlib.sha1()
+
+
+def _fingerprint(series: pd.Series):
+    digest = _new_digest()
+    _hash_values(digest, series.array)
+    return len(series), str(series.dtype), digest.hexdigest()
+
+
+def _hash_values(digest, array):
+    """Ajoute tout le contenu de `array` au condensé, en lisant ses tampons mémoire si possible."""
+    if isinstance(array.dtype, pd.CategoricalDtype):
+        _hash_values(digest, pd.array(array.codes))
+        _hash_values(digest, array.categories.array)
+    elif isinstance(array.dtype, np.dtype) and array.dtype.kind != "O":
+        digest.update(np.ascontiguousarray(array.to_numpy()).view(np.uint8))
+    elif hasattr(array, "__arrow_array__"):
+        # Texte et types Arrow ou masqués : tampons de validité, de positions et de données.
+        arrow = array.__arrow_array__()
+        for chunk in getattr(arrow, "chunks", [arrow]):
+            digest.update(f"{chunk.offset}:{len(chunk)};".encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    else:
+        digest.update(pd.util.hash_pandas_object(pd.Series(array), index=False).to_numpy())
+
+
+def _key_fingerprints(key):
+    return {part[2] for part in key[1] if part[1] is _COLUMN}
+
+
+def memoize_stat(function: Callable) -> Callable:
+    """
+    Décorateur rendant une fonction statistique cacheable lorsque le cache est activé.
+
+    Les arguments de type Series, et les noms de colonnes d'un argument DataFrame, sont
+    remplacés par l'empreinte de la colonne dans la clé (voir `StatsCache`). Les erreurs ne
+    sont pas mises en cache.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        cache = _cache
+        if cache is None:
+            return function(*args, **kwargs)
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError:
+            # Signature invalide : la fonction lève elle-même l'erreur appropriée.
+            return function(*args, **kwargs)
+        parts = _make_key(bound, cache)
+        key = (function.__qualname__, parts)
+        if parts is None or not _is_hashable(key):
+            # Argument non hachable : le résultat n'est pas mis en cache.
+            return function(*args, **kwargs)
+        found, value = cache.get(key)
+        if not found:
+            value = function(*args, **kwargs)
+            cache.put(key, value)
+        return dict(value) if isinstance(value, dict) else value
+
+    return wrapper
+
+
+def _is_hashable(key) -> bool:
+    try:
+        hash(key)
+    except TypeError:
+        return False
+    return True
+
+
+def _make_key(bound: inspect.BoundArguments, cache: StatsCache) -> Optional[tuple]:
+    dataframes = [value for value in bound.arguments.values() if isinstance(value, pd.DataFrame)]
+    parts = []
+    for name, value in bound.arguments.items():
+        if isinstance(value, pd.DataFrame):
+            continue
+        if isinstance(value, pd.Series) or (isinstance(value, str) and dataframes and value in dataframes[0].columns):
+            fingerprint = cache.fingerprint(value if isinstance(value, pd.Series) else dataframes[0][value])
+            if fingerprint is None:
+                return None
+            parts.append((name, _COLUMN, fingerprint))
+        else:
+            parts.append((name, value))
+    return tuple(parts)
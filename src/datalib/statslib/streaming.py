@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Union
+
+
+class StreamingStats:
+    """
+    Accumulateur de statistiques (effectif, moyenne, variance, min, max) mis à jour par blocs.
+
+    La moyenne et la somme des carrés des écarts (M2) sont combinées avec la formule
+    parallèle de Welford/Chan : deux accumulateurs calculés sur des blocs ou des processus
+    différents peuvent être fusionnés sans perte de précision. Les valeurs manquantes sont
+    ignorées, comme dans `calculate_mean` et `calculate_std`.
+
+    Example:
+        >>> stats = StreamingStats()
+        >>> for chunk in iter_csv("data.csv", chunksize=100_000):
+        ...     stats.update(chunk["amount"])
+        >>> stats.mean, stats.std()
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = float("nan")
+        self.m2 = 0.0
+        self.min = float("nan")
+        self.max = float("nan")
+
+    def update(self, values: Union[pd.Series, np.ndarray, Iterable[float]]) -> "StreamingStats":
+        """
+        Ajoute un bloc de valeurs à l'accumulateur.
+
+        Args:
+            values (Union[pd.Series, np.ndarray, Iterable[float]]): Les valeurs numériques du bloc.
+
+        Returns:
+            StreamingStats: L'accumulateur lui-même.
+
+        Raises:
+            ValueError: Si les valeurs ne sont pas numériques.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in "biuf":
+            raise ValueError("Les valeurs doivent être numériques.")
+        values = values.astype(np.float64, copy=False).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        chunk = StreamingStats()
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(np.square(values - chunk.mean).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        return self.merge(chunk)
+
+    def merge(self, other: "StreamingStats") -> "StreamingStats":
+        """
+        Fusionne un autre accumulateur dans celui-ci (par exemple celui d'un autre processus).
+
+        Args:
+            other (StreamingStats): L'accumulateur à fusionner.
+
+        Returns:
+            StreamingStats: L'accumulateur lui-même.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def sum(self) -> float:
+        """La somme des valeurs accumulées."""
+        return self.mean * self.count if self.count else 0.0
+
+    def variance(self, ddof: int = 1) -> float:
+        """Retourne la variance (échantillon par défaut, comme `pandas`)."""
+        if self.count <= ddof:
+            return float("nan")
+        if self.min == self.max:
+            return 0.0
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """
+        Retourne l'écart-type, avec la même convention que `calculate_std` : 0.0 si la
+        colonne est vide ou ne contient qu'une seule valeur distincte.
+        """
+        if self.count == 0 or self.min == self.max:
+            return 0.0
+        return float(np.sqrt(self.variance(ddof)))
+
+    def to_dict(self) -> Dict[str, float]:
+        """Sérialise l'accumulateur (par exemple pour l'envoyer à un autre processus)."""
+        return {"count": self.count, "mean": self.mean, "m2": self.m2, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "StreamingStats":
+        """Reconstruit un accumulateur sérialisé avec `to_dict`."""
+        stats = cls()
+        stats.count = int(data["count"])
+        stats.mean = float(data["mean"])
+        stats.m2 = float(data["m2"])
+        stats.min = float(data["min"])
+        stats.max = float(data["max"])
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"StreamingStats(count={self.count}, mean={self.mean}, std={self.std()}, "
+                f"min={self.min}, max={self.max})")
+
+
+def stream_stats(chunks: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                 columns: Optional[List[str]] = None) -> Dict[str, StreamingStats]:
+    """
+    Calcule en une seule passe les statistiques de plusieurs colonnes sur un flux de blocs.
+
+    Args:
+        chunks (Union[pd.DataFrame, Iterable[pd.DataFrame]]): Un DataFrame ou des blocs (ex. : `iter_csv`).
+        columns (Optional[List[str]]): Les colonnes à traiter (par défaut les colonnes
+            numériques du premier bloc).
+
+    Returns:
+        Dict[str, StreamingStats]: Un accumulateur par colonne.
+
+    Raises:
+        KeyError: Si une colonne spécifiée n'existe pas dans un bloc.
+    """
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    accumulators = None
+    for chunk in chunks:
+        if accumulators is None:
+            if columns is None:
+                columns = list(chunk.select_dtypes(include="number").columns)
+            accumulators = {column: StreamingStats() for column in columns}
+        for column in columns:
+            if column not in chunk.columns:
+                raise KeyError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+            accumulators[column].update(chunk[column])
+    if accumulators is None:
+        accumulators = {column: StreamingStats() for column in columns or []}
+    return accumulators
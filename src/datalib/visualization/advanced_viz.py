@@ -1,5 +1,8 @@
 import seaborn as sns
 import matplotlib.pyplot as plt
+import numpy as np
+
+from ..statslib.correlation import correlation_matrix_values
 
 
 def correlation_matrix(dataframe, annot=True, cmap="coolwarm", figsize=(10, 8), title="Correlation Matrix"):
@@ -16,8 +19,8 @@ def correlation_matrix(dataframe, annot=True, cmap="coolwarm", figsize=(10, 8),
     Returns:
         matplotlib.figure.Figure: La figure contenant la heatmap de la matrice de corrélation.
     """
-    # Calcul de la matrice de corrélation
-    corr = dataframe.corr()
+    # Calcul de la matrice de corrélation (colonnes numériques, par blocs)
+    corr = correlation_matrix_values(dataframe, dtype=np.float64)
 
     # Création de la figure et de l'axe
     fig, ax = plt.subplots(figsize=figsize)
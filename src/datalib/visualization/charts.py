@@ -1,29 +1,41 @@
 import matplotlib.pyplot as plt
 
+from ..statslib.sketches import TopKSketch
 
-def bar_chart(dataframe, column, title=None, xlabel=None, ylabel=None, color='skyblue', figsize=(10, 6)):
+
+def bar_chart(dataframe, column, title=None, xlabel=None, ylabel=None, color='skyblue', figsize=(10, 6),
+              top_k=None, sketch=None):
     """
     Génère un graphique à barres.
 
     Args:
-        dataframe (pd.DataFrame): Le DataFrame contenant les données.
+        dataframe (pd.DataFrame): Le DataFrame contenant les données (peut être None si `sketch` est fourni).
         column (str): Le nom de la colonne pour le graphique à barres.
         title (str, optional): Titre du graphique (par défaut None).
         xlabel (str, optional): Label de l'axe x (par défaut None).
         ylabel (str, optional): Label de l'axe y (par défaut None).
         color (str, optional): Couleur des barres (par défaut 'skyblue').
         figsize (tuple, optional): Taille de la figure (par défaut (10, 6)).
+        top_k (int, optional): Si fourni, seules les `top_k` valeurs les plus fréquentes sont
+            affichées ; elles sont estimées par un `TopKSketch`, sans compter toutes les valeurs distinctes.
+        sketch (TopKSketch, optional): Un sketch déjà construit (par exemple sur un flux de
+            blocs) à utiliser à la place de la colonne.
 
     Returns:
         None
     """
-    # Vérification que la colonne existe
-    if column not in dataframe.columns:
-        raise ValueError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+    if sketch is None:
+        # Vérification que la colonne existe
+        if column not in dataframe.columns:
+            raise ValueError(f"La colonne '{column}' n'existe pas dans le DataFrame.")
+        if top_k is not None:
+            sketch = TopKSketch(capacity=max(10 * top_k, 1000)).update(dataframe[column])
 
     # Création du graphique à barres
     plt.figure(figsize=figsize)
-    dataframe[column].value_counts().plot(kind="bar", color=color)
+    counts = dataframe[column].value_counts() if sketch is None else sketch.top(top_k)
+    # Les catégories absentes (colonnes 'category') ne sont pas affichées
+    counts[counts > 0].plot(kind="bar", color=color)
 
     # Ajout du titre et des labels
     plt.title(title or f"Bar Chart of {column}")
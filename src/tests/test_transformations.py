@@ -54,7 +54,8 @@ def test_handle_missing_values_with_invalid_strategy(sample_missing_values_data)
     try:
         handle_missing_values(sample_missing_values_data, strategy="invalid")
     except ValueError as e:
-        assert str(e) == "Stratégie non supportée : choisissez parmi 'mean', 'median', ou 'drop'.", f"Unexpected error message: {e}"
+        expected = "Stratégie non supportée : choisissez parmi ['mean', 'median', 'constant', 'ffill', 'interpolate', 'knn', 'drop']."
+        assert str(e) == expected, f"Unexpected error message: {e}"
 
 def test_normalize_data_with_non_numeric_column():
     """Test normalize_data with a non-numeric column."""
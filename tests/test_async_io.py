@@ -0,0 +1,75 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import asyncio
+import threading
+import time
+import pytest
+import pandas as pd
+from datalib.preprocessing import async_io, csv_handler
+from datalib.preprocessing.async_io import async_load_csv, async_save_csv, async_iter_csv, set_max_concurrency
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for sample dataframe to be used in tests."""
+    return pd.DataFrame({"col1": range(10), "col2": list("abcdeabcde")})
+
+def test_async_load_and_save(tmp_path, sample_dataframe):
+    """Test the async load/save round trip."""
+    file_path = tmp_path / "data.csv"
+
+    async def job():
+        await async_save_csv(sample_dataframe, file_path)
+        return await async_load_csv(file_path)
+
+    pd.testing.assert_frame_equal(asyncio.run(job()), sample_dataframe)
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(async_load_csv(tmp_path / "missing.csv"))
+
+def test_async_iter_csv(tmp_path, sample_dataframe):
+    """Test the async chunk iterator, including early exit."""
+    file_path = tmp_path / "data.csv"
+    sample_dataframe.to_csv(file_path, index=False)
+
+    async def read_all():
+        return [chunk async for chunk in async_iter_csv(file_path, chunksize=4)]
+
+    chunks = asyncio.run(read_all())
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+    async def read_first():
+        async for chunk in async_iter_csv(file_path, chunksize=3):
+            return chunk
+
+    assert len(asyncio.run(read_first())) == 3
+
+def test_async_concurrency_limit(tmp_path, monkeypatch):
+    """Test that the shared concurrency limit is never exceeded."""
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_load(file_path, **kwargs):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return pd.DataFrame()
+
+    monkeypatch.setattr(csv_handler, "load_csv", slow_load)
+    set_max_concurrency(2)
+    try:
+        async def many():
+            await asyncio.gather(*(async_load_csv(f"file{i}.csv") for i in range(8)))
+        asyncio.run(many())
+    finally:
+        set_max_concurrency(4)
+
+    assert state["peak"] == 2, f"Expected at most 2 concurrent loads, got {state['peak']}"
+    assert async_io.get_max_concurrency() == 4
+
+    with pytest.raises(ValueError):
+        set_max_concurrency(0)
@@ -5,6 +5,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 import pytest
 import pandas as pd
 from datalib.statslib.basic_stats import calculate_mode, calculate_std, calculate_correlation
+from datalib.statslib.basic_stats import calculate_mean, calculate_median, describe_columns
+from datalib.statslib.basic_stats import grouped_stats, grouped_correlation
+import numpy as np
 
 @pytest.fixture
 def sample_mode_data():
@@ -53,3 +56,114 @@ def test_calculate_std_with_single_value():
     std = calculate_std(df, "values")
     # Standard deviation for a single value should be 0
     assert std == 0, f"Expected standard deviation to be 0, but got {std}"
+
+@pytest.fixture
+def sample_describe_data():
+    """Fixture for a frame mixing float, int, constant, missing and text columns."""
+    rng = np.random.default_rng(42)
+    floats = rng.normal(50, 10, 1001)
+    floats[::9] = np.nan
+    return pd.DataFrame({
+        "floats": floats,
+        "ints": rng.integers(0, 20, 1001),
+        "constant": [2.5] * 1001,
+        "empty": [np.nan] * 1001,
+        "text": ["a"] * 1001,
+    })
+
+def test_describe_columns_matches_single_column_functions(sample_describe_data):
+    """Test that describe_columns gives exactly the single-column results."""
+    result = describe_columns(sample_describe_data)
+    assert list(result.index) == ["floats", "ints", "constant", "empty"], "Seules les colonnes numériques sont décrites par défaut."
+    assert list(result.columns) == ["mean", "median", "mode", "std"]
+
+    for column in ["floats", "ints", "constant"]:
+        assert result.loc[column, "mean"] == calculate_mean(sample_describe_data, column)
+        assert result.loc[column, "median"] == calculate_median(sample_describe_data, column)
+        assert result.loc[column, "mode"] == calculate_mode(sample_describe_data, column)
+        assert result.loc[column, "std"] == calculate_std(sample_describe_data, column)
+
+    assert np.isnan(result.loc["empty", "mean"]) and np.isnan(result.loc["empty", "median"])
+    assert pd.isna(result.loc["empty", "mode"])
+    assert result.loc["empty", "std"] == calculate_std(sample_describe_data, "empty")
+
+def test_describe_columns_options(sample_describe_data):
+    """Test column and statistic selection and error handling."""
+    result = describe_columns(sample_describe_data, columns=["ints"], stats=["count", "min", "max"])
+    assert result.loc["ints"].tolist() == [1001, sample_describe_data["ints"].min(), sample_describe_data["ints"].max()]
+    assert describe_columns(sample_describe_data.iloc[:0], columns=["floats"], stats=["count"]).loc["floats", "count"] == 0
+
+    with pytest.raises(KeyError):
+        describe_columns(sample_describe_data, columns=["missing"])
+    with pytest.raises(ValueError):
+        describe_columns(sample_describe_data, columns=["text"])
+    with pytest.raises(ValueError):
+        describe_columns(sample_describe_data, stats=["kurtosis"])
+
+@pytest.fixture
+def sample_grouped_data():
+    """Fixture for grouped data with ties, constant groups, missing values and missing keys."""
+    rng = np.random.default_rng(0)
+    n = 3000
+    data = pd.DataFrame({
+        "customer": rng.integers(0, 60, n),
+        "region": rng.choice(["north", "south"], n),
+        "amount": rng.integers(0, 8, n).astype(float),
+        "score": rng.normal(size=n),
+    })
+    data.loc[data["customer"] == 5, "amount"] = 3.0
+    data.loc[rng.choice(n, 100, replace=False), "amount"] = np.nan
+    data.loc[data["customer"] == 7, "amount"] = np.nan
+    data.loc[[0, 1], "customer"] = np.nan
+    return data
+
+def test_grouped_stats_matches_single_column_functions(sample_grouped_data):
+    """Test that grouped statistics agree with the per-column functions on each group."""
+    result = grouped_stats(sample_grouped_data, "customer", ["amount", "score"],
+                           stats=["count", "mean", "median", "mode", "std", "min", "max"], n_jobs=2)
+
+    groups = sample_grouped_data.dropna(subset=["customer"]).groupby("customer")
+    assert list(result.index) == list(groups.groups)
+    for key, group in groups:
+        for column in ["amount", "score"]:
+            row = result.loc[key, column]
+            assert row["count"] == group[column].count()
+            if group[column].count() == 0:
+                assert np.isnan(row["mean"]) and np.isnan(row["median"]) and np.isnan(row["mode"])
+                assert row["std"] == 0.0
+                continue
+            assert row["mean"] == pytest.approx(calculate_mean(group, column), rel=1e-12)
+            assert row["median"] == calculate_median(group, column)
+            assert row["mode"] == calculate_mode(group, column)
+            assert row["std"] == pytest.approx(calculate_std(group, column), rel=1e-9, abs=1e-12)
+            assert row["min"] == group[column].min() and row["max"] == group[column].max()
+    assert result.loc[5, ("amount", "std")] == 0.0
+
+def test_grouped_stats_multiple_keys(sample_grouped_data):
+    """Test grouping by several keys against pandas groupby."""
+    result = grouped_stats(sample_grouped_data, ["region", "customer"], ["score"], stats=["mean", "median"])
+    expected = sample_grouped_data.groupby(["region", "customer"])["score"].agg(["mean", "median"])
+
+    assert result.index.names == ["region", "customer"]
+    np.testing.assert_array_equal(result.index.to_frame().to_numpy(), expected.index.to_frame().to_numpy())
+    np.testing.assert_allclose(result["score"].to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+def test_grouped_correlation(sample_grouped_data):
+    """Test per-group correlation against calculate_correlation."""
+    data = sample_grouped_data.assign(other=sample_grouped_data["score"] * 2 + sample_grouped_data["amount"])
+    result = grouped_correlation(data, "customer", "score", "other")
+    for key, group in data.dropna(subset=["customer"]).groupby("customer"):
+        expected = calculate_correlation(group, "score", "other")
+        if np.isnan(expected):
+            assert np.isnan(result[key])
+        else:
+            assert result[key] == pytest.approx(expected, rel=1e-9)
+
+def test_grouped_stats_errors(sample_grouped_data):
+    """Test error handling of grouped_stats."""
+    with pytest.raises(KeyError):
+        grouped_stats(sample_grouped_data, "missing")
+    with pytest.raises(ValueError):
+        grouped_stats(sample_grouped_data, "customer", ["region"])
+    with pytest.raises(ValueError):
+        grouped_stats(sample_grouped_data, "customer", stats=["skew"])
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.statslib.correlation import correlation_matrix_values
+
+@pytest.fixture
+def wide_dataframe():
+    """Fixture for a frame with correlated columns, a constant column and a text column."""
+    rng = np.random.default_rng(5)
+    base = rng.normal(size=(500, 1))
+    data = base + rng.normal(scale=rng.uniform(0.1, 3, size=40), size=(500, 40))
+    df = pd.DataFrame(data, columns=[f"c{i}" for i in range(40)])
+    df["constant"] = 1.0
+    df["label"] = "x"
+    return df
+
+def test_correlation_matrix_matches_pandas(wide_dataframe):
+    """Test the blocked Pearson and Spearman engines against DataFrame.corr."""
+    numeric = wide_dataframe.drop(columns="label")
+    result = correlation_matrix_values(wide_dataframe, dtype=np.float64, block_size=7, n_jobs=3)
+    assert list(result.columns) == list(numeric.columns), "Seules les colonnes numériques sont corrélées."
+    np.testing.assert_allclose(result.to_numpy(), numeric.corr().to_numpy(), atol=1e-10)
+
+    result = correlation_matrix_values(numeric, method="spearman", block_size=16)
+    assert result.dtypes.iloc[0] == np.float32
+    np.testing.assert_allclose(result.to_numpy(), numeric.corr(method="spearman").to_numpy(), atol=1e-5)
+
+def test_correlation_matrix_pairwise_nan(wide_dataframe):
+    """Test pairwise-complete handling of missing values."""
+    numeric = wide_dataframe.drop(columns="label").copy()
+    rng = np.random.default_rng(6)
+    numeric = numeric.mask(rng.random(numeric.shape) < 0.1)
+    result = correlation_matrix_values(numeric, dtype=np.float64, block_size=9)
+    np.testing.assert_allclose(result.to_numpy(), numeric.corr().to_numpy(), atol=1e-10)
+
+def test_correlation_top_pairs(wide_dataframe):
+    """Test the top-|r| pair screening."""
+    numeric = wide_dataframe.drop(columns=["label", "constant"])
+    top = correlation_matrix_values(numeric, dtype=np.float64, block_size=6, top=5)
+    assert list(top.columns) == ["col1", "col2", "correlation"]
+    assert len(top) == 5
+
+    full = numeric.corr().where(np.triu(np.ones((40, 40), dtype=bool), k=1)).stack()
+    expected = full.abs().sort_values(ascending=False).iloc[:5]
+    assert list(zip(top["col1"], top["col2"])) == list(expected.index)
+    np.testing.assert_allclose(top["correlation"].abs(), expected.to_numpy(), atol=1e-10)
+
+def test_correlation_matrix_errors(wide_dataframe):
+    """Test invalid arguments."""
+    with pytest.raises(KeyError):
+        correlation_matrix_values(wide_dataframe, columns=["missing"])
+    with pytest.raises(ValueError):
+        correlation_matrix_values(wide_dataframe, columns=["label"])
+    with pytest.raises(ValueError):
+        correlation_matrix_values(wide_dataframe, method="kendall")
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_correlation_pairwise_constant_column(dtype):
+    """Test that a column constant on the rows shared with another gives NaN, like DataFrame.corr."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=1000)
+    y = rng.normal(size=1000)
+    x[:500] = 3.7
+    y[500:] = np.nan
+    df = pd.DataFrame({"x": x, "y": y, "z": x + rng.normal(size=1000)})
+
+    result = correlation_matrix_values(df, dtype=dtype)
+    expected = df.corr()
+    assert np.isnan(result.loc["x", "y"]) and np.isnan(expected.loc["x", "y"])
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-5)
+
+    pairs = correlation_matrix_values(df, top=3, dtype=dtype)
+    assert ("x", "y") not in set(zip(pairs["col1"], pairs["col2"]))
+    assert pairs["correlation"].notna().all()
+
+def test_correlation_pairwise_large_frame():
+    """Test that the pairwise guard does not turn large frames with a few NaNs into NaN."""
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=9_000_000).astype(np.float32)
+    df = pd.DataFrame({"x": x, "y": x + rng.normal(size=len(x)).astype(np.float32)})
+    df.loc[3, "y"] = np.nan
+
+    result = correlation_matrix_values(df)
+    assert result.loc["x", "y"] == pytest.approx(np.sqrt(0.5), abs=1e-3)
@@ -5,7 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 import pytest
 import pandas as pd
 import os
-from datalib.preprocessing.csv_handler import load_csv, save_csv, filter_data
+from datalib.preprocessing.csv_handler import load_csv, save_csv, filter_data, iter_csv, load_many
 
 @pytest.fixture
 def sample_dataframe():
@@ -55,3 +55,127 @@ def test_filter_data():
     # Test error handling for non-existing column
     with pytest.raises(KeyError):
         filter_data(df, "non_existing_column", "a")
+
+def test_iter_csv_chunks(temporary_file):
+    """Test the chunked reading of iter_csv and load_csv(chunksize=...)."""
+    df = pd.DataFrame({"col1": range(10), "col2": list("abcdeabcde")})
+    df.to_csv(temporary_file, index=False)
+
+    chunks = list(iter_csv(temporary_file, chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2], "Les blocs n'ont pas la bonne taille."
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    chunks = list(load_csv(temporary_file, chunksize=5))
+    assert len(chunks) == 2, "load_csv(chunksize=...) doit retourner des blocs."
+
+def test_iter_csv_max_memory(temporary_file):
+    """Test that max_memory bounds the size of each chunk."""
+    df = pd.DataFrame({"col1": range(1000), "col2": ["x" * 20] * 1000})
+    df.to_csv(temporary_file, index=False)
+
+    budget = 4096
+    chunks = list(iter_csv(temporary_file, max_memory=budget))
+    assert len(chunks) > 1, "Le budget mémoire doit découper le fichier."
+    assert sum(len(chunk) for chunk in chunks) == len(df)
+    assert all(chunk.memory_usage(index=False, deep=True).sum() <= budget for chunk in chunks)
+
+    with pytest.raises(ValueError):
+        iter_csv(temporary_file)
+    with pytest.raises(FileNotFoundError):
+        iter_csv("missing_file.csv", chunksize=10)
+
+def test_streaming_load_filter_save(temporary_file, tmp_path):
+    """Test a load -> filter -> save job running chunk by chunk."""
+    df = pd.DataFrame({"col1": range(10), "col2": list("abcdeabcde")})
+    df.to_csv(temporary_file, index=False)
+    output = tmp_path / "filtered.csv"
+
+    save_csv(filter_data(iter_csv(temporary_file, chunksize=3), "col2", "a"), output)
+
+    expected = filter_data(df, "col2", "a").reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv(output), expected)
+
+    with pytest.raises(KeyError):
+        list(filter_data(iter_csv(temporary_file, chunksize=3), "missing", "a"))
+
+@pytest.fixture
+def partitioned_dir(tmp_path):
+    """Fixture creating daily CSV shards in Hive-style partition directories."""
+    for day in ["2024-01-02", "2024-01-01"]:
+        for shard in range(2):
+            directory = tmp_path / f"day={day}"
+            directory.mkdir(exist_ok=True)
+            pd.DataFrame({"shard": [shard] * 3, "value": range(3)}).to_csv(directory / f"part{shard}.csv", index=False)
+    return tmp_path
+
+def test_load_many(partitioned_dir):
+    """Test load_many over a directory with partition and source columns."""
+    df = load_many(partitioned_dir, source_column="source", partitions=True)
+    assert len(df) == 12, "Toutes les lignes doivent être chargées."
+    assert list(df["day"].unique()) == ["2024-01-01", "2024-01-02"], "L'ordre des fichiers doit être déterministe."
+    assert df["source"].nunique() == 4
+    assert str(df["source"].iloc[0]).endswith(os.path.join("day=2024-01-01", "part0.csv"))
+
+    with pytest.raises(FileNotFoundError):
+        load_many(str(partitioned_dir / "*.parquet"))
+
+def test_load_many_parallel(partitioned_dir):
+    """Test that the parallel loader returns the same frame as the serial one."""
+    pattern = str(partitioned_dir / "day=*" / "*.csv")
+    serial = load_many(pattern, partitions=True)
+    parallel = load_many(pattern, n_jobs=2, partitions=True)
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert list(serial.columns) == ["shard", "value", "day"]
+
+def test_load_many_partition_in_pattern(partitioned_dir):
+    """Test that a partition directory written literally in the pattern is still parsed."""
+    df = load_many(str(partitioned_dir / "day=2024-01-02" / "*.csv"), partitions=True)
+    assert list(df.columns) == ["shard", "value", "day"]
+    assert (df["day"] == "2024-01-02").all() and len(df) == 6
+
+@pytest.fixture
+def large_dataframe():
+    """Fixture for a dataframe spanning several write chunks."""
+    return pd.DataFrame({"col1": range(1000), "col2": ["a", "b", "c", "d"] * 250})
+
+def test_save_csv_parallel_gzip(tmp_path, large_dataframe):
+    """Test the parallel, compressed writer."""
+    file_path = tmp_path / "out.csv.gz"
+    save_csv(large_dataframe, file_path, n_jobs=4, chunksize=64)
+
+    with open(file_path, "rb") as handle:
+        assert handle.read(2) == b"\x1f\x8b", "Le fichier doit être compressé en gzip."
+    pd.testing.assert_frame_equal(load_csv(file_path), large_dataframe)
+
+    with pytest.raises(ValueError):
+        save_csv(large_dataframe, file_path, compression="lz4")
+
+def test_save_csv_zstd(tmp_path, large_dataframe):
+    """Test zstd compression, sequential and parallel."""
+    pytest.importorskip("zstandard")
+    for n_jobs in (None, 3):
+        file_path = tmp_path / f"out{n_jobs}.csv.zst"
+        save_csv(large_dataframe, file_path, n_jobs=n_jobs, chunksize=100)
+        pd.testing.assert_frame_equal(load_csv(file_path), large_dataframe)
+
+@pytest.mark.parametrize("extension, magic", [(".bz2", b"BZh"), (".xz", b"\xfd7zXZ"), (".zip", b"PK\x03\x04")])
+def test_save_csv_infers_other_compressions(tmp_path, large_dataframe, extension, magic):
+    """Test that bz2, xz and zip extensions are still compressed, sequential and parallel."""
+    for n_jobs in (None, 3):
+        file_path = tmp_path / f"out{n_jobs}.csv{extension}"
+        save_csv(large_dataframe, file_path, n_jobs=n_jobs, chunksize=100)
+        with open(file_path, "rb") as handle:
+            assert handle.read(len(magic)) == magic
+        pd.testing.assert_frame_equal(load_csv(file_path), large_dataframe)
+
+def test_save_csv_parts(tmp_path, large_dataframe):
+    """Test splitting the output into several part files."""
+    paths = save_csv(large_dataframe, tmp_path / "out.csv", parts=3, n_jobs=2, chunksize=128)
+    assert [os.path.basename(path) for path in paths] == ["out-00000.csv", "out-00001.csv", "out-00002.csv"]
+
+    parts = [load_csv(path) for path in paths]
+    assert all(len(part) > 0 for part in parts)
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), large_dataframe)
+
+    with pytest.raises(ValueError):
+        save_csv(iter([large_dataframe]), tmp_path / "out.csv", parts=2)
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.dataset import Dataset, scan_csv
+from datalib.preprocessing.csv_handler import filter_data
+from datalib.preprocessing.transformations import normalize_data, handle_missing_values
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a dataframe with missing values and an unused column."""
+    return pd.DataFrame({
+        "country": ["FR", "TN", "FR", "FR", "TN", "FR"],
+        "price": [10.0, np.nan, 30.0, np.nan, 50.0, 20.0],
+        "quantity": [1, 2, 3, 4, 5, 6],
+        "comment": ["x"] * 6,
+    })
+
+@pytest.fixture
+def csv_file(tmp_path, sample_dataframe):
+    """Fixture writing the sample dataframe to a CSV file."""
+    file_path = tmp_path / "sales.csv"
+    sample_dataframe.to_csv(file_path, index=False)
+    return file_path
+
+def test_dataset_matches_eager_chain(csv_file, sample_dataframe):
+    """Test that the lazy plan gives the same result as the eager functions."""
+    result = (scan_csv(csv_file)
+              .filter("country", "FR")
+              .select(["price", "quantity", "country"])
+              .fillna("mean")
+              .normalize("price")
+              .collect())
+
+    expected = filter_data(sample_dataframe, "country", "FR")[["price", "quantity", "country"]]
+    expected = normalize_data(handle_missing_values(expected, strategy="mean"), "price")
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_dataset_plan_optimization(csv_file):
+    """Test projection pushdown and filter reordering."""
+    dataset = scan_csv(csv_file).select(["price", "country"]).fillna("drop").filter("country", "FR")
+    assert dataset.required_columns() == {"price", "country"}
+    assert [step[0] for step in dataset.optimized_steps()] == ["filter", "select", "drop"]
+    assert dataset.explain().splitlines()[0].endswith("columns=['country', 'price'])")
+
+    # Un filtre ne doit jamais passer avant une étape statistique
+    dataset = scan_csv(csv_file).fillna("mean").filter("price", 27.5)
+    assert [step[0] for step in dataset.optimized_steps()] == ["fill", "filter"]
+    assert len(dataset.collect()) == 2, "La moyenne doit être calculée avant le filtre."
+
+def test_dataset_in_memory_source(sample_dataframe):
+    """Test that an in-memory source is never modified."""
+    original = sample_dataframe.copy()
+    result = Dataset(sample_dataframe).fillna(value=0.0).normalize(["price", "quantity"]).collect()
+    pd.testing.assert_frame_equal(sample_dataframe, original)
+    assert result["price"].max() == 1.0
+
+    with pytest.raises(KeyError):
+        Dataset(sample_dataframe).filter("missing", 1).collect()
+    with pytest.raises(ValueError):
+        Dataset(sample_dataframe).fillna("mode")
+
+def test_dataset_streaming(csv_file, sample_dataframe):
+    """Test chunked execution of a row-local plan."""
+    chunks = scan_csv(csv_file).filter("country", "TN").select(["quantity"]).collect(chunksize=2)
+    result = pd.concat(list(chunks))
+    assert list(result["quantity"]) == [2, 5]
+    assert list(result.columns) == ["quantity"]
+
+    with pytest.raises(ValueError):
+        scan_csv(csv_file).normalize("price").collect(chunksize=2)
@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.csv_handler import filter_data
+from datalib.preprocessing.indexing import HashIndex, SortedIndex, FrameIndex
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a dataframe with repeated keys, missing values and a numeric column."""
+    return pd.DataFrame({
+        "city": ["Paris", "Tunis", None, "Lyon", "Paris", "Tunis", "Paris"],
+        "amount": [10.0, 25.0, 5.0, np.nan, 40.0, 15.0, 25.0],
+    }, index=[10, 11, 12, 13, 14, 15, 16])
+
+def test_hash_index(sample_dataframe):
+    """Test equality and isin lookups with a HashIndex."""
+    index = HashIndex(sample_dataframe, "city")
+    pd.testing.assert_frame_equal(
+        filter_data(sample_dataframe, "city", "Paris", index=index),
+        filter_data(sample_dataframe, "city", "Paris"),
+    )
+    assert list(index.positions("city", ["Tunis", "Lyon", "Oslo"])) == [1, 3, 5]
+    assert len(index.positions("city", "Oslo")) == 0
+
+    # Intervalle : comparé aux valeurs distinctes, valeurs manquantes exclues comme sans index.
+    for column, value in (("city", slice("M", "Q")), ("amount", slice(10, 25)), ("amount", slice(None, 10))):
+        pd.testing.assert_frame_equal(
+            filter_data(sample_dataframe, column, value, index=HashIndex(sample_dataframe, column)),
+            filter_data(sample_dataframe, column, value),
+        )
+
+    with pytest.raises(KeyError):
+        index.positions("amount", 10.0)
+    with pytest.raises(ValueError):
+        filter_data(sample_dataframe.copy(), "city", "Paris", index=index)
+
+def test_sorted_index(sample_dataframe):
+    """Test equality and range lookups with a SortedIndex."""
+    index = SortedIndex(sample_dataframe, "amount")
+    assert list(index.positions("amount", 25.0)) == [1, 6]
+    assert list(index.positions("amount", slice(10, 25))) == [0, 1, 5, 6]
+    assert list(index.positions("amount", slice(None, 10))) == [0, 2]
+    assert list(index.positions("amount", slice(30, None))) == [4]
+    pd.testing.assert_frame_equal(
+        filter_data(sample_dataframe, "amount", slice(10, 25), index=index),
+        filter_data(sample_dataframe, "amount", slice(10, 25)),
+    )
+
+def test_frame_index_conjunction(sample_dataframe):
+    """Test multi-column conditions and reuse of the per-column indexes."""
+    index = FrameIndex(sample_dataframe)
+    result = index.filter({"city": ["Paris", "Tunis"], "amount": slice(20, None)})
+    assert list(result.index) == [11, 14, 16]
+
+    hash_index = index.index_for("city")
+    assert index.index_for("city") is hash_index, "L'index doit être réutilisé."
+    assert len(index.lookup({"city": "Lyon", "amount": 10.0})) == 0
+    assert len(index.filter({})) == len(sample_dataframe)
+
+def test_filter_data_list_and_slice(sample_dataframe):
+    """Test the list and slice values of filter_data without index."""
+    assert list(filter_data(sample_dataframe, "city", ["Lyon", "Tunis"]).index) == [11, 13, 15]
+    assert list(filter_data(sample_dataframe, "amount", slice(15, 25)).index) == [11, 15, 16]
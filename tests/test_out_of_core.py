@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.csv_handler import load_csv, save_csv
+from datalib.preprocessing.out_of_core import normalize_csv, impute_csv
+from datalib.preprocessing.transformations import normalize_data, handle_missing_values
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Fixture writing a CSV file with missing values and a text column."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        "price": rng.normal(50, 10, 1000).round(3),
+        "quantity": rng.integers(0, 100, 1000).astype(float),
+        "city": rng.choice(["Paris", "Lyon"], 1000),
+    })
+    data.loc[rng.choice(1000, 40, replace=False), "price"] = np.nan
+    file_path = tmp_path / "features.csv"
+    save_csv(data, file_path)
+    return file_path
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_normalize_csv_matches_in_memory(tmp_path, sample_file, n_jobs):
+    """Test that chunked two-pass normalization matches normalize_data."""
+    output = tmp_path / "normalized.csv.gz"
+    scaler = normalize_csv(sample_file, output, ["price", "quantity"], chunksize=128, n_jobs=n_jobs)
+
+    original = load_csv(sample_file)
+    expected = normalize_data(original, ["price", "quantity"])
+    pd.testing.assert_frame_equal(load_csv(output), expected, check_exact=False, rtol=1e-12)
+    np.testing.assert_allclose(scaler.data_max_, original[["price", "quantity"]].max())
+
+def test_normalize_csv_with_fitted_scaler(tmp_path, sample_file):
+    """Test that a fitted scaler is reused without a first pass."""
+    first = normalize_csv(sample_file, tmp_path / "a.csv", method="standard", chunksize=100)
+    normalize_csv(sample_file, tmp_path / "b.csv", scaler=first, chunksize=300)
+    pd.testing.assert_frame_equal(load_csv(tmp_path / "a.csv"), load_csv(tmp_path / "b.csv"))
+    with pytest.raises(ValueError):
+        normalize_csv(sample_file, tmp_path / "c.csv", method="log")
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "drop"])
+def test_impute_csv_matches_handle_missing_values(tmp_path, sample_file, strategy):
+    """Test that chunked imputation matches handle_missing_values."""
+    output = tmp_path / "imputed.csv"
+    fill_values = impute_csv(sample_file, output, strategy=strategy, chunksize=128)
+
+    expected = handle_missing_values(load_csv(sample_file), strategy=strategy).reset_index(drop=True)
+    result = load_csv(output)
+    assert result["price"].notna().all()
+    if strategy == "median":
+        # Médiane estimée par sketch : proche de la médiane exacte.
+        exact = load_csv(sample_file)["price"].median()
+        assert fill_values["price"] == pytest.approx(exact, abs=0.5)
+        assert len(result) == len(expected)
+    else:
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+
+def test_impute_csv_errors(tmp_path, sample_file):
+    """Test impute_csv with an unknown strategy or a missing column."""
+    with pytest.raises(ValueError):
+        impute_csv(sample_file, tmp_path / "out.csv", strategy="mode")
+    with pytest.raises(KeyError):
+        impute_csv(sample_file, tmp_path / "out.csv", columns=["weight"])
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import pandas as pd
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from datalib.preprocessing.parquet_handler import load_parquet, save_parquet, _select_row_groups
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a dataframe spread over several row groups."""
+    return pd.DataFrame({
+        "id": range(30),
+        "group": ["a"] * 10 + ["b"] * 10 + ["c"] * 10,
+        "value": [float(i) for i in range(30)],
+    })
+
+@pytest.fixture
+def parquet_file(tmp_path, sample_dataframe):
+    """Fixture writing the sample dataframe with row groups of 10 rows."""
+    file_path = tmp_path / "data.parquet"
+    save_parquet(sample_dataframe, file_path, row_group_size=10)
+    return file_path
+
+def test_save_and_load_parquet(parquet_file, sample_dataframe):
+    """Test a full round trip and column projection."""
+    pd.testing.assert_frame_equal(load_parquet(parquet_file), sample_dataframe, check_dtype=False)
+
+    projected = load_parquet(parquet_file, columns=["value", "id"])
+    assert list(projected.columns) == ["value", "id"], "La projection des colonnes est incorrecte."
+
+    with pytest.raises(KeyError):
+        load_parquet(parquet_file, columns=["missing"])
+    with pytest.raises(FileNotFoundError):
+        load_parquet("missing_file.parquet")
+
+def test_load_parquet_filters(parquet_file, sample_dataframe):
+    """Test equality, range and membership filters."""
+    result = load_parquet(parquet_file, columns=["id"], filters=[("group", "==", "b")])
+    assert list(result["id"]) == list(range(10, 20)), "Le filtre d'égalité est incorrect."
+    assert list(result.columns) == ["id"], "Les colonnes de filtre ne doivent pas être retournées."
+
+    result = load_parquet(parquet_file, filters=[("value", ">=", 5), ("value", "<", 12)])
+    assert list(result["id"]) == list(range(5, 12)), "Le filtre d'intervalle est incorrect."
+
+    result = load_parquet(parquet_file, filters=[("group", "in", ["a", "c"]), ("id", ">", 25)])
+    assert list(result["id"]) == [26, 27, 28, 29]
+
+    assert load_parquet(parquet_file, filters=[("id", ">", 100)]).empty
+
+    with pytest.raises(ValueError):
+        load_parquet(parquet_file, filters=[("id", "~", 1)])
+
+def test_row_group_pruning(parquet_file):
+    """Test that row group statistics exclude groups that cannot match."""
+    metadata = pq.ParquetFile(parquet_file).metadata
+    assert metadata.num_row_groups == 3
+
+    assert _select_row_groups(metadata, [("group", "==", "b")]) == [1]
+    assert _select_row_groups(metadata, [("value", "<", 10)]) == [0]
+    assert _select_row_groups(metadata, [("id", ">=", 15), ("group", "!=", "c")]) == [1]
+    assert _select_row_groups(metadata, []) == [0, 1, 2]
+
+def test_not_equal_filter_keeps_nulls(tmp_path):
+    """Test that '!=' does not prune a constant row group that also holds nulls."""
+    df = pd.DataFrame({"id": range(20), "group": ["a"] * 8 + [None] * 2 + ["b"] * 10})
+    file_path = tmp_path / "nulls.parquet"
+    save_parquet(df, file_path, row_group_size=10)
+
+    result = load_parquet(file_path, filters=[("group", "!=", "a")])
+    expected = df[df["group"] != "a"].reset_index(drop=True)
+    assert len(result) == len(expected) == 12
+    assert result["id"].tolist() == expected["id"].tolist()
+
+def test_save_parquet_from_chunks(tmp_path, sample_dataframe):
+    """Test writing an iterable of chunks."""
+    file_path = tmp_path / "chunks.parquet"
+    chunks = (sample_dataframe.iloc[i:i + 7] for i in range(0, len(sample_dataframe), 7))
+    save_parquet(chunks, file_path)
+    pd.testing.assert_frame_equal(load_parquet(file_path), sample_dataframe, check_dtype=False)
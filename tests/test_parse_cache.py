@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.cache import ParseCache
+from datalib.preprocessing.csv_handler import load_csv
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Fixture writing a small CSV file with numeric and text columns."""
+    file_path = tmp_path / "data.csv"
+    pd.DataFrame({"col1": [1, 2, 3], "col2": [0.5, 1.5, 2.5], "col3": ["a", "b", "c"]}).to_csv(file_path, index=False)
+    return file_path
+
+def test_load_csv_cache_hit(csv_file, tmp_path, monkeypatch):
+    """Test that a cache hit returns the same frame without parsing the CSV again."""
+    cache = ParseCache(tmp_path / "cache")
+    first = load_csv(csv_file, cache=cache)
+    assert cache.get(csv_file) is not None, "Le DataFrame doit être mis en cache."
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Le CSV ne doit pas être reparsé.")
+    monkeypatch.setattr(pd, "read_csv", fail)
+
+    second = load_csv(csv_file, cache=str(tmp_path / "cache"))
+    pd.testing.assert_frame_equal(first, second)
+
+    # The numeric columns must be backed by a memory map, not by a parsed copy
+    base = second["col1"].to_numpy()
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap), "La colonne numérique doit être projetée en mémoire."
+
+def test_cache_invalidated_on_change(csv_file, tmp_path):
+    """Test that modifying the source file changes the cache key."""
+    cache = ParseCache(tmp_path / "cache")
+    load_csv(csv_file, cache=cache)
+    old_key = cache.key(csv_file)
+
+    pd.DataFrame({"col1": [10, 20]}).to_csv(csv_file, index=False)
+    assert cache.key(csv_file) != old_key
+    assert cache.get(csv_file) is None
+    assert list(load_csv(csv_file, cache=cache)["col1"]) == [10, 20]
+
+def test_cache_content_hash(csv_file, tmp_path):
+    """Test that the optional content hash is part of the key."""
+    assert ParseCache(tmp_path / "c1").key(csv_file) != ParseCache(tmp_path / "c2", content_hash=True).key(csv_file)
+
+def test_cache_lru_eviction(tmp_path):
+    """Test that the least recently used entries are evicted beyond max_bytes."""
+    files = []
+    for i in range(3):
+        file_path = tmp_path / f"data{i}.csv"
+        pd.DataFrame({"col1": np.arange(1000) + i}).to_csv(file_path, index=False)
+        files.append(file_path)
+
+    cache = ParseCache(tmp_path / "cache", max_bytes=20_000)
+    load_csv(files[0], cache=cache)
+    load_csv(files[1], cache=cache)
+    entry_size = cache.size() // 2
+    cache.max_bytes = 2 * entry_size + 1
+
+    os.utime(os.path.join(cache.cache_dir, cache.key(files[1]), "meta.json"), (1, 1))
+    cache.get(files[0])
+    load_csv(files[2], cache=cache)
+
+    assert cache.get(files[1]) is None, "L'entrée la moins récemment utilisée doit être évincée."
+    assert cache.get(files[0]) is not None
+    assert cache.get(files[2]) is not None
+    assert cache.size() <= cache.max_bytes
+
+    cache.clear()
+    assert cache.size() == 0
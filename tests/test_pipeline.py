@@ -0,0 +1,73 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.pipeline import Pipeline
+from datalib.preprocessing.transformations import normalize_data, handle_missing_values
+
+@pytest.fixture
+def sample_data():
+    """Fixture for numeric features with missing values and a text column."""
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame({
+        "age": rng.normal(40, 12, 500),
+        "income": rng.lognormal(10, 1, 500),
+        "visits": rng.integers(0, 20, 500),
+        "city": rng.choice(["Paris", "Lyon"], 500),
+    })
+    data.loc[rng.random(500) < 0.1, "age"] = np.nan
+    data.loc[rng.random(500) < 0.1, "income"] = np.nan
+    return data
+
+def test_pipeline_matches_batch_functions(sample_data):
+    """Test that the batch path equals handle_missing_values followed by normalize_data."""
+    pipeline = Pipeline().fit(sample_data)
+    assert pipeline.columns_ == ["age", "income", "visits"]
+
+    expected = normalize_data(handle_missing_values(sample_data, "mean"), pipeline.columns_)
+    pd.testing.assert_frame_equal(pipeline.transform(sample_data), expected, check_exact=True)
+
+@pytest.mark.parametrize("scaler", ["minmax", "standard", "robust", None])
+def test_transform_record_is_bit_identical(sample_data, scaler):
+    """Test that single rows and micro-batches match the batch path bit for bit."""
+    pipeline = Pipeline(imputation={"age": "median", "income": "mean"}, scaler=scaler).fit(sample_data)
+    batch = pipeline.transform(sample_data)[pipeline.columns_].to_numpy(dtype=np.float64)
+
+    records = sample_data.to_dict("records")
+    rows = np.array([pipeline.transform_record({**record, "age": None} if np.isnan(record["age"]) else record)
+                     for record in records])
+    micro_batch = pipeline.transform_record(sample_data[pipeline.columns_].to_numpy(dtype=np.float64))
+
+    assert np.array_equal(rows, batch)
+    assert np.array_equal(micro_batch, batch)
+
+def test_pipeline_serialization(sample_data):
+    """Test that a JSON round trip preserves the results exactly."""
+    pipeline = Pipeline(columns=["age", "income"], scaler="standard", dtype=np.float32).fit(sample_data)
+    restored = Pipeline.from_dict(json.loads(json.dumps(pipeline.to_dict())))
+
+    row = np.array([np.nan, 25_000.0])
+    assert restored.transform_record(row).dtype == np.float32
+    assert np.array_equal(restored.transform_record(row), pipeline.transform_record(row))
+    pd.testing.assert_frame_equal(restored.transform(sample_data), pipeline.transform(sample_data))
+
+def test_pipeline_errors(sample_data):
+    """Test Pipeline with invalid parameters or inputs."""
+    with pytest.raises(ValueError):
+        Pipeline(imputation="knn")
+    with pytest.raises(ValueError):
+        Pipeline().transform_record({"age": 1.0})
+    with pytest.raises(KeyError):
+        Pipeline(columns=["weight"]).fit(sample_data)
+    with pytest.raises(ValueError):
+        Pipeline(columns=["city"]).fit(sample_data)
+
+    pipeline = Pipeline().fit(sample_data)
+    with pytest.raises(KeyError):
+        pipeline.transform_record({"age": 1.0, "income": 2.0})
+    with pytest.raises(ValueError):
+        pipeline.transform_record(np.zeros(2))
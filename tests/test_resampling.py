@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from scipy.stats import ttest_ind
+from datalib.statslib.resampling import permutation_test, bootstrap_ci
+
+@pytest.fixture
+def sample_groups():
+    """Fixture for two groups of different sizes with a missing value."""
+    rng = np.random.default_rng(0)
+    group1 = pd.Series(rng.normal(0.0, 1.0, 60))
+    group2 = pd.Series(rng.normal(0.6, 1.0, 45))
+    group1[3] = np.nan
+    return group1, group2
+
+def test_permutation_test_agrees_with_t_test(sample_groups):
+    """Test that the permutation p-value is close to the parametric one."""
+    group1, group2 = sample_groups
+    result = permutation_test(group1, group2, n_resamples=5000, seed=1)
+    expected = ttest_ind(group1.dropna(), group2)
+
+    assert result["statistic"] == pytest.approx(group1.mean() - group2.mean())
+    assert len(result["null_distribution"]) == 5000
+    assert result["p_value"] == pytest.approx(expected.pvalue, abs=0.01)
+    assert 1 / 5001 <= result["p_value"] <= 1
+
+def test_permutation_test_alternatives(sample_groups):
+    """Test one-sided alternatives and the identical-groups case."""
+    group1, group2 = sample_groups
+    less = permutation_test(group1, group2, statistic="t", alternative="less", n_resamples=2000, seed=2)
+    greater = permutation_test(group1, group2, statistic="t", alternative="greater", n_resamples=2000, seed=2)
+    assert less["p_value"] < 0.05 < greater["p_value"]
+
+    same = permutation_test([1.0, 1.0, 1.0], [1.0, 1.0], n_resamples=100, seed=0)
+    assert same["p_value"] == 1.0
+
+def test_resampling_reproducible_across_processes(sample_groups):
+    """Test that a seed gives the same results whatever the batching across processes."""
+    group1, group2 = sample_groups
+    serial = permutation_test(group1, group2, n_resamples=1000, batch_size=100, seed=3)
+    parallel = permutation_test(group1, group2, n_resamples=1000, batch_size=100, n_jobs=2, seed=3)
+    np.testing.assert_array_equal(serial["null_distribution"], parallel["null_distribution"])
+
+    serial = bootstrap_ci(group2, statistic="median", n_resamples=900, batch_size=250, seed=4)
+    parallel = bootstrap_ci(group2, statistic="median", n_resamples=900, batch_size=250, n_jobs=2, seed=4)
+    assert serial["low"] == parallel["low"] and serial["high"] == parallel["high"]
+
+def test_bootstrap_ci_covers_mean(sample_groups):
+    """Test the bootstrap interval of the mean against the normal approximation."""
+    _, group2 = sample_groups
+    result = bootstrap_ci(group2, n_resamples=4000, seed=5)
+    standard_error = group2.std() / np.sqrt(len(group2))
+
+    assert result["low"] < group2.mean() < result["high"]
+    assert result["standard_error"] == pytest.approx(standard_error, rel=0.1)
+    assert result["high"] - result["low"] == pytest.approx(2 * 1.96 * standard_error, rel=0.15)
+
+    basic = bootstrap_ci(group2, n_resamples=4000, method="basic", seed=5)
+    assert basic["low"] == pytest.approx(2 * result["statistic"] - result["high"])
+
+def test_resampling_invalid_arguments(sample_groups):
+    """Test error handling of the resampling functions."""
+    group1, group2 = sample_groups
+    with pytest.raises(ValueError):
+        permutation_test(group1, group2, statistic="variance")
+    with pytest.raises(ValueError):
+        permutation_test(group1, group2, alternative="both")
+    with pytest.raises(ValueError):
+        permutation_test(group1, [], n_resamples=10)
+    with pytest.raises(ValueError):
+        bootstrap_ci(group2, confidence_level=1.5)
+    with pytest.raises(ValueError):
+        bootstrap_ci(pd.Series(["a", "b"]))
@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.statslib.rolling import RollingStats, RollingCorrelation, rolling_stats, rolling_correlation
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a time series with ties, a constant stretch and missing values."""
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 20, 400).astype(float)
+    values[50:60] = 7.0
+    values[[3, 120, 121]] = np.nan
+    other = values * 0.5 + rng.normal(size=400)
+    other[200] = np.nan
+    timestamps = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.cumsum(rng.integers(1, 90, 400)), unit="s")
+    return pd.DataFrame({"time": timestamps, "value": values, "other": other})
+
+@pytest.mark.parametrize("window", [1, 5, 32, None])
+def test_rolling_stats_match_pandas(sample_dataframe, window):
+    """Test that per-tick updates match pandas rolling/expanding statistics."""
+    stats = RollingStats(window)
+    online = []
+    for value in sample_dataframe["value"]:
+        stats.append(value)
+        online.append((stats.mean(), stats.std(), stats.median()))
+    online = pd.DataFrame(online, columns=["mean", "std", "median"])
+    expected = rolling_stats(sample_dataframe, "value", window=window)
+
+    pd.testing.assert_frame_equal(online, expected, check_exact=False, rtol=1e-9, atol=1e-9)
+    if window == 5:
+        assert expected.loc[59, "std"] == 0.0
+
+def test_rolling_stats_time_window(sample_dataframe):
+    """Test a time-based window against pandas."""
+    stats = RollingStats("5min")
+    online = [stats.append(v, t).median() for t, v in zip(sample_dataframe["time"], sample_dataframe["value"])]
+    expected = rolling_stats(sample_dataframe, "value", window="5min", stats=["median"], on="time")
+
+    np.testing.assert_allclose(online, expected["median"].to_numpy())
+    with pytest.raises(ValueError):
+        stats.append(1.0)
+    with pytest.raises(ValueError):
+        stats.append(1.0, sample_dataframe["time"].iloc[0])
+
+def test_rolling_correlation_matches_pandas(sample_dataframe):
+    """Test that the online rolling correlation matches pandas."""
+    correlation = RollingCorrelation(8)
+    online = [correlation.append(x, y).correlation()
+              for x, y in zip(sample_dataframe["value"], sample_dataframe["other"])]
+    expected = rolling_correlation(sample_dataframe, "value", "other", window=8)
+
+    np.testing.assert_allclose(online, expected.to_numpy(), rtol=1e-7, atol=1e-9)
+    assert np.isnan(online[59])  # Fenêtre où 'value' est constante.
+
+def test_rolling_correlation_constant_window():
+    """Test that constant windows give NaN in both the batch and the online paths."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": np.r_[rng.normal(size=50) * 1e3, np.full(20, 0.1)], "y": rng.normal(size=70)})
+    expected = rolling_correlation(df, "x", "y", window=10)
+    correlation = RollingCorrelation(10)
+    online = [correlation.append(x, y).correlation() for x, y in zip(df["x"], df["y"])]
+
+    assert expected.iloc[60:].isna().all()
+    assert np.isfinite(expected.iloc[9:50]).all()
+    np.testing.assert_allclose(online, expected.to_numpy(), rtol=1e-7, atol=1e-9)
+
+def test_rolling_memory_is_bounded():
+    """Test that the median heaps stay proportional to the window on a monotonic feed."""
+    stats = RollingStats(10)
+    for value in range(10_000):
+        stats.append(value)
+    assert stats.median() == 9994.5
+    assert len(stats) == 10
+    assert len(stats._median._low) + len(stats._median._high) < 60
+
+def test_rolling_invalid_arguments(sample_dataframe):
+    """Test error handling for invalid windows, columns and statistics."""
+    with pytest.raises(ValueError):
+        RollingStats(0)
+    with pytest.raises(ValueError):
+        RollingStats("not a duration")
+    with pytest.raises(KeyError):
+        rolling_stats(sample_dataframe, "missing", window=3)
+    with pytest.raises(ValueError):
+        rolling_stats(sample_dataframe, "value", window=3, stats=["skew"])
+    with pytest.raises(ValueError):
+        rolling_stats(sample_dataframe, "time", window=3)
@@ -0,0 +1,105 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn import preprocessing
+from datalib.preprocessing.scalers import MinMaxScaler, StandardScaler, RobustScaler
+from datalib.preprocessing.transformations import normalize_data
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for numeric columns with a missing value, a constant column and a label."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        "price": rng.normal(50, 10, 1000),
+        "quantity": rng.integers(0, 100, 1000),
+        "constant": np.full(1000, 4.0),
+        "label": rng.choice(["a", "b"], 1000),
+    })
+    data.loc[5, "price"] = np.nan
+    return data
+
+@pytest.mark.parametrize("scaler, reference", [
+    (MinMaxScaler, preprocessing.MinMaxScaler),
+    (StandardScaler, preprocessing.StandardScaler),
+    (RobustScaler, preprocessing.RobustScaler),
+])
+def test_scalers_match_sklearn(sample_dataframe, scaler, reference):
+    """Test that fitted scalers reproduce scikit-learn, in float32 by default."""
+    columns = ["price", "quantity", "constant"]
+    result = scaler(columns).fit_transform(sample_dataframe)
+    expected = reference().fit_transform(sample_dataframe[columns])
+
+    assert (result[columns].dtypes == np.float32).all()
+    np.testing.assert_allclose(result[columns].to_numpy(), expected, rtol=1e-6, atol=1e-6)
+    assert result["label"].equals(sample_dataframe["label"])
+
+def test_transform_does_not_touch_input(sample_dataframe):
+    """Test that transform returns a new frame unless inplace is requested."""
+    original = sample_dataframe.copy()
+    scaler = StandardScaler(["price"]).fit(sample_dataframe)
+    scaler.transform(sample_dataframe)
+    pd.testing.assert_frame_equal(sample_dataframe, original)
+
+    returned = scaler.transform(sample_dataframe, inplace=True)
+    assert returned is sample_dataframe
+    assert sample_dataframe["price"].dtype == np.float32
+    assert abs(sample_dataframe["price"].mean()) < 1e-5
+
+def test_partial_fit_matches_fit(sample_dataframe):
+    """Test that fitting chunk by chunk gives the same parameters as a full fit."""
+    for scaler, tolerance in ((MinMaxScaler, 0), (StandardScaler, 1e-12), (RobustScaler, 0.05)):
+        full = scaler(["price", "quantity"]).fit(sample_dataframe)
+        chunked = scaler(["price", "quantity"])
+        for start in range(0, 1000, 128):
+            chunked.partial_fit(sample_dataframe.iloc[start:start + 128])
+        np.testing.assert_allclose(chunked.scale_, full.scale_, rtol=tolerance)
+        np.testing.assert_allclose(chunked.min_, full.min_, rtol=tolerance, atol=tolerance)
+
+def test_scaler_serialization(sample_dataframe):
+    """Test that a serialized scaler transforms new data identically."""
+    scaler = MinMaxScaler(["price", "quantity"], feature_range=(-1, 1)).fit(sample_dataframe)
+    restored = MinMaxScaler.from_dict(json.loads(json.dumps(scaler.to_dict())))
+    pd.testing.assert_frame_equal(restored.transform(sample_dataframe), scaler.transform(sample_dataframe))
+    with pytest.raises(ValueError):
+        StandardScaler.from_dict(scaler.to_dict())
+
+def test_restored_scaler_partial_fit(sample_dataframe):
+    """Test that a serialized scaler can be restored and completed with partial_fit."""
+    for scaler, options in ((MinMaxScaler, {"feature_range": (-1, 1)}), (StandardScaler, {})):
+        full = scaler(["price", "quantity"], **options).fit(sample_dataframe)
+        first = scaler(["price", "quantity"], **options).partial_fit(sample_dataframe.iloc[:500])
+        restored = scaler.from_dict(json.loads(json.dumps(first.to_dict())))
+        restored.partial_fit(sample_dataframe.iloc[500:])
+        np.testing.assert_allclose(restored.scale_, full.scale_, rtol=1e-12)
+        np.testing.assert_allclose(restored.min_, full.min_, rtol=1e-12, atol=1e-12)
+
+    robust = RobustScaler(["price"]).partial_fit(sample_dataframe)
+    with pytest.raises(ValueError):
+        RobustScaler.from_dict(robust.to_dict()).partial_fit(sample_dataframe)
+
+def test_normalize_data_reuses_scaler(sample_dataframe):
+    """Test normalize_data with an explicit copy/inplace choice and a fitted scaler."""
+    original = sample_dataframe.copy()
+    result = normalize_data(sample_dataframe, ["price"])
+    pd.testing.assert_frame_equal(sample_dataframe, original)
+    assert result["price"].max() == pytest.approx(1.0)
+
+    scaler = MinMaxScaler("price").fit(sample_dataframe.iloc[:500])
+    serving = normalize_data(sample_dataframe.iloc[500:], "price", scaler=scaler)
+    np.testing.assert_allclose(serving["price"], scaler.transform(sample_dataframe.iloc[500:])["price"])
+
+def test_scaler_errors(sample_dataframe):
+    """Test error handling of the scalers."""
+    with pytest.raises(ValueError):
+        MinMaxScaler().transform(sample_dataframe)
+    with pytest.raises(ValueError):
+        StandardScaler(["label"]).fit(sample_dataframe)
+    with pytest.raises(KeyError):
+        RobustScaler(["missing"]).fit(sample_dataframe)
+    with pytest.raises(ValueError):
+        RobustScaler(["price"]).fit(sample_dataframe).partial_fit(sample_dataframe)
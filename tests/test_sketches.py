@@ -0,0 +1,146 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import tracemalloc
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.statslib.basic_stats import calculate_median, calculate_mode
+from datalib.visualization.charts import bar_chart
+from datalib.statslib.sketches import QuantileSketch, TopKSketch
+
+@pytest.fixture
+def sample_values():
+    """Fixture for a skewed sample with missing values."""
+    rng = np.random.default_rng(7)
+    values = rng.lognormal(0, 1, 200_000)
+    values[::1000] = np.nan
+    return values
+
+def rank_error(values, estimate, q):
+    """Return the absolute rank error of an estimated quantile."""
+    values = np.sort(values[~np.isnan(values)])
+    return abs(np.searchsorted(values, estimate) / len(values) - q)
+
+def test_quantile_sketch_error_bound(sample_values):
+    """Test that chunked updates respect the requested rank error with bounded memory."""
+    sketch = QuantileSketch(error=0.01, seed=1)
+    for start in range(0, len(sample_values), 10_000):
+        sketch.update(sample_values[start:start + 10_000])
+
+    assert sketch.count == np.count_nonzero(~np.isnan(sample_values))
+    assert sum(len(level) for level in sketch._levels) < 5 * sketch.k, "La mémoire du sketch doit rester bornée."
+    for q, estimate in zip([0.1, 0.5, 0.9, 0.99], sketch.quantile([0.1, 0.5, 0.9, 0.99])):
+        assert rank_error(sample_values, estimate, q) <= 0.01
+    assert sketch.quantile(0) == np.nanmin(sample_values)
+    assert sketch.quantile(1) == np.nanmax(sample_values)
+
+def test_quantile_sketch_merge(sample_values):
+    """Test that sketches built by separate workers merge into a valid sketch."""
+    parts = np.array_split(sample_values, 4)
+    sketches = [QuantileSketch(error=0.02, seed=i).update(part) for i, part in enumerate(parts)]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert merged.count == np.count_nonzero(~np.isnan(sample_values))
+    assert rank_error(sample_values, merged.median(), 0.5) <= 0.02
+
+def test_quantile_sketch_edge_cases():
+    """Test empty sketches, small exact inputs and invalid arguments."""
+    assert np.isnan(QuantileSketch().median())
+    assert QuantileSketch().update([3, 1, 2]).median() == 2
+    with pytest.raises(ValueError):
+        QuantileSketch(error=0)
+    with pytest.raises(ValueError):
+        QuantileSketch().update([1.0]).quantile(1.5)
+    with pytest.raises(ValueError):
+        QuantileSketch().update(["a"])
+
+def test_calculate_median_approximate(sample_values):
+    """Test the approximate mode of calculate_median."""
+    df = pd.DataFrame({"values": sample_values})
+    estimate = calculate_median(df, "values", approximate=True, error=0.005)
+    assert rank_error(sample_values, estimate, 0.5) <= 0.005
+    assert estimate == calculate_median(df, "values", approximate=True, error=0.005), "Le mode approché doit être reproductible."
+
+    with pytest.raises(KeyError):
+        calculate_median(df, "missing", approximate=True)
+
+def test_calculate_median_approximate_bounded_memory():
+    """Test that the approximate median stays within its error bound in bounded memory."""
+    values = np.random.default_rng(11).normal(size=2_000_000)
+    df = pd.DataFrame({"values": values})
+
+    tracemalloc.start()
+    try:
+        estimate = calculate_median(df, "values", approximate=True, error=0.01)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert rank_error(values, estimate, 0.5) <= 0.01
+    assert peak < values.nbytes / 4, "Le sketch ne doit pas copier toute la colonne."
+
+@pytest.fixture
+def skewed_ids():
+    """Fixture for a high-cardinality column with a few heavy hitters."""
+    rng = np.random.default_rng(3)
+    heavy = np.repeat([7, 3, 11], [5000, 3000, 3000])
+    tail = rng.integers(100, 1_000_000, 50_000)
+    values = np.concatenate([heavy, tail])
+    rng.shuffle(values)
+    return values
+
+def test_topk_sketch_heavy_hitters(skewed_ids):
+    """Test that chunked updates find the heavy hitters within the error bound."""
+    sketch = TopKSketch(capacity=100)
+    for start in range(0, len(skewed_ids), 5000):
+        sketch.update(skewed_ids[start:start + 5000])
+
+    assert sketch.count == len(skewed_ids)
+    assert len(sketch.counts) <= 100, "Le sketch ne doit pas dépasser sa capacité."
+    top = sketch.top(3)
+    assert list(top.index) == [7, 3, 11], "Les ex aequo doivent être départagés par valeur croissante."
+    true_counts = pd.Series(skewed_ids).value_counts()
+    for value, estimate in top.items():
+        assert estimate >= true_counts[value]
+        assert estimate - sketch.errors[value] <= true_counts[value]
+        assert estimate - true_counts[value] <= len(skewed_ids) / 100
+
+def test_topk_sketch_merge_and_mode(skewed_ids):
+    """Test merging sketches and the approximate mode of calculate_mode."""
+    left = TopKSketch(capacity=50).update(skewed_ids[:30_000])
+    right = TopKSketch(capacity=50).update(skewed_ids[30_000:])
+    assert left.merge(right).mode() == 7
+    assert TopKSketch().mode() is None
+
+    df = pd.DataFrame({"ids": skewed_ids})
+    assert calculate_mode(df, "ids", approximate=True, capacity=50) == calculate_mode(df, "ids")
+    with pytest.raises(ValueError):
+        TopKSketch(capacity=0)
+
+def test_calculate_mode_approximate_bounded_memory():
+    """Test that the approximate mode counts high-cardinality columns in bounded memory."""
+    rng = np.random.default_rng(5)
+    values = np.concatenate([np.repeat(42, 50_000), rng.integers(0, 10**9, 4_000_000)])
+    rng.shuffle(values)
+    df = pd.DataFrame({"ids": values})
+
+    tracemalloc.start()
+    try:
+        mode = calculate_mode(df, "ids", approximate=True, capacity=100)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert mode == 42
+    assert peak < values.nbytes / 4, "Le sketch ne doit pas compter toutes les valeurs distinctes à la fois."
+
+def test_bar_chart_top_k(skewed_ids):
+    """Test that bar_chart reuses the sketch for its top-k bars."""
+    df = pd.DataFrame({"ids": skewed_ids})
+    chart = bar_chart(df, "ids", top_k=3)
+    assert len(chart.axes[0].patches) == 3
+
+    sketch = TopKSketch(capacity=20).update(pd.Series(["a", "b", "a", "c"], dtype="category"))
+    chart = bar_chart(None, "label", sketch=sketch, top_k=2)
+    assert [tick.get_text() for tick in chart.axes[0].get_xticklabels()] == ["a", "b"]
@@ -0,0 +1,156 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.stats import ttest_ind
+from datalib.statslib.statistical_tests import t_test, t_test_from_summary, batch_t_test, fdr_correction
+from datalib.statslib.statistical_tests import chi_square_test, batch_chi_square_test
+
+@pytest.fixture
+def sample_experiment():
+    """Fixture for an A/B experiment with unequal groups, segments and missing values."""
+    rng = np.random.default_rng(0)
+    n = 2000
+    data = pd.DataFrame({
+        "variant": rng.choice(["A", "B"], n, p=[0.3, 0.7]),
+        "country": rng.choice(["fr", "de", "es"], n),
+    })
+    for i in range(20):
+        data[f"metric_{i}"] = rng.normal(0, 1 + i % 3, n) + (data["variant"] == "B") * (0.3 if i < 5 else 0.0)
+    data.loc[rng.choice(n, 50, replace=False), "metric_3"] = np.nan
+    return data
+
+def test_t_test_unequal_sizes():
+    """Test that independent groups of different sizes are accepted."""
+    group1 = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0])
+    group2 = pd.Series([2.0, 4.0, 6.0])
+    result = t_test(group1, group2, equal_var=False)
+    expected = ttest_ind(group1, group2, equal_var=False)
+    assert result["statistic"] == pytest.approx(expected.statistic)
+    assert result["p_value"] == pytest.approx(expected.pvalue)
+
+@pytest.mark.parametrize("equal_var", [True, False])
+def test_batch_t_test_matches_scipy(sample_experiment, equal_var):
+    """Test that the batched tests agree with scipy on every metric."""
+    result = batch_t_test(sample_experiment, "variant", by=None, equal_var=equal_var)
+    metrics = [f"metric_{i}" for i in range(20)]
+    assert list(result.index) == metrics
+    for metric in metrics:
+        a = sample_experiment.loc[sample_experiment["variant"] == "A", metric].dropna()
+        b = sample_experiment.loc[sample_experiment["variant"] == "B", metric].dropna()
+        expected = ttest_ind(a, b, equal_var=equal_var)
+        assert result.loc[metric, "n1"] == len(a) and result.loc[metric, "n2"] == len(b)
+        assert result.loc[metric, "statistic"] == pytest.approx(expected.statistic, rel=1e-9)
+        assert result.loc[metric, "p_value"] == pytest.approx(expected.pvalue, rel=1e-7, abs=1e-300)
+
+def test_batch_t_test_segments_and_fdr(sample_experiment):
+    """Test per-segment tests and the Benjamini-Hochberg correction over the whole grid."""
+    result = batch_t_test(sample_experiment, "variant", metrics=["metric_0", "metric_9"],
+                          groups=["B", "A"], by="country", fdr="bh")
+    assert result.index.names == ["country", "metric"]
+    assert len(result) == 6
+
+    segment = sample_experiment[sample_experiment["country"] == "fr"]
+    expected = ttest_ind(segment.loc[segment["variant"] == "B", "metric_9"],
+                         segment.loc[segment["variant"] == "A", "metric_9"], equal_var=False)
+    assert result.loc[("fr", "metric_9"), "statistic"] == pytest.approx(expected.statistic, rel=1e-9)
+    assert (result["p_adjusted"] >= result["p_value"]).all()
+    np.testing.assert_allclose(result["p_adjusted"], fdr_correction(result["p_value"]))
+
+def test_t_test_from_summary():
+    """Test tests computed from pre-aggregated summaries, including degenerate cells."""
+    rng = np.random.default_rng(1)
+    a, b = rng.normal(size=40), rng.normal(0.5, 2, size=25)
+    result = t_test_from_summary([len(a), 1], [a.mean(), 0.0], [a.var(ddof=1), 0.0],
+                                 [len(b), 10], [b.mean(), 1.0], [b.var(ddof=1), 1.0])
+    expected = ttest_ind(a, b, equal_var=False)
+    assert result["statistic"][0] == pytest.approx(expected.statistic)
+    assert result["p_value"][0] == pytest.approx(expected.pvalue)
+    assert np.isnan(result["statistic"][1]) and np.isnan(result["p_value"][1])
+
+def test_fdr_correction():
+    """Test Benjamini-Hochberg and Benjamini-Yekutieli adjustments on known values."""
+    p_values = np.array([0.01, 0.04, np.nan, 0.03, 0.5])
+    np.testing.assert_allclose(fdr_correction(p_values), [0.04, 0.04 * 4 / 3, np.nan, 0.04 * 4 / 3, 0.5])
+    by = fdr_correction(p_values, method="by")
+    np.testing.assert_allclose(by[0], min(1.0, 0.04 * (1 + 1 / 2 + 1 / 3 + 1 / 4)))
+    with pytest.raises(ValueError):
+        fdr_correction(p_values, method="bonferroni")
+
+def test_batch_t_test_errors(sample_experiment):
+    """Test error handling of batch_t_test."""
+    with pytest.raises(KeyError):
+        batch_t_test(sample_experiment, "missing")
+    with pytest.raises(ValueError):
+        batch_t_test(sample_experiment, "country")
+    with pytest.raises(ValueError):
+        batch_t_test(sample_experiment, "variant", metrics=["country"])
+
+@pytest.fixture
+def sample_categorical_data():
+    """Fixture for categorical columns with many levels and missing values."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    city = rng.choice([f"c{i}" for i in range(40)], n)
+    data = pd.DataFrame({
+        "city": city,
+        "segment": np.where(rng.random(n) < 0.5, "x", rng.choice(["y", "z"], n)),
+        "dependent": pd.Series(city).str[:2].to_numpy(),
+        "flag": rng.choice(["yes", "no"], n),
+        "other_flag": rng.choice(["on", "off"], n),
+        "amount": rng.normal(size=n),
+    })
+    data.loc[rng.choice(n, 100, replace=False), "segment"] = None
+    return data
+
+def test_chi_square_test_sparse_matches_dense(sample_categorical_data):
+    """Test that the sparse engine matches the dense crosstab computation."""
+    from scipy.stats import chi2_contingency
+    table = pd.crosstab(sample_categorical_data["city"], sample_categorical_data["segment"])
+    chi2, p, dof, expected = chi2_contingency(table)
+
+    dense = chi_square_test(sample_categorical_data, "city", "segment", sparse_table=False)
+    result = chi_square_test(sample_categorical_data, "city", "segment")
+    for values in (dense, result):
+        assert values["chi2"] == pytest.approx(chi2, rel=1e-10)
+        assert values["p_value"] == pytest.approx(p, rel=1e-8)
+        assert values["dof"] == dof
+    np.testing.assert_allclose(dense["expected"], expected)
+    np.testing.assert_array_equal(result["observed"].toarray(), table.to_numpy())
+    observed_cells = result["observed"].toarray() > 0
+    np.testing.assert_allclose(result["expected"].toarray()[observed_cells], expected[observed_cells])
+    assert list(result["rows"]) == list(table.index)
+
+def test_chi_square_test_many_levels_stays_sparse():
+    """Test that by default two columns with many levels never get a dense table."""
+    rng = np.random.default_rng(0)
+    n = 50_000
+    data = pd.DataFrame({"a": rng.integers(0, n, n).astype(str), "b": rng.integers(0, n, n).astype(str)})
+    result = chi_square_test(data, "a", "b")
+    assert sparse.issparse(result["expected"]) and sparse.issparse(result["observed"])
+    assert result["observed"].shape[0] > 30_000 and result["observed"].nnz <= n
+    assert result["dof"] == (result["observed"].shape[0] - 1) * (result["observed"].shape[1] - 1)
+
+def test_batch_chi_square_test(sample_categorical_data):
+    """Test the batched mode against chi_square_test, including the 2x2 Yates case."""
+    result = batch_chi_square_test(sample_categorical_data, "flag", fdr="bh", n_jobs=2)
+    assert list(result.index) == ["city", "segment", "dependent", "other_flag"]
+    for candidate in result.index:
+        expected = chi_square_test(sample_categorical_data, "flag", candidate)
+        assert result.loc[candidate, "chi2"] == pytest.approx(expected["chi2"], rel=1e-10)
+        assert result.loc[candidate, "p_value"] == pytest.approx(expected["p_value"], rel=1e-8)
+        assert result.loc[candidate, "dof"] == expected["dof"]
+    assert result.loc["segment", "n"] == 4900
+    assert (result["p_adjusted"] >= result["p_value"]).all()
+
+    dependent = batch_chi_square_test(sample_categorical_data, "city", ["dependent"])
+    assert dependent.loc["dependent", "p_value"] < 1e-100
+
+    with pytest.raises(ValueError):
+        batch_chi_square_test(sample_categorical_data, "flag", ["amount"])
+    with pytest.raises(KeyError):
+        batch_chi_square_test(sample_categorical_data, "flag", ["missing"])
@@ -0,0 +1,151 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.statslib.basic_stats import calculate_mean, calculate_mode, calculate_std, calculate_correlation
+from datalib.statslib.statistical_tests import t_test
+from datalib.statslib.stats_cache import StatsCache, enable_stats_cache, disable_stats_cache, get_stats_cache
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a numeric dataframe."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"x": rng.normal(size=500), "y": rng.normal(size=500)})
+
+@pytest.fixture
+def cache():
+    """Fixture enabling the stats cache for the duration of a test."""
+    cache = enable_stats_cache(maxsize=8)
+    try:
+        yield cache
+    finally:
+        disable_stats_cache()
+
+@pytest.fixture
+def content_cache():
+    """Fixture enabling the stats cache with content hashing for the duration of a test."""
+    cache = enable_stats_cache(hash_content=True)
+    try:
+        yield cache
+    finally:
+        disable_stats_cache()
+
+def test_cache_disabled_by_default(sample_dataframe):
+    """Test that no cache is active unless enabled."""
+    assert get_stats_cache() is None
+    assert calculate_mean(sample_dataframe, "x") == sample_dataframe["x"].mean()
+
+def test_cache_hit_on_repeated_call(sample_dataframe, cache):
+    """Test that a repeated call is served from the cache."""
+    first = calculate_std(sample_dataframe, "x")
+    second = calculate_std(sample_dataframe, "x")
+    assert first == second == sample_dataframe["x"].std()
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+
+    calculate_std(sample_dataframe, "y")
+    calculate_correlation(sample_dataframe, "x", "y")
+    calculate_correlation(sample_dataframe, "x", "y")
+    assert cache.info()["hits"] == 2
+
+def test_cache_miss_after_modification(sample_dataframe, cache):
+    """Test that replaced columns miss and in-place changes miss after invalidate."""
+    calculate_mean(sample_dataframe, "x")
+    sample_dataframe.loc[0, "x"] = 1000.0
+    cache.invalidate(sample_dataframe)
+    assert calculate_mean(sample_dataframe, "x") == sample_dataframe["x"].mean()
+
+    other = sample_dataframe.copy()
+    other["x"] = other["x"] + 1
+    assert calculate_mean(other, "x") == pytest.approx(sample_dataframe["x"].mean() + 1)
+
+def test_cache_detects_unsampled_in_place_change(content_cache):
+    """Test that with hash_content an in-place change anywhere in a large column is never served stale."""
+    df = pd.DataFrame({"x": np.arange(100_000, dtype=np.float64)})
+    assert calculate_mean(df, "x") == 49999.5
+    df.loc[5, "x"] = 1e9
+    assert calculate_mean(df, "x") == df["x"].mean()
+
+    text = pd.DataFrame({"label": ["a", "b"] * 50_000})
+    text["label"] = text["label"].astype("category")
+    first = calculate_mode(text, "label")
+    text.loc[[1, 3, 5], "label"] = "a"
+    assert calculate_mode(text, "label") == first == "a"
+    assert content_cache.info()["hits"] == 0
+
+def test_cache_hit_does_not_read_values(cache, monkeypatch):
+    """Test that by default a hit is keyed on identity, without hashing the column."""
+    from datalib.statslib import stats_cache
+
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.float64), "label": ["a", "b"] * 500})
+    monkeypatch.setattr(stats_cache, "_hash_values", None)
+    calculate_mean(df, "x")
+    calculate_mean(df, "x")
+    calculate_mode(df, "label")
+    calculate_mode(df, "label")
+    assert cache.info()["hits"] == 2
+    # Une vue décalée n'a pas la même identité que la colonne entière.
+    assert calculate_mean(df.iloc[1:], "x") == df["x"].iloc[1:].mean()
+
+def test_cache_forgets_released_data(cache):
+    """Test that results computed on released data are dropped from the cache."""
+    df = pd.DataFrame({"x": np.arange(1000, dtype=np.float64)})
+    calculate_mean(df, "x")
+    assert cache.info()["size"] == 1
+    del df
+    assert cache.info()["size"] == 0
+
+def test_cache_invalidate(sample_dataframe, cache):
+    """Test explicit invalidation for one dataframe and for the whole cache."""
+    other = sample_dataframe + 1
+    calculate_mean(sample_dataframe, "x")
+    calculate_mean(other, "y")
+    cache.invalidate(sample_dataframe)
+    assert cache.info()["size"] == 1
+    cache.invalidate()
+    assert cache.info()["size"] == 0
+
+def test_cache_lru_eviction(sample_dataframe, cache):
+    """Test that the least recently used results are evicted beyond maxsize."""
+    frames = [sample_dataframe + i for i in range(10)]
+    for frame in frames:
+        calculate_mean(frame, "x")
+    assert cache.info()["size"] == 8
+    calculate_mean(frames[0], "x")
+    assert cache.info()["hits"] == 0
+
+def test_cache_returns_copies_of_dicts(cache):
+    """Test that cached t-test results cannot be corrupted by the caller."""
+    group1 = pd.Series([1.0, 2.0, 3.0, 4.0])
+    group2 = pd.Series([2.0, 3.0, 4.0, 5.0])
+    result = t_test(group1, group2)
+    result["p_value"] = None
+    assert t_test(group1, group2)["p_value"] is not None
+    assert cache.info()["hits"] == 1
+
+def test_cache_errors_not_cached(sample_dataframe, cache):
+    """Test that errors are raised on every call and never cached."""
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            calculate_mean(sample_dataframe, "missing")
+    assert cache.info()["size"] == 0
+
+def test_cache_invalid_maxsize():
+    """Test that an invalid maxsize raises ValueError."""
+    with pytest.raises(ValueError):
+        StatsCache(0)
+
+def test_cache_works_without_usedforsecurity(sample_dataframe, content_cache, monkeypatch):
+    """Test that content hashing still hits where hashlib.sha1 has no 'usedforsecurity' (Python < 3.9)."""
+    import hashlib
+    from datalib.statslib import stats_cache
+
+    sha1 = hashlib.sha1
+    monkeypatch.setattr(stats_cache.sys, "version_info", (3, 8, 0))
+    monkeypatch.setattr(stats_cache.hashlib, "sha1", lambda *args: sha1(*args))
+    calculate_mean(sample_dataframe, "x")
+    calculate_mean(sample_dataframe, "x")
+    assert content_cache.info()["hits"] == 1
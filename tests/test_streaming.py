@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.statslib.basic_stats import calculate_mean, calculate_std
+from datalib.statslib.streaming import StreamingStats, stream_stats
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture for a dataframe with a missing value and a constant column."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(100, 15, 1000)
+    values[10] = np.nan
+    return pd.DataFrame({"values": values, "constant": [3.3] * 1000, "label": ["a"] * 1000})
+
+def test_streaming_stats_matches_basic_stats(sample_dataframe):
+    """Test that chunked accumulation matches calculate_mean and calculate_std."""
+    stats = StreamingStats()
+    for start in range(0, 1000, 128):
+        stats.update(sample_dataframe["values"].iloc[start:start + 128])
+
+    assert stats.count == 999
+    assert stats.mean == pytest.approx(calculate_mean(sample_dataframe, "values"), rel=1e-12)
+    assert stats.std() == pytest.approx(calculate_std(sample_dataframe, "values"), rel=1e-12)
+    assert stats.min == sample_dataframe["values"].min()
+    assert stats.max == sample_dataframe["values"].max()
+
+def test_streaming_stats_merge(sample_dataframe):
+    """Test that accumulators from separate workers merge into the global result."""
+    values = sample_dataframe["values"]
+    left = StreamingStats().update(values.iloc[:300])
+    right = StreamingStats.from_dict(StreamingStats().update(values.iloc[300:]).to_dict())
+    merged = left.merge(right)
+    assert merged.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert merged.variance() == pytest.approx(values.var(), rel=1e-12)
+
+    assert StreamingStats().merge(merged).count == merged.count
+    assert merged.merge(StreamingStats()).count == 999
+
+def test_streaming_stats_edge_cases(sample_dataframe):
+    """Test empty, single-value and constant inputs."""
+    empty = StreamingStats().update([])
+    assert empty.count == 0 and np.isnan(empty.mean)
+    assert empty.std() == 0.0
+    assert StreamingStats().update([5]).std() == calculate_std(pd.DataFrame({"v": [5]}), "v")
+
+    constant = stream_stats(sample_dataframe)["constant"]
+    assert constant.std() == 0.0
+
+    with pytest.raises(ValueError):
+        StreamingStats().update(["a", "b"])
+
+def test_stream_stats_chunks(sample_dataframe):
+    """Test one pass over several columns of a chunk stream."""
+    chunks = (sample_dataframe.iloc[i:i + 100] for i in range(0, 1000, 100))
+    result = stream_stats(chunks)
+    assert sorted(result) == ["constant", "values"], "Seules les colonnes numériques sont traitées par défaut."
+    assert result["values"].mean == pytest.approx(calculate_mean(sample_dataframe, "values"), rel=1e-12)
+
+    with pytest.raises(KeyError):
+        stream_stats(sample_dataframe, columns=["missing"])
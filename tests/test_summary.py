@@ -0,0 +1,129 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import numpy as np
+import pandas as pd
+from datalib.preprocessing.csv_handler import save_csv, filter_data
+from datalib.preprocessing.summary import FileSummary, build_summary, load_summary
+from datalib.statslib.basic_stats import calculate_mean, calculate_std
+
+@pytest.fixture
+def sample_history():
+    """Fixture for a time-ordered history with missing values and text columns."""
+    rng = np.random.default_rng(0)
+    n = 1050
+    data = pd.DataFrame({
+        "day": np.arange(n) // 10,
+        "amount": rng.normal(100, 20, n).round(2),
+        "city": rng.choice(["Paris", "Lyon", "Nice"], n),
+    })
+    data.loc[rng.choice(n, 30, replace=False), "amount"] = np.nan
+    return data
+
+def test_summary_answers_stats_without_reading(tmp_path, sample_history):
+    """Test that summaries reproduce calculate_mean and calculate_std."""
+    file_path = tmp_path / "history.csv"
+    save_csv(sample_history, file_path, summary=True, chunksize=100)
+    summary = load_summary(file_path)
+
+    assert isinstance(summary, FileSummary)
+    assert len(summary.chunks) == 11 and summary.rows == 1050
+    assert summary.mean("amount") == pytest.approx(calculate_mean(sample_history, "amount"), rel=1e-12)
+    assert summary.std("amount") == pytest.approx(calculate_std(sample_history, "amount"), rel=1e-10)
+    assert summary.null_count("amount") == 30
+    assert summary.distinct_count("city") == 3
+    assert summary.distinct_count("day") == pytest.approx(105, rel=0.3)
+    with pytest.raises(ValueError):
+        summary.mean("city")
+    with pytest.raises(KeyError):
+        summary.mean("missing")
+
+def test_filter_data_skips_chunks(tmp_path, sample_history, monkeypatch):
+    """Test that filtering a summary only reads chunks whose min/max may match."""
+    file_path = tmp_path / "history.csv"
+    save_csv(sample_history, file_path)
+    summary = build_summary(file_path, chunksize=100)
+
+    assert summary.matching_chunks("day", 42) == [4]
+    assert summary.matching_chunks("day", slice(95, 200)) == [9, 10]
+    assert summary.matching_chunks("day", [3, 57]) == [0, 5]
+    assert summary.matching_chunks("day", 500) == []
+
+    result = filter_data(summary, "day", slice(95, 200))
+    expected = filter_data(sample_history, "day", slice(95, 200)).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert filter_data(summary, "city", "Lyon").shape[0] == (sample_history["city"] == "Lyon").sum()
+    assert filter_data(summary, "day", 500).empty
+
+def test_filter_data_with_missing_bounds(tmp_path):
+    """Test that chunks without min/max and None values are kept instead of raising."""
+    data = pd.DataFrame({"day": np.arange(300), "amount": np.arange(300, dtype=float)})
+    data.loc[100:199, "amount"] = np.nan
+    file_path = tmp_path / "gaps.csv"
+    save_csv(data, file_path)
+    summary = build_summary(file_path, chunksize=100)
+
+    assert summary.matching_chunks("amount", 250.0) == [1, 2]
+    assert summary.matching_chunks("amount", slice(None, 50)) == [0, 1]
+    assert summary.matching_chunks("amount", None) == [0, 1, 2]
+    assert filter_data(summary, "amount", None).empty
+    pd.testing.assert_frame_equal(filter_data(summary, "amount", 250.0),
+                                  data[data["amount"] == 250.0].reset_index(drop=True))
+
+def test_summary_appends_only_new_chunks(tmp_path, sample_history):
+    """Test that appending rows only summarizes the new data."""
+    file_path = tmp_path / "history.csv"
+    save_csv(sample_history.iloc[:1000], file_path)
+    first = build_summary(file_path, chunksize=100)
+    assert len(first.chunks) == 10
+
+    sample_history.iloc[1000:].to_csv(file_path, mode="a", header=False, index=False)
+    updated = build_summary(file_path, chunksize=100)
+    assert updated.chunks[:10] == first.chunks
+    assert len(updated.chunks) == 11 and updated.rows == 1050
+    assert updated.mean("amount") == pytest.approx(calculate_mean(sample_history, "amount"), rel=1e-12)
+
+    # Une modification de même longueur au début du fichier, suivie d'un ajout, est détectée.
+    content = file_path.read_bytes()
+    edited = content.replace(b"\n0,", b"\n9,", 1)
+    assert len(edited) == len(content) and edited != content
+    file_path.write_bytes(edited + b"105,1.0,Paris\n")
+    updated = build_summary(file_path, chunksize=100)
+    assert updated.rows == 1051
+    assert updated.mean("day") == pytest.approx(pd.read_csv(file_path)["day"].mean(), rel=1e-12)
+
+    # Une modification de la zone déjà résumée entraîne une reconstruction complète.
+    save_csv(sample_history.iloc[:500], file_path)
+    rebuilt = build_summary(file_path, chunksize=100)
+    assert rebuilt.rows == 500
+
+def test_summary_errors(tmp_path, sample_history):
+    """Test error handling for compressed files and missing summaries."""
+    with pytest.raises(ValueError):
+        save_csv(sample_history, tmp_path / "history.csv.gz", summary=True)
+    with pytest.raises(FileNotFoundError):
+        load_summary(tmp_path / "none.csv")
+
+def test_summary_detects_stale_file(tmp_path, sample_history):
+    """Test that a summary is rejected or rebuilt once its file has changed."""
+    file_path = tmp_path / "history.csv"
+    save_csv(sample_history.iloc[:500], file_path, summary=True, chunksize=100)
+    summary = load_summary(file_path)
+    assert summary.is_current()
+
+    save_csv(sample_history, file_path)
+    assert not summary.is_current()
+    with pytest.raises(ValueError):
+        filter_data(summary, "day", 42)
+    with pytest.raises(ValueError):
+        load_summary(file_path)
+    rebuilt = load_summary(file_path, rebuild=True)
+    assert rebuilt.rows == 1050 and rebuilt.chunksize == 100
+    assert load_summary(file_path).is_current()
+
+    # Même taille mais date de modification différente : le résumé est aussi refusé.
+    os.utime(file_path, ns=(0, 0))
+    with pytest.raises(ValueError):
+        load_summary(file_path)
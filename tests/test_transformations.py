@@ -4,7 +4,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 import pytest
 import pandas as pd
-from datalib.preprocessing.transformations import normalize_data, handle_missing_values
+from datalib.preprocessing.transformations import normalize_data, handle_missing_values, optimize_dtypes
 
 @pytest.fixture
 def sample_normalize_data():
@@ -54,7 +54,8 @@ def test_handle_missing_values_with_invalid_strategy(sample_missing_values_data)
     try:
         handle_missing_values(sample_missing_values_data, strategy="invalid")
     except ValueError as e:
-        assert str(e) == "Stratégie non supportée : choisissez parmi 'mean', 'median', ou 'drop'.", f"Unexpected error message: {e}"
+        expected = "Stratégie non supportée : choisissez parmi ['mean', 'median', 'constant', 'ffill', 'interpolate', 'knn', 'drop']."
+        assert str(e) == expected, f"Unexpected error message: {e}"
 
 def test_normalize_data_with_non_numeric_column():
     """Test normalize_data with a non-numeric column."""
@@ -63,3 +64,89 @@ def test_normalize_data_with_non_numeric_column():
         normalize_data(df, "non_numeric")
     except ValueError as e:
         assert str(e) == "Les colonnes suivantes ne sont pas numériques : ['non_numeric']", f"Unexpected error message: {e}"
+
+def test_optimize_dtypes():
+    """Test the optimize_dtypes function."""
+    df = pd.DataFrame({
+        "small_int": [1, 2, 3, 4] * 25,
+        "big_int": [1, 2, 3, 10**10] * 25,
+        "exact_float": [0.5, 1.5, 2.0, None] * 25,
+        "precise_float": [0.1, 0.2, 0.3, 0.4] * 25,
+        "label": ["a", "b", "a", "c"] * 25,
+        "unique": [f"id{i}" for i in range(100)],
+    })
+    optimized, saved = optimize_dtypes(df)
+
+    assert optimized["small_int"].dtype == "int8"
+    assert optimized["big_int"].dtype == "int64"
+    assert optimized["exact_float"].dtype == "float32"
+    assert optimized["precise_float"].dtype == "float64", "Un float64 non représentable ne doit pas être réduit."
+    assert optimized["label"].dtype == "category"
+    assert optimized["unique"].dtype != "category"
+    assert saved > 0, "L'optimisation doit économiser de la mémoire."
+    assert df["small_int"].dtype == "int64", "Le DataFrame d'origine ne doit pas être modifié."
+    pd.testing.assert_frame_equal(optimized.astype(df.dtypes.to_dict()), df)
+
+    with pytest.raises(ValueError):
+        optimize_dtypes(df, category_threshold=2)
+
+def test_optimized_frame_downstream(tmp_path):
+    """Test that optimized frames keep working with filter_data, chi_square_test and bar_chart."""
+    from datalib.preprocessing.csv_handler import load_csv, filter_data
+    from datalib.statslib.statistical_tests import chi_square_test
+    from datalib.visualization.charts import bar_chart
+
+    file_path = tmp_path / "data.csv"
+    pd.DataFrame({
+        "city": ["Paris", "Tunis", "Lyon", "Paris"] * 25,
+        "segment": ["x", "y"] * 50,
+        "amount": range(100),
+    }).to_csv(file_path, index=False)
+
+    df = load_csv(file_path, optimize_dtypes=True)
+    assert df["city"].dtype == "category"
+    assert df.attrs["bytes_saved"] > 0
+
+    filtered = filter_data(df, "city", "Paris")
+    assert len(filtered) == 50
+    result = chi_square_test(df, "city", "segment")
+    assert result["dof"] == 2, "Le test du chi-carré doit fonctionner sur des colonnes catégorielles."
+
+    chart = bar_chart(filter_data(df, "city", "Tunis"), "city")
+    assert len(chart.axes[0].patches) == 1, "Les catégories absentes ne doivent pas être affichées."
+
+def test_handle_missing_values_per_column():
+    """Test handle_missing_values with a per-column strategy map and missing counts."""
+    df = pd.DataFrame({"a": [1.0, None, 3.0, None, 5.0], "b": [1, 2, 3, 4, 5],
+                       "c": ["x", None, "y", "z", "w"], "d": [None, 1.0, 2.0, 3.0, None]})
+    handled_df, counts = handle_missing_values(df, {"a": "interpolate", "b": "mean", "c": "constant", "d": "ffill"},
+                                               fill_value="?", return_counts=True)
+
+    assert counts == {"a": 2, "b": 0, "c": 1, "d": 2}
+    assert handled_df["a"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert handled_df["c"].tolist() == ["x", "?", "y", "z", "w"]
+    assert handled_df["d"].tolist()[1:] == [1.0, 2.0, 3.0, 3.0] and pd.isna(handled_df.loc[0, "d"])
+    # Les colonnes sans valeur manquante sont partagées, et l'original n'est pas modifié.
+    assert handled_df["b"].dtype == df["b"].dtype
+    assert df["a"].isna().sum() == 2
+
+def test_handle_missing_values_inplace_and_knn():
+    """Test the in-place mode and the kNN strategy."""
+    df = pd.DataFrame({"x": [0.0, 0.1, 10.0, 10.1, 0.05, 10.05],
+                       "y": [1.0, 1.0, 50.0, 50.0, None, None],
+                       "z": [1.0, None, 1.0, 1.0, 1.0, 1.0]})
+    result = handle_missing_values(df, {"y": "knn", "z": "drop"}, n_neighbors=1, inplace=True)
+
+    assert result is df
+    assert df.index.tolist() == [0, 2, 3, 4, 5]
+    assert df.loc[4, "y"] == pytest.approx(1.0)
+    assert df.loc[5, "y"] == pytest.approx(50.0)
+
+def test_handle_missing_values_errors(sample_missing_values_data):
+    """Test handle_missing_values with invalid columns or parameters."""
+    with pytest.raises(KeyError):
+        handle_missing_values(sample_missing_values_data, {"unknown": "mean"})
+    with pytest.raises(ValueError):
+        handle_missing_values(sample_missing_values_data, "constant")
+    with pytest.raises(ValueError):
+        handle_missing_values(pd.DataFrame({"text": ["a", None]}), {"text": "median"})